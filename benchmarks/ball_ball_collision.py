@@ -0,0 +1,104 @@
+"""
+Benchmark for the ball-to-ball broad phase.
+
+Run from the project root:
+    SDL_VIDEODRIVER=dummy python -m benchmarks.ball_ball_collision
+
+Balls are scattered at a constant density (the field grows with the ball
+count), so a broad phase that only checks nearby pairs should keep the cost
+per ball flat while the all-pairs reference grows linearly per ball.
+"""
+import math
+import os
+import random
+import time
+from typing import List
+import pygame as pg
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+BALL_COUNTS: List[int] = [10, 100, 500, 1000, 2000]
+BALLS_PER_SCREEN: int = 100  # Density: balls per 800x600 area
+REPEATS: int = 5
+
+
+def scatter_balls(balls: list, seed: int) -> None:
+    """
+    Places balls uniformly at random on a field sized for a constant density.
+
+    Args:
+        balls (list): The balls to place.
+        seed (int): Seed for the layout so every run sees the same positions.
+    """
+    rng = random.Random(seed)
+    scale: float = math.sqrt(len(balls) / BALLS_PER_SCREEN)
+    width, height = 800 * scale, 600 * scale
+    for ball in balls:
+        ball.attached_to_paddle = False
+        ball.position = pg.math.Vector2(rng.uniform(0, width), rng.uniform(0, height))
+        ball.rect.center = ball.position
+        ball.velocity = pg.math.Vector2(2, 0).rotate(rng.uniform(0, 360))
+
+
+def all_pairs_contacts(balls: list, radius: int) -> int:
+    """
+    The previous nested-loop check, kept as a reference point.
+
+    Args:
+        balls (list): The balls to check.
+        radius (int): The ball radius.
+
+    Returns:
+        int: The number of touching pairs.
+    """
+    contacts: int = 0
+    for i in range(len(balls)):
+        for j in range(i + 1, len(balls)):
+            dx = balls[j].position.x - balls[i].position.x
+            dy = balls[j].position.y - balls[i].position.y
+            if 0 < math.sqrt(dx * dx + dy * dy) < radius * 2:
+                contacts += 1
+    return contacts
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints time per step and per ball for each ball count.
+    """
+    pg.init()
+    pg.display.set_mode((1, 1))
+    from objects.ball import Ball
+    from objects.paddle import Paddle
+    from levels.level import Level
+    from managers.collision import Collision
+
+    class Counter:
+        score: int = 0
+        lives: int = 3
+
+    paddle = Paddle()
+    level = Level(0)
+    print(f"{'balls':>6} {'grid ms/step':>13} {'grid us/ball':>13} {'all-pairs ms/step':>18}")
+    for count in BALL_COUNTS:
+        balls = [Ball(paddle) for _ in range(count)]
+        collision = Collision(balls, paddle, level, Counter(), Counter(), pg.Surface((1, 1)), game_play=None)
+
+        grid_seconds: float = 0.0
+        for repeat in range(REPEATS):
+            scatter_balls(balls, repeat)
+            start = time.perf_counter()
+            collision.check_ball_ball_collision()
+            grid_seconds += time.perf_counter() - start
+        grid_ms: float = grid_seconds / REPEATS * 1000
+
+        scatter_balls(balls, 0)
+        start = time.perf_counter()
+        all_pairs_contacts(balls, collision.BALL_RADIUS)
+        all_pairs_ms: float = (time.perf_counter() - start) * 1000
+
+        print(f"{count:>6} {grid_ms:>13.3f} {grid_ms * 1000 / count:>13.2f} {all_pairs_ms:>18.3f}")
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark for MovingBrick neighbour checks on wide rows.
+
+Run from the project root:
+    SDL_VIDEODRIVER=dummy python -m benchmarks.moving_bricks
+
+Each row is filled to just under half of its cells (so nothing freezes) with
+moving bricks. The interval index finds a brick's neighbours with a binary
+search, while the row scan it replaced grows with the number of bricks.
+"""
+import os
+import random
+import time
+from typing import List
+import pygame as pg
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+SCREEN_WIDTHS: List[int] = [800, 3200, 12800, 51200]
+ROWS: int = 8
+STEPS: int = 20
+
+
+def fill_rows(level, seed: int) -> None:
+    """
+    Replaces the level's bricks with moving bricks at just under half density.
+
+    Args:
+        level (Level): The level to fill.
+        seed (int): Seed for the layout and directions.
+    """
+    rng = random.Random(seed)
+    level.clear_bricks()
+    per_row: int = level.max_bricks_x // 2
+    for row_index in range(ROWS):
+        for col_index in sorted(rng.sample(range(level.max_bricks_x), per_row)):
+            brick = level.create_moving_brick(col_index, row_index)
+            level.add_brick(brick, row_index)
+
+
+def row_scan_collides(brick, level) -> bool:
+    """
+    The previous moving-brick neighbour check, kept as a reference point.
+
+    Args:
+        brick (MovingBrick): The brick to check.
+        level (Level): Its level.
+
+    Returns:
+        bool: Whether the brick would hit a moving neighbour next step.
+    """
+    test_rect = brick.rect.move(brick.velocity, 0)
+    for other in level.moving_bricks:
+        if other is not brick and other.row_index == brick.row_index and test_rect.colliderect(other.rect):
+            return True
+    return False
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints time per moving brick for each screen width.
+    """
+    pg.init()
+    pg.display.set_mode((1, 1))
+    from settings import Settings
+    from levels.level import Level
+
+    settings = Settings()
+    original_width: int = settings.get("SCREEN_WIDTH")
+    print(f"{'width':>6} {'bricks':>7} {'index us/brick':>15} {'row scan us/brick':>18}")
+    for width in SCREEN_WIDTHS:
+        settings.settings["SCREEN_WIDTH"] = width
+        level = Level(0, seed=0)
+        fill_rows(level, 0)
+        bricks = list(level.moving_bricks)
+
+        start = time.perf_counter()
+        for _ in range(STEPS):
+            level.update()
+        index_us: float = (time.perf_counter() - start) / STEPS / len(bricks) * 1e6
+
+        scan_steps: int = max(1, STEPS // 10)
+        start = time.perf_counter()
+        for _ in range(scan_steps):
+            for brick in bricks:
+                row_scan_collides(brick, level)
+        scan_us: float = (time.perf_counter() - start) / scan_steps / len(bricks) * 1e6
+
+        print(f"{width:>6} {len(bricks):>7} {index_us:>15.2f} {scan_us:>18.2f}")
+    settings.settings["SCREEN_WIDTH"] = original_width
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+"""
+Micro-benchmark suite with JSON baselines.
+
+Run from the project root:
+    python -m benchmarks.suite run --save benchmarks/baseline.json
+    python -m benchmarks.suite compare benchmarks/baseline.json --threshold 0.15
+
+`run` times every case and prints (and optionally saves) the results.
+`compare` times the cases again, or reads a second results file, and flags
+cases slower than the baseline by more than the threshold; it exits with
+status 1 if any case regressed, so it can gate a build.
+
+Each case prepares fresh state before every repeat, outside the timed
+region, then calls the code under test `number` times. The best repeat is the
+headline figure since it is the least disturbed by other load on the machine.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import pygame as pg
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from benchmarks.ball_ball_collision import scatter_balls
+from benchmarks.moving_bricks import fill_rows
+
+REPEATS: int = 7
+DEFAULT_THRESHOLD: float = 0.15
+
+Prepare = Callable[[], Callable[[], Any]]  # Builds fresh state and returns the timed call
+
+
+class Counter:
+    """Stands in for the scoreboard and player lives."""
+    score: int = 0
+    lives: int = 3
+
+
+def simulation_settings(**overrides: Any) -> None:
+    """
+    Applies setting overrides in memory only.
+
+    Args:
+        **overrides (Any): Setting keys and values.
+    """
+    from settings import Settings
+    settings = Settings()
+    settings.persistent = False
+    with settings.lock:
+        settings.settings.update(overrides)
+
+
+def generate_brick_map(difficulty: float) -> Prepare:
+    """
+    Level.generate_brick_map at a difficulty.
+
+    Args:
+        difficulty (float): The difficulty from 0 to 10.
+
+    Returns:
+        Prepare: The case.
+    """
+    def prepare() -> Callable[[], Any]:
+        from levels.level import Level
+        simulation_settings(DIFFICULTY=difficulty)
+        return Level(0, seed=0).generate_brick_map
+    return prepare
+
+
+def generate_batch(seed_count: int) -> Prepare:
+    """
+    LevelGenerator.generate_batch over many seeds at a high difficulty.
+
+    Args:
+        seed_count (int): The number of maps generated per call.
+
+    Returns:
+        Prepare: The case.
+    """
+    def prepare() -> Callable[[], Any]:
+        from levels.level_generator import LevelGenerator
+        generator = LevelGenerator(8, 15)
+        seeds = list(range(seed_count))
+        return lambda: generator.generate_batch(seeds, 9.8)
+    return prepare
+
+
+def collision_update(ball_count: int) -> Prepare:
+    """
+    Collision.update with free balls spread over the lower half of the screen.
+
+    Args:
+        ball_count (int): The number of balls in play.
+
+    Returns:
+        Prepare: The case.
+    """
+    def prepare() -> Callable[[], Any]:
+        from objects.ball import Ball
+        from objects.paddle import Paddle
+        from levels.level import Level
+        from managers.collision import Collision
+        simulation_settings(DIFFICULTY=3)
+        rng = random.Random(ball_count)
+        paddle = Paddle()
+        level = Level(0, seed=0)
+        balls = [Ball(paddle) for _ in range(ball_count)]
+        for ball in balls:
+            ball.attached_to_paddle = False
+            ball.position = pg.math.Vector2(rng.uniform(30, 770), rng.uniform(320, 500))
+            ball.previous_position = ball.position.copy()
+            ball.rect.center = ball.position
+            ball.velocity = pg.math.Vector2(2, 0).rotate(rng.uniform(0, 360))
+        collision = Collision(balls, paddle, level, Counter(), Counter(), pg.Surface((1, 1)), None, rng=random.Random(0))
+        return collision.update
+    return prepare
+
+
+def ball_ball_collision(ball_count: int) -> Prepare:
+    """
+    Collision.check_ball_ball_collision at a constant ball density.
+
+    Args:
+        ball_count (int): The number of balls in play.
+
+    Returns:
+        Prepare: The case.
+    """
+    def prepare() -> Callable[[], Any]:
+        from objects.ball import Ball
+        from objects.paddle import Paddle
+        from levels.level import Level
+        from managers.collision import Collision
+        paddle = Paddle()
+        balls = [Ball(paddle) for _ in range(ball_count)]
+        scatter_balls(balls, 0)
+        collision = Collision(balls, paddle, Level(0, seed=0), Counter(), Counter(), pg.Surface((1, 1)), None)
+        return collision.check_ball_ball_collision
+    return prepare
+
+
+def moving_brick_rows(screen_width: int) -> Prepare:
+    """
+    Level.update (every MovingBrick.update) with rows just under half full of moving bricks.
+
+    Args:
+        screen_width (int): The screen width, which sets the number of bricks per row.
+
+    Returns:
+        Prepare: The case.
+    """
+    def prepare() -> Callable[[], Any]:
+        from levels.level import Level
+        simulation_settings(SCREEN_WIDTH=screen_width)
+        level = Level(0, seed=0)
+        fill_rows(level, 0)
+        return level.update
+    return prepare
+
+
+def level_complete() -> Prepare:
+    """
+    Level.is_level_complete on a full level.
+
+    Returns:
+        Prepare: The case.
+    """
+    def prepare() -> Callable[[], Any]:
+        from levels.level import Level
+        simulation_settings(DIFFICULTY=5)
+        return Level(0, seed=0).is_level_complete
+    return prepare
+
+
+CASES: List[Tuple[str, Prepare, int]] = [
+    *[(f"level.generate_brick_map[difficulty={difficulty}]", generate_brick_map(difficulty), 200) for difficulty in (1, 3, 5, 8, 10)],
+    ("level_generator.generate_batch[seeds=100]", generate_batch(100), 20),
+    *[(f"collision.update[balls={count}]", collision_update(count), max(1, 200 // count)) for count in (1, 10, 100, 1000)],
+    *[(f"collision.check_ball_ball_collision[balls={count}]", ball_ball_collision(count), max(1, 2000 // count)) for count in (10, 100, 1000)],
+    *[(f"moving_brick.update[width={width}]", moving_brick_rows(width), 20) for width in (800, 3200, 12800)],
+    ("level.is_level_complete", level_complete(), 100000),
+]
+
+
+def time_case(prepare: Prepare, number: int, repeats: int) -> Dict[str, Any]:
+    """
+    Times one case.
+
+    Args:
+        prepare (Prepare): Builds the state and returns the call to time.
+        number (int): Calls per repeat.
+        repeats (int): How many times to prepare and time the case.
+
+    Returns:
+        Dict[str, Any]: best_us and median_us per call, with number and repeats.
+    """
+    per_call: List[float] = []
+    for _ in range(repeats):
+        call = prepare()
+        start: float = time.perf_counter()
+        for _ in range(number):
+            call()
+        per_call.append((time.perf_counter() - start) / number * 1e6)
+    return {"best_us": min(per_call), "median_us": statistics.median(per_call), "number": number, "repeats": repeats}
+
+
+def run_suite(pattern: str = "", repeats: int = REPEATS) -> Dict[str, Any]:
+    """
+    Runs every case whose name contains a pattern.
+
+    Settings overridden by the cases are restored afterwards and never saved.
+
+    Args:
+        pattern (str): A substring of the case names to run; empty runs all.
+        repeats (int): Repeats per case.
+
+    Returns:
+        Dict[str, Any]: {"meta": {...}, "results": {name: timing}}.
+    """
+    from settings import Settings
+    settings = Settings()
+    saved: dict = dict(settings.settings)
+    persistent: bool = settings.persistent
+    results: Dict[str, Any] = {}
+    try:
+        for name, prepare, number in CASES:
+            if pattern in name:
+                results[name] = time_case(prepare, number, repeats)
+    finally:
+        with settings.lock:
+            settings.settings.clear()
+            settings.settings.update(saved)
+        settings.persistent = persistent
+    meta: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compares two result sets case by case on the best time.
+
+    Args:
+        baseline (Dict[str, Any]): The reference results.
+        current (Dict[str, Any]): The new results.
+        threshold (float): The relative slowdown tolerated before a case counts as regressed, e.g. 0.15.
+
+    Returns:
+        List[Dict[str, Any]]: For each case in both sets: name, baseline_us, current_us, change
+            (relative, positive is slower) and status ("regressed", "improved" or "ok").
+    """
+    rows: List[Dict[str, Any]] = []
+    for name, reference in baseline["results"].items():
+        result: Optional[Dict[str, Any]] = current["results"].get(name)
+        if result is None:
+            continue
+        change: float = result["best_us"] / reference["best_us"] - 1 if reference["best_us"] > 0 else 0.0
+        status: str = "regressed" if change > threshold else "improved" if change < -threshold else "ok"
+        rows.append({"name": name, "baseline_us": reference["best_us"], "current_us": result["best_us"],
+                     "change": change, "status": status})
+    return rows
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    """
+    Prints a results table.
+
+    Args:
+        results (Dict[str, Any]): The output of run_suite.
+    """
+    print(f"{'case':<48} {'best us':>12} {'median us':>12}")
+    for name, timing in results["results"].items():
+        print(f"{name:<48} {timing['best_us']:>12.2f} {timing['median_us']:>12.2f}")
+
+
+def load(path: str) -> Dict[str, Any]:
+    """
+    Reads a results file.
+
+    Args:
+        path (str): The JSON file.
+
+    Returns:
+        Dict[str, Any]: The results.
+    """
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def save(results: Dict[str, Any], path: str) -> None:
+    """
+    Writes a results file, creating its directory if needed.
+
+    Args:
+        results (Dict[str, Any]): The results.
+        path (str): The JSON file.
+    """
+    directory: str = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def main() -> None:
+    """
+    Parses the command line and runs or compares the suite.
+    """
+    parser = argparse.ArgumentParser(description="Brick Breaker micro-benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="time the cases")
+    run_parser.add_argument("--save", metavar="PATH", help="write the results to a JSON baseline")
+    compare_parser = commands.add_parser("compare", help="flag cases slower than a baseline")
+    compare_parser.add_argument("baseline", help="the baseline JSON file")
+    compare_parser.add_argument("current", nargs="?", help="a results JSON file to check instead of timing now")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="tolerated slowdown, e.g. 0.15 for 15%%")
+    for sub_parser in (run_parser, compare_parser):
+        sub_parser.add_argument("--filter", default="", help="only cases whose name contains this text")
+        sub_parser.add_argument("--repeats", type=int, default=REPEATS, help="repeats per case")
+    args = parser.parse_args()
+
+    pg.init()
+    pg.display.set_mode((1, 1))
+    if args.command == "run":
+        results = run_suite(args.filter, args.repeats)
+        print_results(results)
+        if args.save:
+            save(results, args.save)
+        pg.quit()
+        return
+
+    baseline = load(args.baseline)
+    current = load(args.current) if args.current else run_suite(args.filter, args.repeats)
+    pg.quit()
+    rows = compare(baseline, current, args.threshold)
+    print(f"{'case':<48} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    for row in rows:
+        flag: str = "  REGRESSED" if row["status"] == "regressed" else ""
+        print(f"{row['name']:<48} {row['baseline_us']:>12.2f} {row['current_us']:>12.2f} {row['change']:>+8.1%}{flag}")
+    regressions: int = sum(1 for row in rows if row["status"] == "regressed")
+    print(f"{regressions} of {len(rows)} cases regressed beyond {args.threshold:.0%}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
+from typing import Optional
 from game.game_play import GamePlay
 from game.main_menu import MainMenu
 from game.settings_menu import SettingsMenu
 from game.game_over import GameOver
 from utils.background_music import BackgroundMusic
+from utils.simulation_clock import SimulationClock
+from settings import Settings
+from utils.frame_profiler import FrameProfiler
 
 class Game:
     """
@@ -11,9 +15,11 @@ class Game:
     Attributes:
     - screen: The game screen object.
     - player_score: The current score of the player.
+    - player_difficulty: The difficulty the last game started at, or None before the first game.
     - background_music: The background music object.
     - music_current_image: The current image of the background music.
     - current_state: The current state of the game (MainMenu, GamePlay, SettingsMenu, GameOver).
+    - simulation_clock: The fixed-timestep clock that drives physics steps.
     """
 
     def __init__(self, screen: object) -> None:
@@ -24,7 +30,10 @@ class Game:
         - screen: The game screen object.
         """
         self.screen = screen
+        self.settings: Settings = Settings()
         self.player_score: int = 0
+        self.player_difficulty: Optional[float] = None
+        self.simulation_clock: SimulationClock = SimulationClock(self.settings.get("PHYSICS_HZ"), self.settings.get("MAX_SUBSTEPS"))
         self.background_music: BackgroundMusic = BackgroundMusic()
         self.music_current_image: str = self.background_music.current_image
         self.current_state: object = MainMenu(self)
@@ -54,8 +63,23 @@ class Game:
         """
         self.current_state.update(events)
 
+    def fixed_update(self) -> None:
+        """
+        Advances the current state by one fixed simulation step.
+        """
+        self.current_state.fixed_update()
+
     def draw(self) -> None:
         """
-        Draws the game state.
+        Draws the game state, then the profiler overlay when it is shown.
         """
         self.current_state.draw()
+        profiler: FrameProfiler = FrameProfiler()
+        if profiler.overlay_visible:
+            self.current_state.mark_overlay(profiler.draw(self.screen))
+
+    def present(self) -> None:
+        """
+        Pushes the drawn frame to the display.
+        """
+        self.current_state.present()
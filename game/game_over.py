@@ -1,15 +1,15 @@
-import pygame as pg
 from game.game_state import GameState
 from ui.button import Button
 from ui.text_box import TextBox
 from utils.score_saver import ScoreSaver
 from settings import Settings
+from utils.typography import Typography
 
 class GameOver(GameState):
     def __init__(self, game) -> None:
         super().__init__(game)
         self.score: int = game.player_score
-        self.score_saver: ScoreSaver = ScoreSaver()
+        self.score_saver: ScoreSaver = ScoreSaver(game.player_difficulty)
         self.new_high_score: bool = self.score_saver.check_high_score(self.score)
         self.state: str = 'ENTER_NAME' if self.new_high_score else 'DISPLAY_SCORE'
         self.text_box: TextBox = TextBox(300, 200, 200, 50, self.submit_score, "Enter Name") if self.new_high_score else None
@@ -23,7 +23,6 @@ class GameOver(GameState):
         if self.new_high_score:
             name: str = self.text_box.text
             self.score_saver.add_score(name, self.score)
-            self.score_saver.save_scores()
             self.game.player_score = 0
         self.state = 'DISPLAY_SCORE'
 
@@ -42,7 +41,8 @@ class GameOver(GameState):
             self.submit_button.draw()
         elif self.state == 'DISPLAY_SCORE':
             display_scores = self.score_saver.score_display()
+            typography = Typography()
             for i, line in enumerate(display_scores):
-                score_text = pg.font.Font(None, 36).render(line, True, self.WHITE)
+                score_text = typography.render(line, 36, self.WHITE)
                 self.screen.blit(score_text, (50, 50 + i * 30))
             self.back_button.draw()
@@ -1,60 +1,112 @@
+import os
+import random
+import time
+import warnings
 import pygame as pg
+from typing import Dict, Optional, Tuple
 from settings import Settings
 from objects.paddle import Paddle
 from objects.ball import Ball
+from objects.ball_swarm import BallSwarm
 from objects.brick import Brick
 from levels.level import Level
+from levels.level_loader import LevelLoader
 from ui.level_banner import LevelBanner
 from ui.scoreboard import Scoreboard
 from ui.player_lives import PlayerLives
 from managers.collision import Collision
 from managers.input import InputEvent
 from managers.game_reset import GameReset
+from managers.replay_recorder import ReplayRecorder
 from game.game_state import GameState
+from utils.asset_manager import AssetManager
+from utils.dirty_rect_renderer import DirtyRectRenderer
+from utils.frame_profiler import FrameProfiler
 
 class GamePlay(GameState):
-    def __init__(self, game) -> None:
+    RNG_SUBSYSTEMS: Tuple[str, ...] = ("level", "collision", "swarm")  # Each draws from its own seeded random source
+
+    def __init__(self, game, seeds: Optional[Dict[str, int]] = None) -> None:
         """
         Initialize the GamePlay class.
 
         Args:
             game (Game): The game instance.
+            seeds (Optional[Dict[str, int]]): A seed for each of RNG_SUBSYSTEMS, e.g. from a replay.
+                Fresh random seeds are picked if None.
 
         Attributes:
+            seeds (Dict[str, int]): The seed of each random subsystem.
+            level_rng (random.Random): Picks the seed of each new level.
+            collision_rng (random.Random): Bounce jitter and the launch angle of spawned balls.
             difficulty (float): The game difficulty.
+            start_difficulty (float): The difficulty the game started at; its leaderboard.
             background_image (Surface): The background image of the game.
             current_level_index (int): The index of the current level.
             level (Level): The current level.
             bricks (list): The list of bricks in the level.
             paddle (Paddle): The game paddle.
-            ball (Ball): The game ball.
+            swarm (Optional[BallSwarm]): The vectorized ball engine when BALL_BACKEND is "swarm".
+            balls (list): The balls in play.
             scoreboard (Scoreboard): The game scoreboard.
             lives (PlayerLives): The player lives.
             collision (Collision): The collision manager.
             input_handler (InputEvent): The input event manager.
-            level_banner (LevelBanner): The level banner UI.
+            level_banner (LevelBanner): The level banner overlay; the simulation pauses while it shows.
+            level_loader (LevelLoader): Builds the next level in the background during the banner.
             game_reset (GameReset): The game reset manager.
+            renderer (Optional[DirtyRectRenderer]): The dirty-rect renderer when DIRTY_RECT_RENDERING is on.
+            recorder (Optional[ReplayRecorder]): Records the game to REPLAY_DIR when RECORD_REPLAYS is on.
         """
         super().__init__(game)
         self.difficulty: float = self.settings.get("DIFFICULTY")
-        self.background_image: pg.Surface = pg.image.load(self.settings.get("BACKGROUND_IMG")).convert()
-        self.background_image = pg.transform.scale(self.background_image, (self.screen_width, self.screen_height))
+        self.start_difficulty: float = self.difficulty
+        self.background_image: pg.Surface = AssetManager().image(self.settings.get("BACKGROUND_IMG"), (self.screen_width, self.screen_height), alpha=False)
+        self.seeds: Dict[str, int] = dict(seeds) if seeds is not None else {name: random.getrandbits(32) for name in self.RNG_SUBSYSTEMS}
+        self.level_rng: random.Random = random.Random(self.seeds["level"])
+        self.collision_rng: random.Random = random.Random(self.seeds["collision"])
         self.current_level_index: int = 0
-        self.level: Level = Level(self.current_level_index)
+        self.level: Level = Level(self.current_level_index, self.level_rng.getrandbits(32))
         self.bricks: list[Brick] = self.level.bricks
         self.paddle: Paddle = Paddle()
-        self.balls: list[Ball] = [Ball(self.paddle)]  # Changed to list to support multiple balls
+        self.swarm: Optional[BallSwarm] = None
+        if self.settings.get("BALL_BACKEND") == "swarm":
+            if BallSwarm.available():
+                self.swarm = BallSwarm(self.paddle, self.seeds["swarm"])
+            else:
+                warnings.warn('BALL_BACKEND is "swarm" but NumPy is not installed; using the sprite backend', RuntimeWarning)
+        self.balls: list[Ball] = [self.create_ball()]  # Changed to list to support multiple balls
         self.scoreboard: Scoreboard = Scoreboard()
         self.lives: PlayerLives = PlayerLives()
-        self.collision: Collision = Collision(self.balls, self.paddle, self.level, self.scoreboard, self.lives, self.screen, self)
+        self.collision: Collision = Collision(self.balls, self.paddle, self.level, self.scoreboard, self.lives, self.screen, self, self.swarm, self.collision_rng)
         self.input_handler: InputEvent = InputEvent(self.paddle, self.balls)
         self.level_banner: LevelBanner = LevelBanner()
+        self.level_loader: LevelLoader = LevelLoader()
         self.game_reset: GameReset = GameReset(self)
-        self.level_banner.display(self.screen, self.current_level_index + 1, self.screen_width, self.screen_height)
+        self.renderer: Optional[DirtyRectRenderer] = None
+        if self.settings.get("DIRTY_RECT_RENDERING"):
+            self.renderer = DirtyRectRenderer(self.screen, self.background_image)
+        self.recorder: Optional[ReplayRecorder] = None
+        if self.settings.get("RECORD_REPLAYS"):
+            self.recorder = ReplayRecorder(self)
+        self.level_banner.show(self.current_level_index + 1)
+
+    def create_ball(self) -> Ball:
+        """
+        Create a ball resting on the paddle using the configured ball backend.
+
+        Returns:
+            Ball: A Ball sprite, or a SwarmBall view when the swarm backend is active.
+        """
+        if self.swarm is not None:
+            return self.swarm.spawn_on_paddle()
+        return Ball(self.paddle)
 
     def update(self, events: list[pg.event.Event]) -> None:
         """
-        Update the game logic in the playing state.
+        Update the playing state once per rendered frame.
+
+        Simulation happens in fixed_update, which the main loop calls once per physics step.
 
         Args:
             events (list): The list of pygame events.
@@ -62,35 +114,72 @@ class GamePlay(GameState):
         Returns:
             None
         """
-        self.input_handler.handle_input()
-        self.level.update()  # Update bricks (for moving bricks)
+        pass
+
+    def fixed_update(self) -> None:
+        """
+        Advance the game logic by one fixed simulation step.
+
+        While the level banner shows, or the next level is still being built,
+        the simulation is paused and only the banner timer advances.
+
+        Returns:
+            None
+        """
+        if self.level_banner.active:
+            self.level_banner.update(self.game.simulation_clock.step_ms)
+        if self.level_loader.pending:
+            level: Optional[Level] = self.level_loader.take()
+            if level is None:
+                return
+            self.game_reset.reset(level)
+        if self.level_banner.active:
+            return
+
+        profiler: FrameProfiler = FrameProfiler()
+        with profiler.stage("input"):
+            self.paddle.update()
+            self.input_handler.handle_input()
+        with profiler.stage("level"):
+            self.level.update()  # Update bricks (for moving bricks)
         
         # Update all balls
-        for ball in self.balls[:]:
-            ball.update()
+        with profiler.stage("balls"):
+            if self.swarm is not None:
+                self.swarm.integrate()
+            else:
+                for ball in self.balls[:]:
+                    ball.update()
         
-        self.collision.update()
+        with profiler.stage("collision"):
+            self.collision.update()
         if self.level.is_level_complete():
             self.handle_level_complete()
         if self.lives.lives == 0:
+            if self.recorder is not None:
+                self.recorder.save(os.path.join(self.settings.get("REPLAY_DIR"), time.strftime("replay-%Y%m%d-%H%M%S.bbr")))
             self.settings.set("DIFFICULTY", 1)
             self.game.player_score = self.scoreboard.score
+            self.game.player_difficulty = self.start_difficulty
             self.game.change_state("GameOver")
 
     def handle_level_complete(self) -> None:
         """
         Handle the completion of a level.
 
+        The next level is built on a background thread while the level banner
+        shows; fixed_update swaps it in once it is ready.
+
         Returns:
             None
         """
         self.current_level_index += 1
         if self.difficulty < 10:
-            new_difficulty: float = self.difficulty + 0.2
+            new_difficulty: float = self.difficulty + self.settings.get("DIFFICULTY_STEP")
             self.settings.set("DIFFICULTY", new_difficulty)
             self.difficulty = self.settings.get("DIFFICULTY")
-        self.game_reset.reset()
-        self.level_banner.display(self.screen, self.current_level_index + 1, self.screen_width, self.screen_height)
+        self.level_loader.request(self.current_level_index, self.level_rng.getrandbits(32))
+        self.level_banner.show(self.current_level_index + 1)
 
     def draw(self) -> None:
         """
@@ -99,13 +188,72 @@ class GamePlay(GameState):
         Returns:
             None
         """
+        if self.renderer is not None:
+            self.draw_dirty()
+            return
+        # Moving objects are drawn interpolated between the last two physics steps
+        alpha: float = self.game.simulation_clock.alpha
         self.screen.blit(self.background_image, (0, 0))
-        self.level.draw(self.screen)
+        self.level.draw(self.screen, alpha)
         self.scoreboard.draw(self.screen)
-        self.paddle.draw(self.screen)
+        self.paddle.draw(self.screen, alpha)
         
-        # Draw all balls
-        for ball in self.balls:
-            ball.draw(self.screen)
+        if self.swarm is not None:
+            self.swarm.draw(self.screen, alpha)
+        else:
+            for ball in self.balls:
+                ball.draw(self.screen, alpha)
         
         self.lives.draw(self.screen)
+        self.level_banner.draw(self.screen, self.screen_width, self.screen_height)
+
+    def draw_dirty(self) -> None:
+        """
+        Draw only what moved or changed since the last frame over the cached backdrop.
+
+        Returns:
+            None
+        """
+        renderer: DirtyRectRenderer = self.renderer
+        alpha: float = self.game.simulation_clock.alpha
+        renderer.begin_frame(self.level)
+        for rect in self.level.draw_moving_bricks(self.screen, alpha):
+            renderer.mark(rect)
+        renderer.mark(self.scoreboard.draw(self.screen))
+        renderer.mark(self.paddle.draw(self.screen, alpha))
+
+        if self.swarm is not None:
+            for rect in self.swarm.draw(self.screen, alpha, doreturn=True):
+                renderer.mark(rect)
+        else:
+            for ball in self.balls:
+                renderer.mark(ball.draw(self.screen, alpha))
+
+        renderer.mark(self.lives.draw(self.screen))
+        renderer.mark(self.level_banner.draw(self.screen, self.screen_width, self.screen_height))
+        renderer.end_frame()
+
+    def mark_overlay(self, rect: Optional[pg.Rect]) -> None:
+        """
+        Track an overlay drawn after draw() so dirty-rect rendering pushes and erases it.
+
+        Args:
+            rect (Optional[pg.Rect]): The area drawn, or None.
+
+        Returns:
+            None
+        """
+        if self.renderer is not None:
+            self.renderer.mark_late(rect)
+
+    def present(self) -> None:
+        """
+        Push the frame to the display, only the dirty areas when dirty-rect rendering is on.
+
+        Returns:
+            None
+        """
+        if self.renderer is None:
+            super().present()
+        else:
+            self.renderer.present()
@@ -1,4 +1,5 @@
-from typing import Tuple
+from typing import Optional, Tuple
+import pygame as pg
 from settings import Settings
 
 class GameState:
@@ -18,4 +19,29 @@ class GameState:
         self.GRAY: Tuple[int, int, int] = self.settings.get("GRAY")
         self.screen = game.screen
         self.screen_width: int = self.settings.get("SCREEN_WIDTH")
-        self.screen_height: int = self.settings.get("SCREEN_HEIGHT")
\ No newline at end of file
+        self.screen_height: int = self.settings.get("SCREEN_HEIGHT")
+
+    def fixed_update(self) -> None:
+        """
+        Advance the state by one fixed simulation step.
+
+        States without physics ignore the simulation clock.
+        """
+        pass
+
+    def mark_overlay(self, rect: Optional[pg.Rect]) -> None:
+        """
+        Note an area drawn over the state after draw(), e.g. by the profiler overlay.
+
+        States that push the whole frame need not track it.
+
+        Args:
+            rect (Optional[pg.Rect]): The area drawn, or None.
+        """
+        pass
+
+    def present(self) -> None:
+        """
+        Push the drawn frame to the display.
+        """
+        pg.display.flip()
@@ -0,0 +1,43 @@
+import pygame as pg
+from typing import Optional
+from settings import Settings
+from utils.simulation_clock import SimulationClock
+
+class HeadlessGame:
+    """
+    A stand-in for Game that hosts a single GamePlay without a window.
+
+    It offers what GamePlay reads from its game (screen, simulation clock,
+    player score and state changes) but draws to an off-screen surface, plays
+    no music and ends the run instead of switching to another state.
+
+    Attributes:
+    - screen: The off-screen surface the state is given.
+    - settings: The shared Settings instance.
+    - player_score: The score recorded when the game ended.
+    - player_difficulty: The difficulty the game started at, recorded when it ended.
+    - simulation_clock: The fixed-timestep clock; only its step size is used.
+    - current_state: The hosted state.
+    - next_state: The state the hosted state asked to switch to, or None.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the HeadlessGame class.
+        """
+        self.settings: Settings = Settings()
+        self.screen: pg.Surface = pg.Surface((self.settings.get("SCREEN_WIDTH"), self.settings.get("SCREEN_HEIGHT")))
+        self.player_score: int = 0
+        self.player_difficulty: Optional[float] = None
+        self.simulation_clock: SimulationClock = SimulationClock(self.settings.get("PHYSICS_HZ"), self.settings.get("MAX_SUBSTEPS"))
+        self.current_state: object = None
+        self.next_state: Optional[str] = None
+
+    def change_state(self, new_state_str: str) -> None:
+        """
+        Records a requested state change; the hosted state keeps running.
+
+        Parameters:
+        - new_state_str: The new state string (Playing, Settings, GameOver, MainMenu).
+        """
+        self.next_state = new_state_str
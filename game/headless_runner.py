@@ -0,0 +1,200 @@
+"""
+Headless simulation mode: runs GamePlay at full speed without a window.
+
+Run from the project root:
+    python -m game.headless_runner --steps 20000 --levels 5 --seed 1
+    python -m game.headless_runner --seed 1 --record run.bbr
+    python -m game.headless_runner --replay run.bbr
+
+Only fixed simulation steps run: nothing is drawn or flipped, the frame
+limiter and level banner are skipped, and a computer player (or any object
+with a poll() -> InputState method) drives the paddle. Settings changes made
+during the run stay in memory, so settings.json is left untouched.
+"""
+import argparse
+import json
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional
+import pygame as pg
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from settings import Settings
+from game.game_play import GamePlay
+from game.headless_game import HeadlessGame
+from managers.autopilot_input_source import AutopilotInputSource
+from managers.replay import Replay
+from managers.replay_player import ReplayPlayer
+from managers.replay_recorder import ReplayRecorder
+
+
+class HeadlessRunner:
+    """
+    Runs one game headless and reports how it went.
+
+    Attributes:
+        seed (Optional[int]): Seed for the game's randomness and the computer player.
+        max_steps (int): The most simulation steps to run.
+        max_levels (Optional[int]): Stop once this many levels are cleared, or None to play on.
+        difficulty (Optional[float]): The starting difficulty, or None for the configured one.
+        input_source (Optional[object]): The controls, or None for an AutopilotInputSource.
+        replay (Optional[Replay]): A recording to play back instead; it sets the seeds, settings and controls.
+        record (bool): Whether to record the run.
+        recorder (Optional[ReplayRecorder]): The recorder of the last run when record is on.
+        player (Optional[ReplayPlayer]): The player of the last run when replaying.
+        overrides (Dict[str, Any]): Settings applied in memory for the run, e.g. BALL_SPEED.
+    """
+
+    def __init__(self, seed: Optional[int] = None, max_steps: int = 10000, max_levels: Optional[int] = None,
+                 difficulty: Optional[float] = None, input_source: Optional[object] = None,
+                 replay: Optional[Replay] = None, record: bool = False, overrides: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Initializes a HeadlessRunner.
+
+        Args:
+            seed (Optional[int]): Seed for the game's randomness and the computer player.
+            max_steps (int): The most simulation steps to run.
+            max_levels (Optional[int]): Stop once this many levels are cleared, or None to play on.
+            difficulty (Optional[float]): The starting difficulty, or None for the configured one.
+            input_source (Optional[object]): The controls, or None for an AutopilotInputSource.
+            replay (Optional[Replay]): A recording to play back to its end instead; max_steps still applies.
+            record (bool): Whether to record the run; the Replay is then in recorder.replay.
+            overrides (Optional[Dict[str, Any]]): Settings applied in memory for the run; ignored when replaying.
+        """
+        self.seed: Optional[int] = seed
+        self.max_steps: int = max_steps
+        self.max_levels: Optional[int] = max_levels
+        self.difficulty: Optional[float] = difficulty
+        self.input_source: Optional[object] = input_source
+        self.replay: Optional[Replay] = replay
+        self.record: bool = record
+        self.recorder: Optional[ReplayRecorder] = None
+        self.player: Optional[ReplayPlayer] = None
+        self.overrides: Dict[str, Any] = dict(overrides or {})
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Plays until the step or level limit is reached or the game is over.
+
+        Returns:
+            Dict[str, Any]: steps, seconds, steps_per_second, levels_cleared, level_steps (the steps
+                taken to clear each level), score, lives, lives_lost, balls_lost (every ball that left through the bottom)
+                and game_over, plus desync_step when replaying.
+        """
+        settings: Settings = Settings()
+        saved_settings: dict = dict(settings.settings)
+        persistent: bool = settings.persistent
+        settings.persistent = False
+        try:
+            if self.replay is not None:
+                self.replay.apply_settings()
+            else:
+                with settings.lock:
+                    settings.settings.update(self.overrides)
+                if self.difficulty is not None:
+                    settings.set("DIFFICULTY", self.difficulty)
+            if self.replay is not None:
+                seeds: Dict[str, int] = self.replay.seeds
+            else:
+                rng: random.Random = random.Random(self.seed)  # The process-wide random is left alone
+                seeds = {name: rng.getrandbits(32) for name in GamePlay.RNG_SUBSYSTEMS}
+            game: HeadlessGame = HeadlessGame()
+            game_play: GamePlay = GamePlay(game, seeds)
+            game.current_state = game_play
+            self.player = None
+            if self.replay is not None:
+                self.player = ReplayPlayer(game_play, self.replay)
+            else:
+                game_play.input_handler.source = self.input_source or AutopilotInputSource(game_play, self.seed)
+            self.recorder = ReplayRecorder(game_play) if self.record else None
+            report: Dict[str, Any] = self.play(game, game_play)
+            if self.player is not None:
+                report["desync_step"] = self.player.desync_step
+            return report
+        finally:
+            with settings.lock:
+                settings.settings.clear()
+                settings.settings.update(saved_settings)
+            settings.persistent = persistent
+
+    def play(self, game: HeadlessGame, game_play: GamePlay) -> Dict[str, Any]:
+        """
+        Steps the simulation as fast as possible.
+
+        Args:
+            game (HeadlessGame): The host of game_play.
+            game_play (GamePlay): The state to run.
+
+        Returns:
+            Dict[str, Any]: The run report.
+        """
+        steps: int = 0
+        level_steps: List[int] = []
+        level_start: int = 0
+        start_lives: int = game_play.lives.lives
+        start: float = time.perf_counter()
+        max_steps: int = self.max_steps if self.replay is None else min(self.max_steps, len(self.replay))
+        while steps < max_steps and game.next_state is None:
+            if self.max_levels is not None and game_play.current_level_index >= self.max_levels:
+                break
+            if game_play.level_loader.pending:
+                game_play.level_loader.future.result()  # Nothing else to do while the level builds
+            game_play.level_banner.hide()
+            level_index: int = game_play.current_level_index
+            game_play.fixed_update()
+            steps += 1
+            if game_play.current_level_index != level_index:
+                level_steps.append(steps - level_start)
+                level_start = steps
+        seconds: float = time.perf_counter() - start
+        return {
+            "steps": steps,
+            "seconds": seconds,
+            "steps_per_second": steps / seconds if seconds > 0 else 0.0,
+            "levels_cleared": game_play.current_level_index,
+            "level_steps": level_steps,
+            "score": game_play.scoreboard.score,
+            "lives": game_play.lives.lives,
+            "lives_lost": start_lives - game_play.lives.lives,
+            "balls_lost": game_play.collision.balls_lost,
+            "game_over": game.next_state == "GameOver",
+        }
+
+
+def main() -> None:
+    """
+    Parses the command line, runs the game headless and prints the report.
+    """
+    parser = argparse.ArgumentParser(description="Run Brick Breaker headless at full speed.")
+    parser.add_argument("--steps", type=int, default=None, help="the most simulation steps to run (default 10000, or a whole replay)")
+    parser.add_argument("--levels", type=int, default=None, help="stop after clearing this many levels")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the game and the computer player")
+    parser.add_argument("--difficulty", type=float, default=None, help="starting difficulty (1-10)")
+    parser.add_argument("--record", metavar="PATH", default=None, help="record the run to a replay file")
+    parser.add_argument("--replay", metavar="PATH", default=None, help="play back a replay file instead of the computer player")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    pg.init()
+    pg.display.set_mode((1, 1))
+    replay: Optional[Replay] = Replay.load(args.replay) if args.replay else None
+    max_steps: int = args.steps if args.steps is not None else (len(replay) if replay is not None else 10000)
+    runner = HeadlessRunner(args.seed, max_steps, args.levels, args.difficulty, replay=replay, record=args.record is not None)
+    report: Dict[str, Any] = runner.run()
+    if runner.recorder is not None:
+        runner.recorder.save(args.record)
+    pg.quit()
+    if args.json:
+        print(json.dumps(report))
+        return
+    print(f"steps: {report['steps']} in {report['seconds']:.2f}s ({report['steps_per_second']:.0f} steps/s)")
+    print(f"levels cleared: {report['levels_cleared']}, score: {report['score']}, lives: {report['lives']}, "
+          f"game over: {report['game_over']}")
+    if "desync_step" in report:
+        print("replay: " + ("matched every keyframe" if report["desync_step"] is None else f"desynced at step {report['desync_step']}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import pygame as pg
 from ui.button import Button
 from game.game_state import GameState
 from utils.background_music import BackgroundMusic
+from utils.asset_manager import AssetManager
 
 class MainMenu(GameState):
     """
@@ -32,8 +33,7 @@ class MainMenu(GameState):
         - game: The game object.
         """
         super().__init__(game)
-        self.background = pg.image.load(self.settings.get("BACKGROUND_IMG")).convert()
-        self.background = pg.transform.scale(self.background, (self.screen_width, self.screen_height))
+        self.background = AssetManager().image(self.settings.get("BACKGROUND_IMG"), (self.screen_width, self.screen_height), alpha=False)
         self.buttons = self.create_buttons()
 
     def create_buttons(self) -> List[Button]:
@@ -43,12 +43,10 @@ class MainMenu(GameState):
         Returns:
         - buttons: The list of buttons in the main menu.
         """
-        play_button_image = pg.image.load(self.settings.get("PLAY_BUTTON_IMG")).convert_alpha()
-        settings_button_image = pg.image.load(self.settings.get("SETTINGS_BUTTON_IMG")).convert_alpha()
-        high_scores_button_image = pg.image.load(self.settings.get("HIGH_SCORES_BUTTON_IMG")).convert_alpha()
-        play_button_image = pg.transform.scale(play_button_image, (200, 100))
-        settings_button_image = pg.transform.scale(settings_button_image, (200, 100))
-        high_scores_button_image = pg.transform.scale(high_scores_button_image, (200, 100))
+        assets = AssetManager()
+        play_button_image = assets.image(self.settings.get("PLAY_BUTTON_IMG"), (200, 100))
+        settings_button_image = assets.image(self.settings.get("SETTINGS_BUTTON_IMG"), (200, 100))
+        high_scores_button_image = assets.image(self.settings.get("HIGH_SCORES_BUTTON_IMG"), (200, 100))
         buttons = []
         buttons.append(Button(self.screen, 300, 100, 200, 100, "", self.WHITE, self.GREEN, self.BLACK, lambda: self.game.change_state("Playing"), play_button_image))
         buttons.append(Button(self.screen, 300, 250, 200, 100, "", self.WHITE, self.GREEN, self.BLACK, lambda: self.game.change_state("Settings"), settings_button_image))
@@ -3,6 +3,8 @@ import pygame as pg
 from game.game_state import GameState
 from ui.button import Button
 from ui.preview_window import PreviewWindow
+from utils.asset_manager import AssetManager
+from utils.typography import Typography
 
 class SettingsMenu(GameState):
     """
@@ -71,22 +73,10 @@ class SettingsMenu(GameState):
         """
         Creates the tab buttons.
         """
-        tab_images = self.settings.get("TAB_IMAGES")
-        tab_images = []
-        for img in self.settings.get("TAB_IMAGES"):
-            tab_images.append(pg.image.load(img))
-        for img in tab_images:
-            img = pg.transform.scale(img, (self.BUTTON_WIDTH, self.TAB_HEIGHT))
-        tab_hover_images = []
-        for img in self.settings.get("TAB_HOVER_IMAGES"):
-            tab_hover_images.append(pg.image.load(img))
-        for img in tab_hover_images:
-            img = pg.transform.scale(img, (self.BUTTON_WIDTH, self.TAB_HEIGHT))
-        tab_selected_images = []
-        for img in self.settings.get("TAB_SELECTED_IMAGES"):
-            tab_selected_images.append(pg.image.load(img))
-        for img in tab_selected_images:
-            img = pg.transform.scale(img, (self.BUTTON_WIDTH, self.TAB_HEIGHT))
+        assets = AssetManager()
+        tab_images = [assets.image(img) for img in self.settings.get("TAB_IMAGES")]
+        tab_hover_images = [assets.image(img) for img in self.settings.get("TAB_HOVER_IMAGES")]
+        tab_selected_images = [assets.image(img) for img in self.settings.get("TAB_SELECTED_IMAGES")]
         tab_names = ['Balls', 'Paddles', 'Background', 'Bricks']
         total_tab_width = self.settings.get("SCREEN_WIDTH") - (len(tab_names) + 1) * self.PADDING
         self.BUTTON_WIDTH = total_tab_width // len(tab_names)
@@ -148,8 +138,7 @@ class SettingsMenu(GameState):
         - text: The text to draw.
         - button: The button to center the text on.
         """
-        font = pg.font.SysFont("Arial", 22)
-        text_surface = font.render(text, True, self.WHITE)
+        text_surface = Typography().render(text, 22, self.WHITE, "Arial")
         text_rect = text_surface.get_rect(center=button.rect.center)
         self.screen.blit(text_surface, text_rect)
 
@@ -160,6 +149,7 @@ class SettingsMenu(GameState):
         if hasattr(self.tabs_content[self.current_tab], 'get_value'):
             key, value = self.tabs_content[self.current_tab].get_value()
             self.settings.set(key+"_IMG", value)
+            self.settings.flush()
             self.save_button.error = False
 
     def update(self, events: List[pg.event.Event]) -> None:
@@ -0,0 +1,231 @@
+"""
+Batch simulation lab for balancing difficulty.
+
+Run from the project root:
+    python -m game.simulation_lab --games 16 --steps 30000 \\
+        --grid BALL_SPEED=2,3 --grid PADDLE_SIZE=80x20,100x20 --grid MOVING_BRICK_CHANCE=0.1,0.25
+
+Every combination of the grid values is played by the same set of seeded
+computer-controlled games, spread over a process pool (one worker per core
+by default). Workers receive and return plain dicts: each runs a
+HeadlessRunner with the combination applied as in-memory settings overrides
+and sends back its report, never game objects.
+
+Tunable settings include DIFFICULTY (the starting brick density, DIFFICULTY/10
+of the grid), DIFFICULTY_STEP, MOVING_BRICK_CHANCE, BALL_SPEED and PADDLE_SIZE.
+
+The computer player only misses when it reacts slower than the ball moves: with
+no limit it catches every ball. The lab therefore plays with AUTOPILOT_SPEED
+set to --autopilot-speed (DEFAULT_AUTOPILOT_SPEED pixels per step, below the
+default BALL_SPEED of 2) unless the grid varies AUTOPILOT_SPEED itself. Ball
+losses count every ball that leaves through the bottom, including drains in
+multi-ball play that cost no life; lives lost are reported separately.
+"""
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+DEFAULT_AUTOPILOT_SPEED: float = 1.5  # Loses some balls at the default BALL_SPEED without ending every game at once
+
+
+def init_worker() -> None:
+    """
+    Starts pygame without a window in a worker process.
+    """
+    import pygame as pg
+    pg.init()
+    pg.display.set_mode((1, 1))
+
+
+def run_trial(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Plays one game in a worker process.
+
+    Args:
+        task (Dict[str, Any]): seed, max_steps, max_levels, autopilot_speed and overrides (the settings to apply).
+
+    Returns:
+        Dict[str, Any]: The HeadlessRunner report plus the task's overrides and seed.
+    """
+    from game.headless_runner import HeadlessRunner
+    overrides: Dict[str, Any] = {"AUTOPILOT_SPEED": task["autopilot_speed"], **task["overrides"]}
+    runner = HeadlessRunner(task["seed"], task["max_steps"], task["max_levels"], overrides=overrides)
+    report: Dict[str, Any] = runner.run()
+    report["overrides"] = task["overrides"]
+    report["seed"] = task["seed"]
+    return report
+
+
+def parameter_grid(axes: Dict[str, Iterable[Any]]) -> List[Dict[str, Any]]:
+    """
+    Expands setting axes into every combination.
+
+    Args:
+        axes (Dict[str, Iterable[Any]]): Values to try for each setting key.
+
+    Returns:
+        List[Dict[str, Any]]: One overrides dict per combination; a single empty one if there are no axes.
+    """
+    keys: List[str] = list(axes)
+    return [dict(zip(keys, values)) for values in itertools.product(*(list(axes[key]) for key in keys))]
+
+
+def make_tasks(grid: List[Dict[str, Any]], games: int, max_steps: int, max_levels: Optional[int], base_seed: int = 0,
+               autopilot_speed: float = DEFAULT_AUTOPILOT_SPEED) -> List[Dict[str, Any]]:
+    """
+    Builds the trials: every combination played with the same seeds, so combinations are compared on the same games.
+
+    Args:
+        grid (List[Dict[str, Any]]): The overrides of each combination.
+        games (int): Games per combination.
+        max_steps (int): Simulation steps per game.
+        max_levels (Optional[int]): Stop a game after this many levels, or None.
+        base_seed (int): The seed of the first game.
+        autopilot_speed (float): AUTOPILOT_SPEED for combinations that do not set it.
+
+    Returns:
+        List[Dict[str, Any]]: The tasks.
+    """
+    return [{"seed": base_seed + game, "max_steps": max_steps, "max_levels": max_levels, "autopilot_speed": autopilot_speed,
+             "overrides": overrides}
+            for overrides in grid for game in range(games)]
+
+
+def run_lab(tasks: List[Dict[str, Any]], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Runs the trials across a process pool.
+
+    Args:
+        tasks (List[Dict[str, Any]]): The trials from make_tasks.
+        workers (Optional[int]): Worker processes, or None for one per core.
+
+    Returns:
+        List[Dict[str, Any]]: The reports, in task order.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunksize: int = max(1, len(tasks) // (workers * 4))
+    context = multiprocessing.get_context("spawn")  # Fresh interpreters: no inherited SDL state
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_worker) as executor:
+        return list(executor.map(run_trial, tasks, chunksize=chunksize))
+
+
+def aggregate(reports: List[Dict[str, Any]], step_rate: int) -> List[Dict[str, Any]]:
+    """
+    Summarizes the reports of each combination.
+
+    Args:
+        reports (List[Dict[str, Any]]): The trial reports.
+        step_rate (int): Simulation steps per second of game time (PHYSICS_HZ).
+
+    Returns:
+        List[Dict[str, Any]]: Per combination: overrides, games, mean levels cleared, median seconds
+            of game time to clear a level, mean balls and lives lost, mean and median score, and game-over rate.
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for report in reports:
+        groups.setdefault(json.dumps(report["overrides"], sort_keys=True), []).append(report)
+    rows: List[Dict[str, Any]] = []
+    for group in groups.values():
+        clear_steps: List[int] = [steps for report in group for steps in report["level_steps"]]
+        scores: List[int] = [report["score"] for report in group]
+        rows.append({
+            "overrides": group[0]["overrides"],
+            "games": len(group),
+            "levels_cleared": statistics.mean(report["levels_cleared"] for report in group),
+            "clear_seconds": statistics.median(clear_steps) / step_rate if clear_steps else None,
+            "balls_lost": statistics.mean(report["balls_lost"] for report in group),
+            "lives_lost": statistics.mean(report["lives_lost"] for report in group),
+            "score": statistics.mean(scores),
+            "median_score": statistics.median(scores),
+            "game_over_rate": sum(1 for report in group if report["game_over"]) / len(group),
+        })
+    return rows
+
+
+def parse_axis(text: str) -> tuple:
+    """
+    Parses a --grid argument such as BALL_SPEED=2,3 or PADDLE_SIZE=80x20,100x20.
+
+    Args:
+        text (str): KEY=value,value,...
+
+    Returns:
+        tuple: The key and its list of values (ints, floats, [w, h] sizes or strings).
+    """
+    key, _, values = text.partition("=")
+
+    def parse(value: str) -> Any:
+        if "x" in value and all(part.isdigit() for part in value.split("x")):
+            return [int(part) for part in value.split("x")]
+        for kind in (int, float):
+            try:
+                return kind(value)
+            except ValueError:
+                pass
+        return value
+
+    return key.strip(), [parse(value.strip()) for value in values.split(",") if value.strip()]
+
+
+def print_table(rows: List[Dict[str, Any]]) -> None:
+    """
+    Prints the aggregated results.
+
+    Args:
+        rows (List[Dict[str, Any]]): The output of aggregate.
+    """
+    print(f"{'overrides':<52} {'games':>5} {'levels':>7} {'clear s':>8} {'balls':>6} {'lives':>6} {'score':>8} {'over':>5}")
+    for row in rows:
+        clear: str = f"{row['clear_seconds']:.1f}" if row["clear_seconds"] is not None else "-"
+        label: str = ", ".join(f"{key}={value}" for key, value in row["overrides"].items()) or "(current settings)"
+        print(f"{label:<52} {row['games']:>5} {row['levels_cleared']:>7.2f} {clear:>8} {row['balls_lost']:>6.2f} {row['lives_lost']:>6.2f} "
+              f"{row['score']:>8.0f} {row['game_over_rate']:>5.0%}")
+
+
+def main() -> None:
+    """
+    Parses the command line, runs the lab and prints or saves the results table.
+    """
+    parser = argparse.ArgumentParser(description="Play batches of headless games across a settings grid.")
+    parser.add_argument("--games", type=int, default=8, help="games per combination")
+    parser.add_argument("--steps", type=int, default=20000, help="simulation steps per game")
+    parser.add_argument("--levels", type=int, default=None, help="stop each game after this many levels")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--autopilot-speed", type=float, default=DEFAULT_AUTOPILOT_SPEED,
+                        help="computer player pointer speed in pixels per step (0 for no limit, which never misses)")
+    parser.add_argument("--grid", action="append", default=[], metavar="KEY=V1,V2", help="a setting and the values to try")
+    parser.add_argument("--csv", metavar="PATH", help="also write the table as CSV")
+    parser.add_argument("--json", metavar="PATH", help="also write every trial report as JSON")
+    args = parser.parse_args()
+
+    from settings import Settings
+    axes: Dict[str, List[Any]] = dict(parse_axis(text) for text in args.grid)
+    tasks: List[Dict[str, Any]] = make_tasks(parameter_grid(axes), args.games, args.steps, args.levels, args.seed, args.autopilot_speed)
+    reports: List[Dict[str, Any]] = run_lab(tasks, args.workers)
+    rows: List[Dict[str, Any]] = aggregate(reports, Settings().get("PHYSICS_HZ"))
+    print_table(rows)
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(reports, file, indent=2)
+    if args.csv:
+        with open(args.csv, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(list(axes) + ["games", "levels_cleared", "clear_seconds", "balls_lost", "lives_lost", "score", "median_score", "game_over_rate"])
+            for row in rows:
+                writer.writerow([json.dumps(row["overrides"][key]) for key in axes] +
+                                [row["games"], row["levels_cleared"], row["clear_seconds"], row["balls_lost"], row["lives_lost"],
+                                 row["score"], row["median_score"], row["game_over_rate"]])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,23 @@
 from settings import Settings
 from objects.brick import Brick
 from objects.moving_brick import MovingBrick
+from levels.level_generator import LevelGenerator
+from levels.row_intervals import RowIntervals
 import pygame
 import random
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Optional
 
 class Level:
-    def __init__(self, current_level: int) -> None:
+    EMPTY_CELL: int = -1
+
+    def __init__(self, current_level: int, seed: Optional[int] = None) -> None:
         """
         Initializes a Level object.
 
         Parameters:
         - current_level (int): The current level number.
+        - seed (Optional[int]): The seed for the brick map and moving brick directions.
+          A random seed is picked if None; the same seed and difficulty rebuild the same level.
         """
         self.settings = Settings()
         self.BRICK_SIZE: Tuple[int, int] = self.settings.get("BRICK_SIZE")
@@ -21,10 +27,24 @@ class Level:
         self.level_name: int = current_level + 1
         self.max_bricks_x: int = self.SCREEN_WIDTH // self.BRICK_SIZE[0]
         self.max_bricks_y: int = (self.SCREEN_HEIGHT // 2) // self.BRICK_SIZE[1]
+        self.seed: int = seed if seed is not None else random.getrandbits(32)
+        self.rng: random.Random = random.Random(self.seed)
+        self.generator: LevelGenerator = LevelGenerator(self.max_bricks_x, self.max_bricks_y, self.settings.get("MOVING_BRICK_CHANCE"))
         self.level_map: List[List[int]] = self.generate_brick_map()
         self.bricks: pygame.sprite.Group = pygame.sprite.Group()
-        self.brick_rows: Dict[int, List[Brick]] = {}  # Row-based brick organization
+        self.brick_grid: List[List[int]] = []  # [row][column] -> static brick id, or EMPTY_CELL
+        self.bricks_by_id: List[Brick] = []  # brick id -> brick
+        self.moving_bricks: List[MovingBrick] = []
+        self.row_alive: List[int] = []  # Live bricks (static and moving) per row
+        self.row_intervals: List[RowIntervals] = []  # Occupied x-spans per row, sorted by left edge
+        self.alive_count: int = 0
+        self.grid_version: int = 0  # Bumped whenever a brick is added or destroyed
+        self.destroyed_rects: List[pygame.Rect] = []  # Static brick areas destroyed since the renderer last drained them
+        self.track_destroyed: bool = False  # Set once a DirtyRectRenderer draws the level; nothing drains destroyed_rects otherwise
+        self.static_layer: Optional[pygame.Surface] = None  # All static bricks pre-rendered; built on first draw
+        self.static_layer_rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)
         self.level_complete: bool = False
+        self.clear_bricks()
         self.load_level(self.level_map)
 
     def load_level(self, level_data: List[List[int]]) -> None:
@@ -39,19 +59,134 @@ class Level:
             - 2 = moving brick
         """
         for row_index, row in enumerate(level_data):
-            # Initialize row array
-            self.brick_rows[row_index] = []
-            
             for col_index, col in enumerate(row):
                 if col == 1:
-                    brick = self.create_brick(col_index, row_index)
-                    self.bricks.add(brick)
-                    self.brick_rows[row_index].append(brick)
+                    self.add_brick(self.create_brick(col_index, row_index), row_index)
                 elif col == 2:
-                    brick = self.create_moving_brick(col_index, row_index)
-                    self.bricks.add(brick)
-                    self.brick_rows[row_index].append(brick)
-    
+                    self.add_brick(self.create_moving_brick(col_index, row_index), row_index)
+
+    def add_brick(self, brick: Brick, row_index: int) -> None:
+        """
+        Registers a brick with the sprite group, the occupancy grid and the live counters.
+
+        Parameters:
+        - brick (Brick): The brick to add.
+        - row_index (int): The row the brick belongs to.
+        """
+        brick.brick_id = len(self.bricks_by_id)
+        brick.row_index = row_index
+        self.bricks_by_id.append(brick)
+        self.bricks.add(brick)
+        if isinstance(brick, MovingBrick):
+            self.moving_bricks.append(brick)
+        else:
+            col_index: int = brick.rect.x // self.BRICK_SIZE[0]
+            if self.in_grid(col_index, row_index):
+                self.brick_grid[row_index][col_index] = brick.brick_id
+            self.static_layer = None  # Rebuilt with the new brick on the next draw
+        if 0 <= row_index < self.max_bricks_y:
+            self.row_alive[row_index] += 1
+            self.row_intervals[row_index].add(brick)
+        self.alive_count += 1
+        self.grid_version += 1
+
+    def remove_brick(self, brick: Brick) -> None:
+        """
+        Marks a brick as destroyed and clears it from the grid and counters in O(1).
+
+        Parameters:
+        - brick (Brick): The brick to remove.
+        """
+        if brick.is_destroyed:
+            return
+        brick.is_destroyed = True
+        self.bricks.remove(brick)
+        if isinstance(brick, MovingBrick):
+            self.moving_bricks.remove(brick)  # At most one moving brick per row
+        else:
+            col_index: int = brick.rect.x // self.BRICK_SIZE[0]
+            if self.in_grid(col_index, brick.row_index) and self.brick_grid[brick.row_index][col_index] == brick.brick_id:
+                self.brick_grid[brick.row_index][col_index] = self.EMPTY_CELL
+            if self.track_destroyed:
+                self.destroyed_rects.append(brick.rect.copy())
+            if self.static_layer is not None:
+                self.static_layer.fill((0, 0, 0, 0), brick.rect.move(-self.static_layer_rect.x, -self.static_layer_rect.y))
+        if 0 <= brick.row_index < self.max_bricks_y:
+            self.row_alive[brick.row_index] -= 1
+            self.row_intervals[brick.row_index].remove(brick)
+        self.alive_count -= 1
+        self.grid_version += 1
+
+    def clear_bricks(self) -> None:
+        """
+        Removes every brick from the level.
+        """
+        self.bricks.empty()
+        self.brick_grid = [[self.EMPTY_CELL] * self.max_bricks_x for _ in range(self.max_bricks_y)]
+        self.bricks_by_id = []
+        self.moving_bricks = []
+        self.row_alive = [0] * self.max_bricks_y
+        self.row_intervals = [RowIntervals() for _ in range(self.max_bricks_y)]
+        self.alive_count = 0
+        self.grid_version += 1
+        self.static_layer = None
+
+    def move_brick(self, brick: MovingBrick, old_left: int) -> None:
+        """
+        Updates a moving brick's entry in its row's interval index after it moved.
+
+        Parameters:
+        - brick (MovingBrick): The brick that moved.
+        - old_left (int): Its left edge before the move.
+        """
+        if 0 <= brick.row_index < self.max_bricks_y:
+            self.row_intervals[brick.row_index].move(brick, old_left)
+
+    def overlapping_brick(self, rect: pygame.Rect, row_index: int, ignore: Optional[Brick] = None) -> Optional[Brick]:
+        """
+        Returns a live brick of a row overlapping a rect, in O(log n) for the row.
+
+        Parameters:
+        - rect (pygame.Rect): The area to test.
+        - row_index (int): The row to search.
+        - ignore (Optional[Brick]): A brick to skip, normally the one asking.
+
+        Returns:
+        - Optional[Brick]: An overlapping brick, or None.
+        """
+        if not 0 <= row_index < self.max_bricks_y:
+            return None
+        return self.row_intervals[row_index].first_overlap(rect, ignore)
+
+    def in_grid(self, col_index: int, row_index: int) -> bool:
+        """
+        Checks whether a cell lies inside the brick grid.
+
+        Parameters:
+        - col_index (int): The column of the cell.
+        - row_index (int): The row of the cell.
+
+        Returns:
+        - bool: True if the cell is inside the grid.
+        """
+        return 0 <= row_index < self.max_bricks_y and 0 <= col_index < self.max_bricks_x
+
+    def brick_at(self, col_index: int, row_index: int) -> Optional[Brick]:
+        """
+        Returns the live static brick occupying a grid cell.
+
+        Parameters:
+        - col_index (int): The column of the cell.
+        - row_index (int): The row of the cell.
+
+        Returns:
+        - Optional[Brick]: The brick in the cell, or None if the cell is empty or outside the grid.
+        """
+        if not self.in_grid(col_index, row_index):
+            return None
+        brick_id: int = self.brick_grid[row_index][col_index]
+        return None if brick_id == self.EMPTY_CELL else self.bricks_by_id[brick_id]
+
     def create_brick(self, x_index: int, y_index: int) -> Brick:
         """
         Creates a Brick object at the specified position.
@@ -78,24 +213,75 @@ class Level:
         - MovingBrick: The created MovingBrick object.
         """
         x, y = x_index * self.BRICK_SIZE[0], y_index * self.BRICK_SIZE[1]
-        return MovingBrick(x, y, y_index, self)
+        return MovingBrick(x, y, y_index, self, self.rng.choice([-1, 1]))
 
     def update(self) -> None:
         """
-        Updates all bricks in the level (for moving bricks).
+        Updates the moving bricks in the level.
         """
-        for brick in self.bricks:
-            if not brick.is_destroyed:
-                brick.update()
+        for brick in self.moving_bricks:
+            brick.update()  # Static bricks have nothing to update
 
-    def draw(self, screen) -> None:
+    def draw(self, screen, alpha: float = 1.0) -> None:
         """
         Draws the non-destroyed bricks on the screen.
 
+        The static bricks are a single blit of the pre-rendered layer; moving
+        bricks are drawn on top of it.
+
         Parameters:
         - screen: The screen to draw on.
+        - alpha (float): Interpolation factor for the moving bricks between the previous and current step.
+        """
+        self.draw_static_bricks(screen)
+        self.draw_moving_bricks(screen, alpha)
+
+    def build_static_layer(self, convert: bool = True) -> None:
+        """
+        Pre-renders every live static brick into one transparent layer covering their bounding box.
+
+        Parameters:
+        - convert (bool): Whether to convert the layer to the display format. Pass False
+          off the main thread and call convert_static_layer() later.
+        """
+        static_bricks: List[Brick] = [brick for brick in self.bricks_by_id if not brick.is_destroyed and not isinstance(brick, MovingBrick)]
+        self.static_layer_rect = static_bricks[0].rect.unionall([brick.rect for brick in static_bricks]) if static_bricks else pygame.Rect(0, 0, 0, 0)
+        self.static_layer = pygame.Surface(self.static_layer_rect.size, pygame.SRCALPHA)
+        for brick in static_bricks:
+            self.static_layer.blit(brick.image, brick.rect.move(-self.static_layer_rect.x, -self.static_layer_rect.y))
+        if convert:
+            self.convert_static_layer()
+
+    def convert_static_layer(self) -> None:
+        """
+        Converts the static brick layer to the display format for faster blits.
+        """
+        if self.static_layer is not None and pygame.display.get_surface() is not None:
+            self.static_layer = self.static_layer.convert_alpha()
+
+    def draw_static_bricks(self, surface: pygame.Surface) -> None:
         """
-        self.bricks.draw(screen)
+        Draws only the static bricks, e.g. onto a cached backdrop.
+
+        Parameters:
+        - surface: The surface to draw on.
+        """
+        if self.static_layer is None:
+            self.build_static_layer()
+        surface.blit(self.static_layer, self.static_layer_rect)
+
+    def draw_moving_bricks(self, screen: pygame.Surface, alpha: float = 1.0) -> List[pygame.Rect]:
+        """
+        Draws only the moving bricks.
+
+        Parameters:
+        - screen: The screen to draw on.
+        - alpha (float): Interpolation factor between the previous and current step.
+
+        Returns:
+        - List[pygame.Rect]: The areas that were drawn.
+        """
+        return [brick.draw(screen, alpha) for brick in self.moving_bricks]
 
     def is_level_complete(self) -> bool:
         """
@@ -104,12 +290,12 @@ class Level:
         Returns:
         - bool: True if all bricks are destroyed, False otherwise.
         """
-        return all(brick.is_destroyed for brick in self.bricks)
+        return self.alive_count == 0
     
     def generate_brick_map(self) -> List[List[int]]:
         """
-        Generates a brick map based on the game settings and difficulty level.
-        Includes moving bricks (type 2) with a 10-15% chance per row.
+        Generates a brick map from the level seed and the difficulty setting.
+        Includes moving bricks (type 2) with a 15% chance per brick, at most one per row.
 
         Returns:
         - grid (list): A 2D list representing the brick map, where:
@@ -117,59 +303,5 @@ class Level:
             - 1 = static brick
             - 2 = moving brick
         """
-        DIFFICULTY: int = self.settings.get("DIFFICULTY")
-        # Determine max bricks and percentage of bricks to be generated
-        total_bricks: int = int((self.max_bricks_x * self.max_bricks_y) * (DIFFICULTY / 10))
-        
-        # Generate the brick map with random brick positions
-        grid: List[List[int]] = [[0 for _ in range(self.max_bricks_x)] for _ in range(self.max_bricks_y)]
-        brick_positions: set = set()
-        
-        while len(brick_positions) < total_bricks:
-            x: int = random.randint(0, self.max_bricks_x - 1)
-            y: int = random.randint(0, self.max_bricks_y - 1)
-            brick_positions.add((x, y))
-        
-        # Place bricks and determine which should be moving
-        moving_brick_chance: float = 0.15  # 15% chance of moving brick per row
-        rows_with_moving_bricks: set = set()
-        
-        for x, y in brick_positions:
-            # Decide if this row should have a moving brick
-            if y not in rows_with_moving_bricks and random.random() < moving_brick_chance:
-                grid[y][x] = 2  # Moving brick
-                rows_with_moving_bricks.add(y)
-            else:
-                grid[y][x] = 1  # Static brick
-        
-        return grid
-    
-    def get_ball_collision_rows(self, ball_rect: pygame.Rect, ball_velocity: pygame.math.Vector2) -> List[int]:
-        """
-        Determines which brick rows the ball is currently in or will enter based on velocity.
-        This optimizes collision detection by only checking relevant rows.
-
-        Parameters:
-        - ball_rect (pygame.Rect): The ball's current rectangle.
-        - ball_velocity (pygame.math.Vector2): The ball's velocity vector.
-
-        Returns:
-        - List[int]: List of row indices to check for collision.
-        """
-        rows_to_check: set = set()
-        
-        # Current row(s) the ball occupies
-        current_top_row: int = max(0, ball_rect.top // self.BRICK_SIZE[1])
-        current_bottom_row: int = min(self.max_bricks_y - 1, ball_rect.bottom // self.BRICK_SIZE[1])
-        
-        for row in range(current_top_row, current_bottom_row + 1):
-            rows_to_check.add(row)
-        
-        # Predicted row(s) based on velocity (look ahead 1 frame)
-        if ball_velocity.y != 0:
-            predicted_y: int = ball_rect.centery + int(ball_velocity.y)
-            predicted_row: int = predicted_y // self.BRICK_SIZE[1]
-            if 0 <= predicted_row < self.max_bricks_y:
-                rows_to_check.add(predicted_row)
-        
-        return sorted(list(rows_to_check))
+        DIFFICULTY: float = self.settings.get("DIFFICULTY")
+        return self.generator.generate_from(self.rng, DIFFICULTY)
@@ -0,0 +1,138 @@
+import random
+from array import array
+from typing import Iterable, List
+
+class LevelGenerator:
+    """
+    Generates brick maps from an explicit seed.
+
+    Brick cells are drawn without replacement in a single random.sample call, so
+    the cost is proportional to the number of bricks at any difficulty, and the
+    same (seed, difficulty) always gives the same map. A level can therefore be
+    shared or replayed by its seed alone.
+
+    Map cells are 0 (empty), 1 (static brick) or 2 (moving brick); each row holds
+    at most one moving brick.
+
+    Attributes:
+        max_bricks_x (int): The number of columns.
+        max_bricks_y (int): The number of rows.
+        moving_brick_chance (float): The chance for each brick to be the moving brick of its row.
+    """
+
+    def __init__(self, max_bricks_x: int, max_bricks_y: int, moving_brick_chance: float = 0.15) -> None:
+        """
+        Initializes a LevelGenerator for a grid size.
+
+        Args:
+            max_bricks_x (int): The number of columns.
+            max_bricks_y (int): The number of rows.
+            moving_brick_chance (float): The chance for each brick to be the moving brick of its row.
+        """
+        self.max_bricks_x: int = max_bricks_x
+        self.max_bricks_y: int = max_bricks_y
+        self.moving_brick_chance: float = moving_brick_chance
+
+    def brick_count(self, difficulty: float) -> int:
+        """
+        Returns how many bricks a level has at a difficulty.
+
+        Args:
+            difficulty (float): The difficulty from 0 to 10.
+
+        Returns:
+            int: The number of bricks.
+        """
+        cells: int = self.max_bricks_x * self.max_bricks_y
+        return max(0, min(cells, int(cells * (difficulty / 10))))
+
+    def generate_cells(self, rng: random.Random, difficulty: float) -> array:
+        """
+        Generates a map as a flat row-major array of cell values.
+
+        Args:
+            rng (random.Random): The random source.
+            difficulty (float): The difficulty from 0 to 10.
+
+        Returns:
+            array: One unsigned byte per cell.
+        """
+        cells = array("B", bytes(self.max_bricks_x * self.max_bricks_y))
+        rows_with_moving_bricks: set = set()
+        for cell in rng.sample(range(len(cells)), self.brick_count(difficulty)):
+            row: int = cell // self.max_bricks_x
+            if row not in rows_with_moving_bricks and rng.random() < self.moving_brick_chance:
+                cells[cell] = 2
+                rows_with_moving_bricks.add(row)
+            else:
+                cells[cell] = 1
+        return cells
+
+    def generate_from(self, rng: random.Random, difficulty: float) -> List[List[int]]:
+        """
+        Generates a map using an existing random source, e.g. a level's own.
+
+        Args:
+            rng (random.Random): The random source.
+            difficulty (float): The difficulty from 0 to 10.
+
+        Returns:
+            List[List[int]]: The map as [row][column].
+        """
+        return self.to_grid(self.generate_cells(rng, difficulty))
+
+    def generate(self, seed: int, difficulty: float) -> List[List[int]]:
+        """
+        Generates the map for a seed.
+
+        Args:
+            seed (int): The level seed.
+            difficulty (float): The difficulty from 0 to 10.
+
+        Returns:
+            List[List[int]]: The map as [row][column].
+        """
+        return self.generate_from(random.Random(seed), difficulty)
+
+    def generate_batch(self, seeds: Iterable[int], difficulty: float) -> array:
+        """
+        Generates the maps for many seeds into one compact array.
+
+        Args:
+            seeds (Iterable[int]): The level seeds.
+            difficulty (float): The difficulty from 0 to 10.
+
+        Returns:
+            array: The maps back to back, max_bricks_x * max_bricks_y bytes each.
+        """
+        batch = array("B")
+        for seed in seeds:
+            batch.extend(self.generate_cells(random.Random(seed), difficulty))
+        return batch
+
+    def grid_from_batch(self, batch: array, index: int) -> List[List[int]]:
+        """
+        Unpacks one map from a batch.
+
+        Args:
+            batch (array): The array returned by generate_batch.
+            index (int): The position of the map's seed in the batch.
+
+        Returns:
+            List[List[int]]: The map as [row][column].
+        """
+        size: int = self.max_bricks_x * self.max_bricks_y
+        return self.to_grid(batch[index * size:(index + 1) * size])
+
+    def to_grid(self, cells: array) -> List[List[int]]:
+        """
+        Splits a flat map into rows.
+
+        Args:
+            cells (array): One byte per cell, row-major.
+
+        Returns:
+            List[List[int]]: The map as [row][column].
+        """
+        width: int = self.max_bricks_x
+        return [cells[row * width:(row + 1) * width].tolist() for row in range(self.max_bricks_y)]
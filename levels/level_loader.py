@@ -0,0 +1,80 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+from levels.level import Level
+
+class LevelLoader:
+    """
+    Builds the next Level on a background thread.
+
+    The level's brick map, bricks and static brick layer are all built on the
+    worker; the main thread only converts the finished layer to the display
+    format when it takes the level. All loaders share one worker thread.
+
+    Attributes:
+        future (Optional[Future]): The level being built, or None when idle.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None  # Shared by all instances
+
+    def __init__(self) -> None:
+        """
+        Initializes an idle LevelLoader.
+        """
+        self.future: Optional[Future] = None
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        """
+        Returns the shared worker, starting it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The single-thread executor that builds levels.
+        """
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-loader")
+        return cls._executor
+
+    @staticmethod
+    def build(level_index: int, seed: Optional[int] = None) -> Level:
+        """
+        Builds a level and pre-renders its static bricks. Runs on the worker thread.
+
+        Args:
+            level_index (int): The index of the level to build.
+            seed (Optional[int]): The level seed, or None for a random one.
+
+        Returns:
+            Level: The finished level.
+        """
+        level: Level = Level(level_index, seed)
+        level.build_static_layer(convert=False)
+        return level
+
+    @property
+    def pending(self) -> bool:
+        """Whether a level has been requested and not taken yet."""
+        return self.future is not None
+
+    def request(self, level_index: int, seed: Optional[int] = None) -> None:
+        """
+        Starts building a level in the background.
+
+        Args:
+            level_index (int): The index of the level to build.
+            seed (Optional[int]): The level seed, or None for a random one.
+        """
+        self.future = self.executor().submit(self.build, level_index, seed)
+
+    def take(self) -> Optional[Level]:
+        """
+        Returns the requested level once it is built, without blocking.
+
+        Returns:
+            Optional[Level]: The level, or None if it is still being built.
+        """
+        if self.future is None or not self.future.done():
+            return None
+        level: Level = self.future.result()  # Re-raises anything the worker raised
+        self.future = None
+        level.convert_static_layer()
+        return level
@@ -0,0 +1,120 @@
+from bisect import bisect_left
+from typing import List, Optional
+import pygame as pg
+from objects.brick import Brick
+
+class RowIntervals:
+    """
+    The occupied x-spans of one brick row, sorted by left edge.
+
+    Static and moving bricks of the row are kept in left-edge order with their
+    live count, so the bricks overlapping a span are found with two binary
+    searches instead of a scan of the row.
+
+    Attributes:
+        lefts (List[int]): The left edge of each brick, ascending.
+        bricks (List[Brick]): The bricks, in the same order as lefts.
+        max_width (int): The widest brick seen, bounding how far left an overlap can start.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty RowIntervals.
+        """
+        self.lefts: List[int] = []
+        self.bricks: List[Brick] = []
+        self.max_width: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of live bricks in the row.
+
+        Returns:
+            int: The live brick count.
+        """
+        return len(self.bricks)
+
+    def add(self, brick: Brick) -> None:
+        """
+        Inserts a brick at its current position.
+
+        Args:
+            brick (Brick): The brick to insert.
+        """
+        index: int = bisect_left(self.lefts, brick.rect.left)
+        self.lefts.insert(index, brick.rect.left)
+        self.bricks.insert(index, brick)
+        self.max_width = max(self.max_width, brick.rect.width)
+
+    def index_of(self, brick: Brick, left: int) -> int:
+        """
+        Finds a brick stored with a given left edge.
+
+        Args:
+            brick (Brick): The brick to find.
+            left (int): The left edge the brick was stored with.
+
+        Returns:
+            int: The brick's index, or -1 if it is not in the row.
+        """
+        index: int = bisect_left(self.lefts, left)
+        while index < len(self.lefts) and self.lefts[index] == left:
+            if self.bricks[index] is brick:
+                return index
+            index += 1
+        return -1
+
+    def remove(self, brick: Brick) -> None:
+        """
+        Removes a brick stored at its current position.
+
+        Args:
+            brick (Brick): The brick to remove.
+        """
+        index: int = self.index_of(brick, brick.rect.left)
+        if index >= 0:
+            del self.lefts[index]
+            del self.bricks[index]
+
+    def move(self, brick: Brick, old_left: int) -> None:
+        """
+        Updates a brick's position after it moved horizontally.
+
+        Bricks rarely pass each other, so the brick usually keeps its slot and
+        only its key changes.
+
+        Args:
+            brick (Brick): The brick that moved.
+            old_left (int): Its left edge before the move.
+        """
+        index: int = self.index_of(brick, old_left)
+        if index < 0:
+            return
+        left: int = brick.rect.left
+        if (index == 0 or self.lefts[index - 1] <= left) and (index == len(self.lefts) - 1 or left <= self.lefts[index + 1]):
+            self.lefts[index] = left
+            return
+        del self.lefts[index]
+        del self.bricks[index]
+        insert_at: int = bisect_left(self.lefts, left)
+        self.lefts.insert(insert_at, left)
+        self.bricks.insert(insert_at, brick)
+
+    def first_overlap(self, rect: pg.Rect, ignore: Optional[Brick] = None) -> Optional[Brick]:
+        """
+        Returns a brick overlapping a rect horizontally and vertically.
+
+        Args:
+            rect (pg.Rect): The area to test.
+            ignore (Optional[Brick]): A brick to skip, normally the one asking.
+
+        Returns:
+            Optional[Brick]: An overlapping brick, or None.
+        """
+        start: int = bisect_left(self.lefts, rect.left - self.max_width + 1)
+        end: int = bisect_left(self.lefts, rect.right)
+        for index in range(start, end):
+            brick: Brick = self.bricks[index]
+            if brick is not ignore and rect.colliderect(brick.rect):
+                return brick
+        return None
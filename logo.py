@@ -13,6 +13,7 @@ class LogoDisplay:
         start_ticks (int): The time in milliseconds when the logo display started.
         done (bool): Indicates whether the logo display is done or not.
         alpha (int): The alpha value for the logo transparency.
+        progress (float): The startup loading progress shown under the logo (0.0 - 1.0).
 
     Methods:
         update(): Updates the logo display based on the elapsed time.
@@ -51,6 +52,7 @@ class LogoDisplay:
         self.start_ticks: int = pg.time.get_ticks()
         self.done: bool = False
         self.alpha: int = 0
+        self.progress: float = 0.0
 
     def update(self) -> None:
         """
@@ -69,13 +71,19 @@ class LogoDisplay:
 
     def draw(self) -> None:
         """
-        Draws the logo on the screen with the appropriate transparency.
+        Draws the logo on the screen with the appropriate transparency, and a
+        progress bar while startup loading is unfinished.
         """
+        self.screen.fill((0, 0, 0))
         if not self.done:
-            self.screen.fill((0, 0, 0))
             logo_copy: pg.Surface = self.logo.copy()
             logo_copy.fill((255, 255, 255, int(self.alpha)), None, pg.BLEND_RGBA_MULT)
             self.screen.blit(logo_copy, self.logo_rect)
+        if self.progress < 1.0:
+            bar: pg.Rect = pg.Rect(0, 0, 300, 6)
+            bar.center = (self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT - 40)
+            pg.draw.rect(self.screen, (90, 90, 90), bar, 1)
+            pg.draw.rect(self.screen, (255, 255, 255), (bar.x, bar.y, int(bar.width * self.progress), bar.height))
 
     def logo_display(self) -> None:
         """
@@ -1,9 +1,12 @@
 import pygame as pg
 import sys
 import os
+from typing import Optional
 from game.game import Game
 from settings import Settings
 from logo import LogoDisplay
+from utils.startup_loader import StartupLoader
+from utils.frame_profiler import FrameProfiler
 
 def setup_bundled_paths() -> None:
     """
@@ -27,32 +30,53 @@ def main() -> None:
     screen_width: int = settings.get("SCREEN_WIDTH")
     screen_height: int = settings.get("SCREEN_HEIGHT")
 
-    FPS: int = settings.get("FPS")
+    FPS: int = settings.get("FPS")  # Render rate; physics runs at PHYSICS_HZ
     screen = pg.display.set_mode((screen_width, screen_height))
     pg.display.set_caption("Brick Breaker")
-    game = Game(screen)
+    startup = StartupLoader()  # Decodes menu and first-level assets on worker threads during the splash
+    startup.start()
+    game: Optional[Game] = None  # Built once the caches are warm
     logo_display = LogoDisplay(screen)
     running: bool = True
     clock = pg.time.Clock()
+    frame_time: int = 0
+    profiler = FrameProfiler()  # F3 shows frame timings, F4 exports them
     
     while running:
+        profiler.begin_frame()
         events = pg.event.get()
         for event in events:
-            if event.type == pg.USEREVENT:
+            if event.type == pg.USEREVENT and game is not None:
                 game.background_music.play_next_track()
             if event.type == pg.QUIT:
                 running = False
+            if event.type == pg.KEYDOWN and event.key == pg.K_F3:
+                profiler.toggle_overlay()
+            if event.type == pg.KEYDOWN and event.key == pg.K_F4 and profiler.enabled:
+                profiler.export(settings.get("PROFILE_DIR"))
 
-        if not logo_display.done:
+        if game is None and startup.finished:
+            game = Game(screen)
+        if game is None or not logo_display.done:
+            logo_display.progress = startup.progress
             logo_display.update()
             logo_display.draw()
+            pg.display.flip()
         else:
-            game.update(events)
-            game.draw()
+            with profiler.stage("update"):
+                game.update(events)
+            for _ in range(game.simulation_clock.advance(frame_time)):
+                with profiler.stage("fixed_update"):
+                    game.fixed_update()
+            with profiler.stage("draw"):
+                game.draw()
+            with profiler.stage("present"):
+                game.present()
 
-        pg.display.flip()
-        clock.tick(FPS)
+        profiler.end_frame()
+        frame_time = clock.tick(FPS)
 
+    settings.flush()
     pg.quit()
 
 
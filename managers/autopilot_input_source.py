@@ -0,0 +1,60 @@
+import random
+from typing import Any, Optional
+from settings import Settings
+from managers.input_state import InputState
+
+class AutopilotInputSource:
+    """
+    A computer player that steers the paddle with the pointer.
+
+    It keeps the paddle under the lowest falling ball, offset by a random
+    amount per catch so the rebound angles vary, and launches balls that rest
+    on the paddle. With AUTOPILOT_SPEED set, the pointer moves at most that
+    many pixels per step, so slow reactions can miss a ball.
+
+    Attributes:
+        game_play (Any): The GamePlay (or compatible) state whose balls and paddle it watches.
+        rng (random.Random): The random source for aim offsets.
+        offset (float): The current aim offset from the paddle centre, in pixels.
+        target (Any): The ball currently being tracked.
+        max_speed (float): The most the pointer moves per step in pixels, or 0 for no limit.
+        pointer_x (float): Where the pointer is.
+    """
+
+    def __init__(self, game_play: Any, seed: Optional[int] = None) -> None:
+        """
+        Initializes an AutopilotInputSource.
+
+        Args:
+            game_play (Any): The GamePlay state to play.
+            seed (Optional[int]): Seed for the aim offsets.
+        """
+        self.game_play = game_play
+        self.rng: random.Random = random.Random(seed)
+        self.offset: float = 0.0
+        self.target: Any = None
+        self.max_speed: float = float(Settings().get("AUTOPILOT_SPEED"))
+        self.pointer_x: float = float(game_play.paddle.rect.centerx)
+
+    def poll(self) -> InputState:
+        """
+        Decides the controls for the next step.
+
+        Returns:
+            InputState: Pointer at the ball to catch, pressed if a ball waits on the paddle.
+        """
+        balls = self.game_play.balls
+        paddle = self.game_play.paddle
+        if not balls:
+            return InputState(pointer_x=paddle.rect.centerx)
+        falling = [ball for ball in balls if not ball.attached_to_paddle and ball.velocity.y > 0]
+        target = max(falling or balls, key=lambda ball: ball.position.y)
+        if target is not self.target:
+            self.target = target
+            self.offset = self.rng.uniform(-0.3, 0.3) * paddle.rect.width
+        attached: bool = any(ball.attached_to_paddle for ball in balls)
+        aim: float = target.position.x + self.offset
+        if self.max_speed > 0:
+            aim = max(self.pointer_x - self.max_speed, min(self.pointer_x + self.max_speed, aim))
+        self.pointer_x = aim
+        return InputState(pointer_x=int(aim), pointer_down=attached)
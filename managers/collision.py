@@ -2,8 +2,9 @@ import pygame as pg
 from settings import Settings
 import math
 import random
-from typing import List
+from typing import List, Optional
 from objects.ball import Ball
+from objects.ball_swarm import BallSwarm
 from objects.paddle import Paddle
 from objects.brick import Brick
 from objects.moving_brick import MovingBrick
@@ -11,9 +12,13 @@ from ui.scoreboard import Scoreboard
 from ui.player_lives import PlayerLives
 from ui.level_banner import LevelBanner
 from levels.level import Level
+from managers.swept_collision import SweptCollision
+from managers.spatial_hash import SpatialHash
 
 class Collision(pg.sprite.Sprite):
-    def __init__(self, balls: List[Ball], paddle: Paddle, level: Level, scoreboard: Scoreboard, player_lives: PlayerLives, screen: pg.Surface, game_play) -> None:
+    MAX_CONTACTS_PER_STEP: int = 8  # Upper bound on brick contacts resolved for one ball per step
+
+    def __init__(self, balls: List[Ball], paddle: Paddle, level: Level, scoreboard: Scoreboard, player_lives: PlayerLives, screen: pg.Surface, game_play, swarm: Optional[BallSwarm] = None, rng: Optional[random.Random] = None) -> None:
         """
         Initializes a Collision object.
 
@@ -25,6 +30,9 @@ class Collision(pg.sprite.Sprite):
             player_lives (PlayerLives): The player lives object.
             screen (pg.Surface): The game screen surface.
             game_play: Reference to the GamePlay instance for spawning balls.
+            swarm (Optional[BallSwarm]): The vectorized ball engine, if balls are swarm views.
+            rng (Optional[random.Random]): The random source for bounce jitter and spawned balls.
+                A fresh unseeded one is used if None; pass a seeded one for replays.
         """
         super().__init__()
         self.settings = Settings()
@@ -44,6 +52,11 @@ class Collision(pg.sprite.Sprite):
         self.lives = player_lives
         self.level_banner = LevelBanner()
         self.game_play = game_play
+        self.swept_collision = SweptCollision(level, self.BALL_RADIUS)
+        self.ball_hash = SpatialHash(self.BALL_RADIUS * 2)
+        self.swarm = swarm
+        self.rng: random.Random = rng if rng is not None else random.Random()
+        self.balls_lost: int = 0  # Balls that left through the bottom, whether or not a life was lost
 
     def check_paddle_collision(self, ball: Ball) -> None:
         """
@@ -88,59 +101,71 @@ class Collision(pg.sprite.Sprite):
             # Remove this ball from the list
             if ball in self.balls:
                 self.balls.remove(ball)
+                self.balls_lost += 1
                 # Clean up paddle hit tracking
                 ball_id = id(ball)
                 if ball_id in self.paddle_hit_dict:
                     del self.paddle_hit_dict[ball_id]
             
-            # If no balls left, respawn one and lose a life
-            if len(self.balls) == 0:
-                new_ball = Ball(self.paddle)
-                self.balls.append(new_ball)
-                self.lives.lives -= 1
+            self.respawn_if_no_balls()
+
+    def respawn_if_no_balls(self) -> None:
+        """
+        Puts a new ball on the paddle and takes a life once every ball is lost.
+        """
+        if len(self.balls) == 0:
+            self.balls.append(self.swarm.spawn_on_paddle() if self.swarm is not None else Ball(self.paddle))
+            self.lives.lives -= 1
 
     def check_brick_collision(self, ball: Ball) -> None:
         """
         Checks for collision with the bricks and updates the ball's velocity accordingly.
-        Uses optimized row-based collision detection.
+        Sweeps the ball's motion for this step through the brick grid so fast balls cannot
+        tunnel, and resolves every contact in time-of-impact order.
         
         Args:
             ball (Ball): The ball to check collision for.
         """
-        # Get only the rows where the ball is or will be
-        rows_to_check = self.level.get_ball_collision_rows(ball.rect, ball.velocity)
-        
-        # Only check bricks in relevant rows
-        for row_index in rows_to_check:
-            if row_index not in self.level.brick_rows:
-                continue
-                
-            for brick in self.level.brick_rows[row_index]:
-                if not brick.is_destroyed and pg.sprite.collide_rect(ball, brick):
-                    collision_normal = pg.math.Vector2()
-                    if ball.velocity.x > 0 and ball.rect.right >= brick.rect.left:
-                        collision_normal.x = -1
-                    elif ball.velocity.x < 0 and ball.rect.left <= brick.rect.right:
-                        collision_normal.x = 1
-                    if ball.velocity.y > 0 and ball.rect.bottom >= brick.rect.top:
-                        collision_normal.y = -1
-                    elif ball.velocity.y < 0 and ball.rect.top <= brick.rect.bottom:
-                        collision_normal.y = 1
-                    self.bounce(ball, collision_normal)
-                    brick.is_destroyed = True
-                    self.scoreboard.score += 10
-                    
-                    # Remove brick from sprite group and brick_rows
-                    self.bricks.remove(brick)
-                    if row_index in self.level.brick_rows:
-                        if brick in self.level.brick_rows[row_index]:
-                            self.level.brick_rows[row_index].remove(brick)
-                    
-                    # Spawn a ball if this was a moving brick
-                    if isinstance(brick, MovingBrick):
-                        self.spawn_ball_from_brick(brick)
-                    
-                    break  # Only process one brick collision per frame
+        start = pg.math.Vector2(ball.previous_position)
+        end = pg.math.Vector2(ball.position)
+        resolved: set = set()
+
+        for _ in range(self.MAX_CONTACTS_PER_STEP):
+            hit = self.swept_collision.first_hit(start, end, resolved)
+            if hit is None:
+                break
+            time_of_impact, brick, collision_normal = hit
+            contact = start.lerp(end, time_of_impact)
+            remaining_distance = (end - start).length() * (1 - time_of_impact)
+
+            self.bounce(ball, collision_normal)
+            resolved.add(brick)
+            self.destroy_brick(brick)
+
+            # Continue the rest of this step's motion along the new velocity
+            start = contact
+            if ball.velocity.length() > 0:
+                end = contact + ball.velocity.normalize() * remaining_distance
+            else:
+                end = contact
+
+        if resolved:
+            ball.position = end
+            ball.rect.center = ball.position
+
+    def destroy_brick(self, brick: Brick) -> None:
+        """
+        Destroys a brick, awards points and spawns a ball for moving bricks.
+
+        Args:
+            brick (Brick): The brick that was hit.
+        """
+        self.level.remove_brick(brick)
+        self.scoreboard.score += 10
+
+        # Spawn a ball if this was a moving brick
+        if isinstance(brick, MovingBrick):
+            self.spawn_ball_from_brick(brick)
 
     def spawn_ball_from_brick(self, brick: Brick) -> None:
         """
@@ -149,15 +174,20 @@ class Collision(pg.sprite.Sprite):
         Args:
             brick (Brick): The brick that was destroyed.
         """
-        # Create new ball at brick center
-        new_ball = Ball(self.paddle)
-        new_ball.position = pg.math.Vector2(brick.rect.centerx, brick.rect.centery)
-        new_ball.rect.center = new_ball.position
-        new_ball.attached_to_paddle = False
-        
         # Give it a random downward velocity
-        angle = random.uniform(60, 120)  # Angle between 60 and 120 degrees (downward)
-        new_ball.velocity = pg.math.Vector2(self.BALL_SPEED, 0).rotate(-angle)
+        angle = self.rng.uniform(60, 120)  # Angle between 60 and 120 degrees (downward)
+        velocity = pg.math.Vector2(self.BALL_SPEED, 0).rotate(-angle)
+
+        if self.swarm is not None:
+            new_ball = self.swarm.spawn(brick.rect.centerx, brick.rect.centery, velocity.x, velocity.y)
+        else:
+            # Create new ball at brick center
+            new_ball = Ball(self.paddle)
+            new_ball.position = pg.math.Vector2(brick.rect.centerx, brick.rect.centery)
+            new_ball.previous_position = new_ball.position.copy()
+            new_ball.rect.center = new_ball.position
+            new_ball.attached_to_paddle = False
+            new_ball.velocity = velocity
         
         # Add to balls list
         self.balls.append(new_ball)
@@ -171,7 +201,7 @@ class Collision(pg.sprite.Sprite):
             collision_normal (pg.math.Vector2): The normal vector of the collision surface.
         """
         ball.velocity = ball.velocity.reflect(collision_normal)
-        angle_variation = random.uniform(-5, 5)
+        angle_variation = self.rng.uniform(-5, 5)
         angle_rad = math.radians(angle_variation)
         ball.velocity = ball.velocity.rotate(angle_rad)
         ball.spin += angle_variation * 0.75
@@ -213,62 +243,89 @@ class Collision(pg.sprite.Sprite):
         """
         Checks for collisions between balls and makes them bounce off each other.
         Preserves the speed (magnitude) of each ball.
+        A spatial hash sized to the ball diameter limits the checks to nearby pairs.
         """
         if len(self.balls) < 2:
             return
-        
-        # Check each pair of balls only once
-        for i in range(len(self.balls)):
-            for j in range(i + 1, len(self.balls)):
-                ball1 = self.balls[i]
-                ball2 = self.balls[j]
-                
-                # Skip if either ball is attached to paddle
-                if ball1.attached_to_paddle or ball2.attached_to_paddle:
-                    continue
-                
-                # Calculate distance between centers
-                dx = ball2.position.x - ball1.position.x
-                dy = ball2.position.y - ball1.position.y
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                # Check if balls are colliding (distance less than sum of radii)
-                if distance < self.BALL_RADIUS * 2 and distance > 0:
-                    # Calculate collision normal (direction from ball1 to ball2)
-                    normal = pg.math.Vector2(dx / distance, dy / distance)
-                    
-                    # Separate balls to prevent overlap
-                    overlap = self.BALL_RADIUS * 2 - distance
-                    separation = normal * (overlap / 2 + 0.5)
-                    ball1.position -= separation
-                    ball2.position += separation
-                    ball1.rect.center = ball1.position
-                    ball2.rect.center = ball2.position
-                    
-                    # Calculate relative velocity
-                    relative_velocity = ball1.velocity - ball2.velocity
-                    velocity_along_normal = relative_velocity.dot(normal)
-                    
-                    # Only resolve if balls are moving towards each other
-                    if velocity_along_normal > 0:
-                        # Store original speeds to preserve them
-                        speed1 = ball1.velocity.length()
-                        speed2 = ball2.velocity.length()
-                        
-                        # Reflect velocities along collision normal
-                        ball1.velocity -= normal * velocity_along_normal
-                        ball2.velocity += normal * velocity_along_normal
-                        
-                        # Restore original speeds (preserve momentum)
-                        if ball1.velocity.length() > 0:
-                            ball1.velocity.scale_to_length(speed1)
-                        if ball2.velocity.length() > 0:
-                            ball2.velocity.scale_to_length(speed2)
+
+        free_balls = [ball for ball in self.balls if not ball.attached_to_paddle]
+        if len(free_balls) < 2:
+            return
+
+        self.ball_hash.rebuild([ball.position for ball in free_balls])
+        contact_distance_sq = (self.BALL_RADIUS * 2) ** 2
+        for i, j in self.ball_hash.candidate_pairs():
+            ball1 = free_balls[i]
+            ball2 = free_balls[j]
+            dx = ball2.position.x - ball1.position.x
+            dy = ball2.position.y - ball1.position.y
+            distance_sq = dx * dx + dy * dy
+            if 0 < distance_sq < contact_distance_sq:
+                self.resolve_ball_pair(ball1, ball2, dx, dy, math.sqrt(distance_sq))
+
+    def resolve_ball_pair(self, ball1: Ball, ball2: Ball, dx: float, dy: float, distance: float) -> None:
+        """
+        Separates two overlapping balls and exchanges their velocity along the contact normal.
+
+        Args:
+            ball1 (Ball): The first ball.
+            ball2 (Ball): The second ball.
+            dx (float): The x distance from ball1 to ball2.
+            dy (float): The y distance from ball1 to ball2.
+            distance (float): The distance between the ball centres.
+        """
+        # Calculate collision normal (direction from ball1 to ball2)
+        normal = pg.math.Vector2(dx / distance, dy / distance)
+
+        # Separate balls to prevent overlap
+        overlap = self.BALL_RADIUS * 2 - distance
+        separation = normal * (overlap / 2 + 0.5)
+        ball1.position -= separation
+        ball2.position += separation
+        ball1.rect.center = ball1.position
+        ball2.rect.center = ball2.position
+
+        # Calculate relative velocity
+        relative_velocity = ball1.velocity - ball2.velocity
+        velocity_along_normal = relative_velocity.dot(normal)
+
+        # Only resolve if balls are moving towards each other
+        if velocity_along_normal > 0:
+            # Store original speeds to preserve them
+            speed1 = ball1.velocity.length()
+            speed2 = ball2.velocity.length()
+
+            # Reflect velocities along collision normal
+            ball1.velocity -= normal * velocity_along_normal
+            ball2.velocity += normal * velocity_along_normal
+
+            # Restore original speeds (preserve momentum)
+            if ball1.velocity.length() > 0:
+                ball1.velocity.scale_to_length(speed1)
+            if ball2.velocity.length() > 0:
+                ball2.velocity.scale_to_length(speed2)
+
+    def update_swarm(self) -> None:
+        """
+        Runs the batched wall, paddle and brick collisions of the ball swarm.
+        """
+        for lost_ball in self.swarm.collide_walls():
+            if lost_ball in self.balls:
+                self.balls.remove(lost_ball)
+                self.balls_lost += 1
+        self.respawn_if_no_balls()
+        self.swarm.collide_paddle()
+        for brick in self.swarm.collide_bricks(self.level):
+            self.destroy_brick(brick)
 
     def update(self) -> None:
         """
         Updates the collision detection for all balls.
         """
+        if self.swarm is not None:
+            self.update_swarm()
+            return
+
         for ball in self.balls[:]:  # Use slice to avoid modification during iteration
             self.check_wall_collision(ball)
             self.check_paddle_collision(ball)
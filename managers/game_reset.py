@@ -1,6 +1,5 @@
 from levels.level import Level
 from managers.collision import Collision
-from objects.ball import Ball
 from typing import *
 from settings import Settings
 
@@ -20,27 +19,32 @@ class GameReset:
         self.SCREEN_HEIGHT: int = self.settings.get("SCREEN_HEIGHT")
         self.BALL_RADIUS: int = self.settings.get("BALL_RADIUS")
 
-    def reset(self) -> None:
+    def reset(self, level: Optional[Level] = None) -> None:
         """
         Resets the game state.
 
         Parameters:
-        None
+        - level: A level built ahead of time (e.g. by a LevelLoader), or None to build it now.
 
         Returns:
         None
         """
-        self.game.level = Level(self.game.current_level_index)
+        self.game.level = level if level is not None else Level(self.game.current_level_index, self.game.level_rng.getrandbits(32))
         self.game.bricks = self.game.level.bricks
 
         self.game.paddle.rect.centerx = self.game.screen_width // 2
         self.game.paddle.rect.y = self.SCREEN_HEIGHT - 60
+        self.game.paddle.update()  # Not interpolated from where the last level left it
 
         # Reset to single ball attached to paddle
-        self.game.balls = [Ball(self.game.paddle)]
+        if self.game.swarm is not None:
+            self.game.swarm.clear()
+        self.game.balls = [self.game.create_ball()]
+
+        balls_lost: int = self.game.collision.balls_lost
+        self.game.collision = Collision(self.game.balls, self.game.paddle, self.game.level, self.game.scoreboard, self.game.lives, self.game.screen, self.game, self.game.swarm, self.game.collision_rng)
+        self.game.collision.balls_lost = balls_lost  # The count spans the whole game
 
-        self.game.collision = Collision(self.game.balls, self.game.paddle, self.game.level, self.game.scoreboard, self.game.lives, self.game.screen, self.game)
-        
         # Update input handler with new balls list
         self.game.input_handler.balls = self.game.balls
 
@@ -0,0 +1,140 @@
+import random
+import pygame as pg
+from typing import Any, Dict, List
+from settings import Settings
+from objects.ball import Ball
+from objects.moving_brick import MovingBrick
+from levels.level import Level
+
+class GameSnapshot:
+    """
+    Captures and restores the simulation state of a GamePlay as plain data.
+
+    A snapshot holds everything a fixed step reads: the level (as its seed plus
+    destroyed bricks and moving brick positions), paddle, balls, score, lives, balls lost,
+    input mode and the state of each seeded random source. It is JSON-safe, so
+    replays can store it as a keyframe. Only the sprite ball backend is covered.
+    """
+
+    @staticmethod
+    def capture(game_play: Any) -> Dict[str, Any]:
+        """
+        Takes a snapshot between two simulation steps.
+
+        Args:
+            game_play (GamePlay): The state to capture.
+
+        Returns:
+            Dict[str, Any]: The snapshot.
+        """
+        level: Level = game_play.level
+        paddle_hits: Dict[int, bool] = game_play.collision.paddle_hit_dict
+        return {
+            "level_index": game_play.current_level_index,
+            "level_seed": level.seed,
+            "difficulty": game_play.difficulty,
+            "destroyed": [brick.brick_id for brick in level.bricks_by_id if brick.is_destroyed],
+            "moving": [[brick.brick_id, brick.rect.x, brick.velocity, brick.collision_cooldown, brick.is_frozen, brick.previous_x]
+                       for brick in level.moving_bricks if not brick.is_destroyed],
+            "paddle": [game_play.paddle.rect.x, game_play.paddle.rect.y, game_play.paddle.position_accumulator],
+            "balls": [[ball.position.x, ball.position.y, ball.previous_position.x, ball.previous_position.y,
+                       ball.velocity.x, ball.velocity.y, ball.attached_to_paddle, ball.spin, ball.angle,
+                       paddle_hits.get(id(ball), False)]
+                      for ball in game_play.balls],
+            "score": game_play.scoreboard.score,
+            "lives": game_play.lives.lives,
+            "balls_lost": game_play.collision.balls_lost,
+            "input_type": game_play.input_handler.active_input_type,
+            "rng": {
+                "level": GameSnapshot.rng_state(game_play.level_rng),
+                "collision": GameSnapshot.rng_state(game_play.collision_rng),
+            },
+        }
+
+    @staticmethod
+    def restore(game_play: Any, snapshot: Dict[str, Any]) -> None:
+        """
+        Puts a GamePlay back into a captured state, ready for the next step.
+
+        Any level being built in the background is dropped and the level
+        banner is hidden.
+
+        Args:
+            game_play (GamePlay): The state to overwrite.
+            snapshot (Dict[str, Any]): A snapshot from capture, possibly after a JSON round trip.
+        """
+        game_play.difficulty = snapshot["difficulty"]
+        Settings().set("DIFFICULTY", snapshot["difficulty"])  # The level map is generated at this difficulty
+        game_play.current_level_index = snapshot["level_index"]
+        level: Level = Level(snapshot["level_index"], snapshot["level_seed"])
+        for brick_id, x, velocity, cooldown, frozen, previous_x in snapshot["moving"]:
+            brick: MovingBrick = level.bricks_by_id[brick_id]
+            old_left: int = brick.rect.x
+            brick.rect.x = x
+            brick.velocity = velocity
+            brick.collision_cooldown = cooldown
+            brick.is_frozen = frozen
+            brick.previous_x = previous_x
+            if x != old_left:
+                level.move_brick(brick, old_left)
+        for brick_id in snapshot["destroyed"]:
+            level.remove_brick(level.bricks_by_id[brick_id])
+
+        game_play.level_loader.future = None
+        game_play.level_banner.hide()
+        game_play.game_reset.reset(level)
+
+        paddle = game_play.paddle
+        paddle.rect.x, paddle.rect.y, paddle.position_accumulator = snapshot["paddle"]
+        paddle.update()
+        balls: List[Ball] = []
+        paddle_hits: Dict[int, bool] = {}
+        for x, y, previous_x, previous_y, velocity_x, velocity_y, attached, spin, angle, paddle_hit in snapshot["balls"]:
+            ball: Ball = Ball(paddle)
+            ball.position = pg.math.Vector2(x, y)
+            ball.previous_position = pg.math.Vector2(previous_x, previous_y)
+            ball.rect.center = ball.position
+            ball.velocity = pg.math.Vector2(velocity_x, velocity_y)
+            ball.attached_to_paddle = attached
+            ball.spin = spin
+            ball.angle = angle
+            ball.image = ball.rotation.frame(angle)
+            balls.append(ball)
+            paddle_hits[id(ball)] = paddle_hit
+        game_play.balls[:] = balls  # The list is shared with the collision and input managers
+        game_play.collision.paddle_hit_dict = paddle_hits
+
+        game_play.scoreboard.score = snapshot["score"]
+        game_play.lives.lives = snapshot["lives"]
+        game_play.collision.balls_lost = snapshot.get("balls_lost", 0)  # Absent from older replays
+        game_play.input_handler.active_input_type = snapshot["input_type"]
+        game_play.level_rng.setstate(GameSnapshot.rng_from_state(snapshot["rng"]["level"]))
+        game_play.collision_rng.setstate(GameSnapshot.rng_from_state(snapshot["rng"]["collision"]))
+
+    @staticmethod
+    def rng_state(rng: random.Random) -> List[Any]:
+        """
+        Returns a random source's state as JSON-safe lists.
+
+        Args:
+            rng (random.Random): The random source.
+
+        Returns:
+            List[Any]: [version, internal state, gauss_next].
+        """
+        version, internal, gauss_next = rng.getstate()
+        return [version, list(internal), gauss_next]
+
+    @staticmethod
+    def rng_from_state(state: List[Any]) -> tuple:
+        """
+        Converts the output of rng_state back into a random.Random state.
+
+        Args:
+            state (List[Any]): The stored state.
+
+        Returns:
+            tuple: A state for random.Random.setstate.
+        """
+        version, internal, gauss_next = state
+        return (version, tuple(internal), gauss_next)
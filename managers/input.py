@@ -2,19 +2,25 @@ import pygame as pg
 from settings import Settings
 from objects.paddle import Paddle
 from objects.ball import Ball
-from typing import List
+from typing import List, Optional
+from managers.input_state import InputState
+from managers.live_input_source import LiveInputSource
 
 class InputEvent:
-    def __init__(self, paddle: Paddle, balls: List[Ball]) -> None:
+    def __init__(self, paddle: Paddle, balls: List[Ball], source: Optional[object] = None) -> None:
         """
         Initialize the InputEvent class.
 
         Args:
             paddle (Paddle): The paddle object.
             balls (List[Ball]): List of ball objects.
+            source (Optional[object]): Where controls come from: any object with a poll() -> InputState
+                method. Defaults to the live keyboard and mouse.
         """
         self.paddle = paddle
         self.balls = balls
+        self.source = source if source is not None else LiveInputSource()
+        self.last_state: InputState = InputState()
         self.active_input_type = "mouse"
         self.settings = Settings()
         self.SCREEN_WIDTH: int = self.settings.get("SCREEN_WIDTH")
@@ -23,35 +29,34 @@ class InputEvent:
         """
         Handle the input events.
 
-        This method checks for keyboard and mouse inputs and updates the paddle and ball accordingly.
+        This method polls the input source for keyboard and mouse inputs and updates the paddle and ball accordingly.
         """
-        keys = pg.key.get_pressed()
-        mouse_x, mouse_y = pg.mouse.get_pos()
-        mouse_buttons = pg.mouse.get_pressed()
+        state: InputState = self.source.poll()
+        self.last_state = state
 
-        if keys[pg.K_LEFT] or keys[pg.K_RIGHT] or keys[pg.K_SPACE]:
+        if state.left or state.right or state.launch:
             self.active_input_type = "keyboard"
-        elif mouse_buttons[0]:
+        elif state.pointer_down:
             self.active_input_type = "mouse"
 
         if self.active_input_type == "keyboard":
-            if keys[pg.K_LEFT]:
+            if state.left:
                 self.paddle.move("left")
-            elif keys[pg.K_RIGHT]:
+            elif state.right:
                 self.paddle.move("right")
-            if keys[pg.K_SPACE]:
+            if state.launch:
                 # Launch all attached balls
                 for ball in self.balls:
                     if ball.attached_to_paddle:
                         ball.handle_event(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE))
 
         elif self.active_input_type == "mouse":
-            self.paddle.rect.centerx = mouse_x
+            self.paddle.rect.centerx = state.pointer_x
             if self.paddle.rect.left < 0:
                 self.paddle.rect.left = 0
             if self.paddle.rect.right > self.SCREEN_WIDTH:
                 self.paddle.rect.right = self.SCREEN_WIDTH
-            if mouse_buttons[0]:
+            if state.pointer_down:
                 # Launch all attached balls
                 for ball in self.balls:
                     if ball.attached_to_paddle:
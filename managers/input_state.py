@@ -0,0 +1,44 @@
+class InputState:
+    """
+    A snapshot of the player's controls for one simulation step.
+
+    Attributes:
+        left (bool): Whether the move-left key is held.
+        right (bool): Whether the move-right key is held.
+        launch (bool): Whether the launch key (space) is held.
+        pointer_x (int): The pointer's x-coordinate.
+        pointer_down (bool): Whether the primary pointer button is held.
+    """
+
+    def __init__(self, left: bool = False, right: bool = False, launch: bool = False,
+                 pointer_x: int = 0, pointer_down: bool = False) -> None:
+        """
+        Initializes an InputState.
+
+        Args:
+            left (bool): Whether the move-left key is held.
+            right (bool): Whether the move-right key is held.
+            launch (bool): Whether the launch key (space) is held.
+            pointer_x (int): The pointer's x-coordinate.
+            pointer_down (bool): Whether the primary pointer button is held.
+        """
+        self.left: bool = left
+        self.right: bool = right
+        self.launch: bool = launch
+        self.pointer_x: int = pointer_x
+        self.pointer_down: bool = pointer_down
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares two snapshots field by field.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: True if every control matches.
+        """
+        if not isinstance(other, InputState):
+            return NotImplemented
+        return (self.left, self.right, self.launch, self.pointer_x, self.pointer_down) == \
+            (other.left, other.right, other.launch, other.pointer_x, other.pointer_down)
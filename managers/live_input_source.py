@@ -0,0 +1,19 @@
+import pygame as pg
+from managers.input_state import InputState
+
+class LiveInputSource:
+    """
+    Reads the player's controls from the keyboard and mouse.
+    """
+
+    def poll(self) -> InputState:
+        """
+        Samples the keyboard and mouse.
+
+        Returns:
+            InputState: The controls as they are right now.
+        """
+        keys = pg.key.get_pressed()
+        mouse_x, _ = pg.mouse.get_pos()
+        mouse_buttons = pg.mouse.get_pressed()
+        return InputState(keys[pg.K_LEFT], keys[pg.K_RIGHT], keys[pg.K_SPACE], mouse_x, mouse_buttons[0])
@@ -0,0 +1,239 @@
+import json
+import os
+import struct
+import zlib
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+from settings import Settings
+from managers.input_state import InputState
+
+class Replay:
+    """
+    A recorded game: its starting conditions, the input of every simulation
+    step and periodic state keyframes.
+
+    The starting conditions are the seed of each random subsystem and the
+    settings the simulation reads, so playing the inputs back into a fresh
+    GamePlay repeats the game exactly. Keyframes are GameSnapshot captures
+    taken before a step, letting playback seek without simulating from step 0.
+
+    File layout (little-endian):
+        header     magic, version, level/collision/swarm seeds (HEADER)
+        settings   length, UTF-8 JSON of SIMULATION_SETTINGS
+        inputs     step count, length, zlib-compressed INPUT records
+        keyframes  count, then for each: step and length (KEYFRAME), zlib-compressed JSON
+
+    Attributes:
+        seeds (Dict[str, int]): The seed of each random subsystem, keyed by GamePlay.RNG_SUBSYSTEMS.
+        settings (Dict[str, Any]): The simulation settings at the start of the game.
+        inputs (bytearray): One INPUT record per step.
+        keyframe_steps (List[int]): The step of each keyframe, ascending.
+        keyframes (List[bytes]): The compressed snapshots, in the same order.
+    """
+
+    MAGIC: bytes = b"BBRP"
+    VERSION: int = 1
+    SUBSYSTEMS: Tuple[str, ...] = ("level", "collision", "swarm")
+    SIMULATION_SETTINGS: Tuple[str, ...] = (
+        "DIFFICULTY", "SCREEN_WIDTH", "SCREEN_HEIGHT", "BRICK_SIZE", "PADDLE_SIZE", "PADDLE_SPEED",
+        "BALL_SPEED", "BALL_RADIUS", "MIN_Y_VELOCITY", "MAX_REFLECTION_ANGLE", "BALL_BACKEND",
+        "MOVING_BRICK_CHANCE", "DIFFICULTY_STEP",
+    )
+    HEADER = struct.Struct("<4sHIII")
+    LENGTH = struct.Struct("<I")
+    KEYFRAME = struct.Struct("<II")
+    INPUT = struct.Struct("<Bi")  # Control flags, pointer x
+    LEFT, RIGHT, LAUNCH, POINTER_DOWN = 1, 2, 4, 8
+
+    def __init__(self, seeds: Dict[str, int], settings: Dict[str, Any]) -> None:
+        """
+        Initializes an empty Replay.
+
+        Args:
+            seeds (Dict[str, int]): The seed of each random subsystem.
+            settings (Dict[str, Any]): The simulation settings at the start of the game.
+        """
+        self.seeds: Dict[str, int] = dict(seeds)
+        self.settings: Dict[str, Any] = dict(settings)
+        self.inputs: bytearray = bytearray()
+        self.keyframe_steps: List[int] = []
+        self.keyframes: List[bytes] = []
+
+    @classmethod
+    def start(cls, seeds: Dict[str, int]) -> "Replay":
+        """
+        Starts a replay of a game beginning now with the current settings.
+
+        Args:
+            seeds (Dict[str, int]): The game's random subsystem seeds.
+
+        Returns:
+            Replay: The empty replay.
+        """
+        settings: Settings = Settings()
+        return cls(seeds, {key: settings.get(key) for key in cls.SIMULATION_SETTINGS})
+
+    def __len__(self) -> int:
+        """
+        Returns the number of recorded steps.
+
+        Returns:
+            int: The step count.
+        """
+        return len(self.inputs) // self.INPUT.size
+
+    def append_input(self, state: InputState) -> None:
+        """
+        Records the input of the next step.
+
+        Args:
+            state (InputState): The controls used for the step.
+        """
+        flags: int = (self.LEFT if state.left else 0) | (self.RIGHT if state.right else 0) | \
+            (self.LAUNCH if state.launch else 0) | (self.POINTER_DOWN if state.pointer_down else 0)
+        self.inputs += self.INPUT.pack(flags, state.pointer_x)
+
+    def input_at(self, step: int) -> InputState:
+        """
+        Returns the input recorded for a step.
+
+        Args:
+            step (int): The step index.
+
+        Returns:
+            InputState: The controls used for the step.
+        """
+        flags, pointer_x = self.INPUT.unpack_from(self.inputs, step * self.INPUT.size)
+        return InputState(bool(flags & self.LEFT), bool(flags & self.RIGHT), bool(flags & self.LAUNCH),
+                          pointer_x, bool(flags & self.POINTER_DOWN))
+
+    def add_keyframe(self, step: int, snapshot: Dict[str, Any]) -> None:
+        """
+        Stores a snapshot taken before a step. Keyframes must be added in step order.
+
+        Args:
+            step (int): The step the snapshot precedes.
+            snapshot (Dict[str, Any]): A GameSnapshot capture.
+        """
+        self.keyframe_steps.append(step)
+        self.keyframes.append(zlib.compress(json.dumps(snapshot).encode("utf-8")))
+
+    def keyframe(self, index: int) -> Tuple[int, Dict[str, Any]]:
+        """
+        Returns a stored keyframe.
+
+        Args:
+            index (int): The keyframe's position in keyframe_steps.
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: The step and snapshot.
+        """
+        return self.keyframe_steps[index], json.loads(zlib.decompress(self.keyframes[index]))
+
+    def keyframe_before(self, step: int) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Returns the latest keyframe at or before a step.
+
+        Args:
+            step (int): The step to seek to.
+
+        Returns:
+            Optional[Tuple[int, Dict[str, Any]]]: The keyframe's step and snapshot, or None.
+        """
+        index: int = bisect_right(self.keyframe_steps, step) - 1
+        return self.keyframe(index) if index >= 0 else None
+
+    def apply_settings(self) -> None:
+        """
+        Puts the recorded simulation settings into Settings, in memory only.
+        """
+        settings: Settings = Settings()
+        with settings.lock:
+            settings.settings.update(self.settings)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the replay to its file layout.
+
+        Returns:
+            bytes: The packed replay.
+        """
+        settings_blob: bytes = json.dumps(self.settings).encode("utf-8")
+        input_blob: bytes = zlib.compress(bytes(self.inputs))
+        parts: List[bytes] = [
+            self.HEADER.pack(self.MAGIC, self.VERSION, *(self.seeds[name] for name in self.SUBSYSTEMS)),
+            self.LENGTH.pack(len(settings_blob)), settings_blob,
+            self.LENGTH.pack(len(self)), self.LENGTH.pack(len(input_blob)), input_blob,
+            self.LENGTH.pack(len(self.keyframes)),
+        ]
+        for step, blob in zip(self.keyframe_steps, self.keyframes):
+            parts.append(self.KEYFRAME.pack(step, len(blob)))
+            parts.append(blob)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """
+        Reads a replay from its file layout.
+
+        Args:
+            data (bytes): The packed replay.
+
+        Returns:
+            Replay: The replay.
+
+        Raises:
+            ValueError: If the data is not a replay of a supported version.
+        """
+        magic, version, *seeds = cls.HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Not a Brick Breaker replay, or from an unsupported version")
+        offset: int = cls.HEADER.size
+
+        def read_blob() -> bytes:
+            nonlocal offset
+            (length,) = cls.LENGTH.unpack_from(data, offset)
+            offset += cls.LENGTH.size + length
+            return data[offset - length:offset]
+
+        replay: Replay = cls(dict(zip(cls.SUBSYSTEMS, seeds)), json.loads(read_blob()))
+        (step_count,) = cls.LENGTH.unpack_from(data, offset)
+        offset += cls.LENGTH.size
+        replay.inputs = bytearray(zlib.decompress(read_blob()))
+        if len(replay) != step_count:
+            raise ValueError("Replay input stream is truncated")
+        (keyframe_count,) = cls.LENGTH.unpack_from(data, offset)
+        offset += cls.LENGTH.size
+        for _ in range(keyframe_count):
+            step, length = cls.KEYFRAME.unpack_from(data, offset)
+            offset += cls.KEYFRAME.size + length
+            replay.keyframe_steps.append(step)
+            replay.keyframes.append(data[offset - length:offset])
+        return replay
+
+    def save(self, path: str) -> None:
+        """
+        Writes the replay to a file, creating its directory if needed.
+
+        Args:
+            path (str): The file to write.
+        """
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        """
+        Reads a replay file.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            Replay: The replay.
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
@@ -0,0 +1,108 @@
+import json
+from typing import Any, Dict, Optional
+from managers.input_state import InputState
+from managers.game_snapshot import GameSnapshot
+from managers.replay import Replay
+
+class ReplayPlayer:
+    """
+    Plays a Replay back into a GamePlay as its input source.
+
+    The GamePlay must be created with the replay's seeds after
+    Replay.apply_settings. Each poll returns the recorded input of the next
+    step; at steps with a keyframe the live state is compared against it, and
+    the first mismatch is kept in desync_step.
+
+    Attributes:
+        game_play (Any): The GamePlay being driven.
+        replay (Replay): The recording.
+        position (int): The next step to play.
+        desync_step (Optional[int]): The first keyframe step whose state did not match, or None.
+    """
+
+    def __init__(self, game_play: Any, replay: Replay) -> None:
+        """
+        Attaches a replay to a GamePlay that has not stepped yet.
+
+        Args:
+            game_play (GamePlay): The state to drive; its input handler is routed to the player.
+            replay (Replay): The recording to play.
+        """
+        self.game_play = game_play
+        self.replay: Replay = replay
+        self.position: int = 0
+        self.desync_step: Optional[int] = None
+        self.next_keyframe: int = 0
+        game_play.input_handler.source = self
+
+    @property
+    def finished(self) -> bool:
+        """Whether every recorded step has been played."""
+        return self.position >= len(self.replay)
+
+    def poll(self) -> InputState:
+        """
+        Returns the recorded input of the next step.
+
+        Returns:
+            InputState: The recorded controls, or controls that leave the paddle alone once finished.
+        """
+        if self.finished:
+            return InputState(pointer_x=self.game_play.paddle.rect.centerx)
+        self.verify()
+        state: InputState = self.replay.input_at(self.position)
+        self.position += 1
+        return state
+
+    def verify(self) -> None:
+        """
+        Compares the live state with the keyframe stored for the current step, if any.
+        """
+        steps = self.replay.keyframe_steps
+        while self.next_keyframe < len(steps) and steps[self.next_keyframe] < self.position:
+            self.next_keyframe += 1
+        if self.next_keyframe >= len(steps) or steps[self.next_keyframe] != self.position:
+            return
+        _, expected = self.replay.keyframe(self.next_keyframe)
+        actual: Dict[str, Any] = json.loads(json.dumps(GameSnapshot.capture(self.game_play)))
+        if actual != expected and self.desync_step is None:
+            self.desync_step = self.position
+
+    def seek(self, step: int) -> None:
+        """
+        Moves playback to just before a step.
+
+        The nearest keyframe at or before the step is restored unless simply
+        playing on from the current position is shorter, then the remaining
+        steps are simulated.
+
+        Args:
+            step (int): The step to stop before.
+
+        Raises:
+            ValueError: If seeking backwards and the replay has no keyframe to restore.
+        """
+        step = max(0, min(step, len(self.replay)))
+        keyframe = self.replay.keyframe_before(step)
+        if keyframe is not None and (step < self.position or keyframe[0] > self.position):
+            GameSnapshot.restore(self.game_play, keyframe[1])
+            self.position = keyframe[0]
+            self.next_keyframe = 0
+        elif step < self.position:
+            raise ValueError("This replay has no keyframe to seek back to")
+        self.run_to(step)
+
+    def run_to(self, step: int) -> None:
+        """
+        Simulates until the next step to play is the given one, skipping
+        level banners and waiting for levels built in the background.
+
+        Args:
+            step (int): The step to stop before.
+        """
+        game_play = self.game_play
+        while self.position < min(step, len(self.replay)):
+            if game_play.level_loader.pending:
+                game_play.level_loader.future.result()
+            game_play.level_banner.hide()
+            game_play.fixed_update()
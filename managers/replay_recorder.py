@@ -0,0 +1,59 @@
+from typing import Any, Optional
+from settings import Settings
+from managers.input_state import InputState
+from managers.game_snapshot import GameSnapshot
+from managers.replay import Replay
+
+class ReplayRecorder:
+    """
+    Records a GamePlay into a Replay.
+
+    The recorder sits between the game's input handler and its real input
+    source: every poll is one simulation step, so it stores the polled input
+    and, every keyframe_interval steps, a snapshot of the state before it.
+    Keyframes are skipped with the swarm ball backend, whose replays play back
+    from the start.
+
+    Attributes:
+        game_play (Any): The GamePlay being recorded.
+        source (Any): The input source the recorder forwards to.
+        replay (Replay): The recording so far.
+        keyframe_interval (int): Steps between keyframes.
+    """
+
+    def __init__(self, game_play: Any, keyframe_interval: Optional[int] = None) -> None:
+        """
+        Starts recording a GamePlay that has not stepped yet.
+
+        Args:
+            game_play (GamePlay): The state to record; its input handler is routed through the recorder.
+            keyframe_interval (Optional[int]): Steps between keyframes, or None for REPLAY_KEYFRAME_INTERVAL.
+        """
+        self.game_play = game_play
+        self.source = game_play.input_handler.source
+        self.replay: Replay = Replay.start(game_play.seeds)
+        self.keyframe_interval: int = max(1, keyframe_interval or Settings().get("REPLAY_KEYFRAME_INTERVAL"))
+        game_play.input_handler.source = self
+
+    def poll(self) -> InputState:
+        """
+        Polls the real source and records the step.
+
+        Returns:
+            InputState: The controls for this step, unchanged.
+        """
+        step: int = len(self.replay)
+        if step % self.keyframe_interval == 0 and self.game_play.swarm is None:
+            self.replay.add_keyframe(step, GameSnapshot.capture(self.game_play))
+        state: InputState = self.source.poll()
+        self.replay.append_input(state)
+        return state
+
+    def save(self, path: str) -> None:
+        """
+        Writes the recording so far to a file.
+
+        Args:
+            path (str): The replay file to write.
+        """
+        self.replay.save(path)
@@ -0,0 +1,72 @@
+from typing import Dict, Iterator, List, Sequence, Tuple
+import pygame as pg
+
+class SpatialHash:
+    """
+    A uniform grid broad phase that finds pairs of nearby points.
+
+    Items are bucketed by the cell containing their position. With a cell size
+    equal to the largest contact distance, two items can only touch if they
+    share a cell or sit in neighbouring cells, so only those pairs are yielded.
+
+    Attributes:
+        cell_size (float): The edge length of a grid cell.
+        cells (Dict[Tuple[int, int], List[int]]): Item indices per occupied cell.
+    """
+
+    # Forward neighbours only, so every pair of cells is visited exactly once
+    NEIGHBOUR_OFFSETS: Tuple[Tuple[int, int], ...] = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+    def __init__(self, cell_size: float) -> None:
+        """
+        Initializes a SpatialHash object.
+
+        Args:
+            cell_size (float): The edge length of a grid cell, normally the ball diameter.
+        """
+        self.cell_size: float = max(1.0, float(cell_size))
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def cell_of(self, position: pg.math.Vector2) -> Tuple[int, int]:
+        """
+        Returns the cell containing a position.
+
+        Args:
+            position (pg.math.Vector2): The position to look up.
+
+        Returns:
+            Tuple[int, int]: The (column, row) of the cell.
+        """
+        return int(position.x // self.cell_size), int(position.y // self.cell_size)
+
+    def rebuild(self, positions: Sequence[pg.math.Vector2]) -> None:
+        """
+        Re-buckets all positions. Indices in the yielded pairs refer to this sequence.
+
+        Args:
+            positions (Sequence[pg.math.Vector2]): The positions to index.
+        """
+        self.cells = {}
+        for index, position in enumerate(positions):
+            self.cells.setdefault(self.cell_of(position), []).append(index)
+
+    def candidate_pairs(self) -> Iterator[Tuple[int, int]]:
+        """
+        Yields each pair of indices in the same or adjacent cells once.
+
+        Returns:
+            Iterator[Tuple[int, int]]: Pairs (i, j) with i < j.
+        """
+        cells = self.cells
+        for (col, row), members in cells.items():
+            count: int = len(members)
+            for a in range(count):
+                for b in range(a + 1, count):
+                    yield (members[a], members[b]) if members[a] < members[b] else (members[b], members[a])
+            for offset_col, offset_row in self.NEIGHBOUR_OFFSETS:
+                neighbours = cells.get((col + offset_col, row + offset_row))
+                if not neighbours:
+                    continue
+                for i in members:
+                    for j in neighbours:
+                        yield (i, j) if i < j else (j, i)
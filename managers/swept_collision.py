@@ -0,0 +1,203 @@
+import math
+import pygame as pg
+from typing import List, Optional, Set, Tuple, TYPE_CHECKING
+from objects.brick import Brick
+from objects.moving_brick import MovingBrick
+
+if TYPE_CHECKING:
+    from levels.level import Level
+
+class SweptCollision:
+    """
+    Continuous collision detection for a ball moving through the brick grid.
+
+    The ball's motion during a step is treated as a segment from its previous
+    position to its current one. The grid cells along that segment are visited
+    with a DDA walk, and every brick near those cells is swept against the ball
+    (the brick rect expanded by the ball radius, i.e. a Minkowski sum). Moving
+    bricks are swept in the brick's own frame so their motion during the step
+    counts as well.
+
+    Attributes:
+        level (Level): The level providing the brick lookup.
+        ball_radius (int): The radius used for the swept ball.
+        cell_width (int): The width of a grid cell (brick width).
+        cell_height (int): The height of a grid cell (brick height).
+        reach_x (int): How many neighbouring columns a ball can touch from its centre cell.
+        reach_y (int): How many neighbouring rows a ball can touch from its centre cell.
+    """
+
+    def __init__(self, level: 'Level', ball_radius: int) -> None:
+        """
+        Initializes a SweptCollision object.
+
+        Args:
+            level (Level): The level providing the brick lookup.
+            ball_radius (int): The radius used for the swept ball.
+        """
+        self.level = level
+        self.ball_radius: int = ball_radius
+        self.cell_width: int = level.BRICK_SIZE[0]
+        self.cell_height: int = level.BRICK_SIZE[1]
+        self.reach_x: int = math.ceil(ball_radius / self.cell_width)
+        self.reach_y: int = math.ceil(ball_radius / self.cell_height)
+
+    def traverse_cells(self, start: pg.math.Vector2, end: pg.math.Vector2) -> List[Tuple[int, int]]:
+        """
+        Lists the grid cells crossed by the segment from start to end, in order (DDA walk).
+
+        Args:
+            start (pg.math.Vector2): The start of the segment.
+            end (pg.math.Vector2): The end of the segment.
+
+        Returns:
+            List[Tuple[int, int]]: The (column, row) cells visited by the segment.
+        """
+        col: int = int(start.x // self.cell_width)
+        row: int = int(start.y // self.cell_height)
+        end_col: int = int(end.x // self.cell_width)
+        end_row: int = int(end.y // self.cell_height)
+        cells: List[Tuple[int, int]] = [(col, row)]
+        dx: float = end.x - start.x
+        dy: float = end.y - start.y
+        step_x: int = 1 if dx > 0 else -1
+        step_y: int = 1 if dy > 0 else -1
+        if dx != 0:
+            boundary_x: float = (col + 1) * self.cell_width if dx > 0 else col * self.cell_width
+            t_max_x: float = (boundary_x - start.x) / dx
+            t_delta_x: float = self.cell_width / abs(dx)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dy != 0:
+            boundary_y: float = (row + 1) * self.cell_height if dy > 0 else row * self.cell_height
+            t_max_y: float = (boundary_y - start.y) / dy
+            t_delta_y: float = self.cell_height / abs(dy)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        for _ in range(abs(end_col - col) + abs(end_row - row)):
+            if t_max_x < t_max_y:
+                col += step_x
+                t_max_x += t_delta_x
+            else:
+                row += step_y
+                t_max_y += t_delta_y
+            cells.append((col, row))
+        return cells
+
+    def candidate_bricks(self, start: pg.math.Vector2, end: pg.math.Vector2) -> List[Brick]:
+        """
+        Collects the live bricks a ball travelling from start to end could touch.
+
+        Args:
+            start (pg.math.Vector2): The start of the ball's motion.
+            end (pg.math.Vector2): The end of the ball's motion.
+
+        Returns:
+            List[Brick]: Static bricks near the traversed cells plus moving bricks in the swept rows.
+        """
+        seen: Set[Tuple[int, int]] = set()
+        candidates: List[Brick] = []
+        for col, row in self.traverse_cells(start, end):
+            for cell_row in range(row - self.reach_y, row + self.reach_y + 1):
+                for cell_col in range(col - self.reach_x, col + self.reach_x + 1):
+                    if (cell_col, cell_row) in seen:
+                        continue
+                    seen.add((cell_col, cell_row))
+                    brick = self.level.brick_at(cell_col, cell_row)
+                    if brick is not None:
+                        candidates.append(brick)
+
+        top: float = min(start.y, end.y) - self.ball_radius
+        bottom: float = max(start.y, end.y) + self.ball_radius
+        for brick in self.level.moving_bricks:
+            if not brick.is_destroyed and brick.rect.bottom >= top and brick.rect.top <= bottom:
+                candidates.append(brick)
+        return candidates
+
+    def sweep_brick(self, start: pg.math.Vector2, end: pg.math.Vector2, brick: Brick) -> Optional[Tuple[float, pg.math.Vector2]]:
+        """
+        Sweeps the ball against a single brick using the slab method.
+
+        Args:
+            start (pg.math.Vector2): The start of the ball's motion.
+            end (pg.math.Vector2): The end of the ball's motion.
+            brick (Brick): The brick to test.
+
+        Returns:
+            Optional[Tuple[float, pg.math.Vector2]]: The time of impact along the segment (0.0 - 1.0)
+            and the surface normal, or None if the ball does not reach the brick.
+        """
+        if isinstance(brick, MovingBrick):
+            # Work in the brick's frame: undo the distance it moved during this step
+            start = start + pg.math.Vector2(brick.rect.x - brick.previous_x, 0)
+        box: pg.Rect = brick.rect.inflate(self.ball_radius * 2, self.ball_radius * 2)
+        delta: pg.math.Vector2 = end - start
+        t_near: float = -math.inf
+        t_far: float = math.inf
+        normal = pg.math.Vector2()
+        for axis, low, high in ((0, box.left, box.right), (1, box.top, box.bottom)):
+            if delta[axis] == 0:
+                if not low <= start[axis] <= high:
+                    return None
+                continue
+            t1: float = (low - start[axis]) / delta[axis]
+            t2: float = (high - start[axis]) / delta[axis]
+            if t1 > t2:
+                t1, t2 = t2, t1
+            if t1 > t_near:
+                t_near = t1
+                normal = pg.math.Vector2()
+                normal[axis] = -1 if delta[axis] > 0 else 1
+            t_far = min(t_far, t2)
+        if t_near > t_far or t_far <= 0 or t_near > 1:
+            return None
+        if t_near < 0:
+            # Already overlapping at the start of the step: use the nearest face,
+            # but only if the ball is still moving into the brick
+            normal = self.overlap_normal(start, box)
+            if delta.dot(normal) >= 0:
+                return None
+            return 0.0, normal
+        return t_near, normal
+
+    def overlap_normal(self, position: pg.math.Vector2, box: pg.Rect) -> pg.math.Vector2:
+        """
+        Picks the outward normal of the face closest to a ball that already overlaps a brick.
+
+        Args:
+            position (pg.math.Vector2): The ball centre.
+            box (pg.Rect): The brick rect expanded by the ball radius.
+
+        Returns:
+            pg.math.Vector2: The normal of the face with the smallest penetration.
+        """
+        faces: List[Tuple[float, pg.math.Vector2]] = [
+            (position.x - box.left, pg.math.Vector2(-1, 0)),
+            (box.right - position.x, pg.math.Vector2(1, 0)),
+            (position.y - box.top, pg.math.Vector2(0, -1)),
+            (box.bottom - position.y, pg.math.Vector2(0, 1)),
+        ]
+        return min(faces, key=lambda face: face[0])[1]
+
+    def first_hit(self, start: pg.math.Vector2, end: pg.math.Vector2, ignore: Set[Brick]) -> Optional[Tuple[float, Brick, pg.math.Vector2]]:
+        """
+        Finds the earliest brick contact along the ball's motion.
+
+        Args:
+            start (pg.math.Vector2): The start of the ball's motion.
+            end (pg.math.Vector2): The end of the ball's motion.
+            ignore (Set[Brick]): Bricks already resolved during this step.
+
+        Returns:
+            Optional[Tuple[float, Brick, pg.math.Vector2]]: The time of impact, the brick hit and
+            the surface normal, or None if the path is clear.
+        """
+        best: Optional[Tuple[float, Brick, pg.math.Vector2]] = None
+        for brick in self.candidate_bricks(start, end):
+            if brick in ignore:
+                continue
+            hit = self.sweep_brick(start, end, brick)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = (hit[0], brick, hit[1])
+        return best
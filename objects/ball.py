@@ -1,6 +1,7 @@
 import pygame as pg
 from settings import Settings
 from objects.paddle import Paddle
+from utils.rotation_cache import RotationCache
 
 class Ball(pg.sprite.Sprite):
     def __init__(self, paddle: Paddle) -> None:
@@ -20,13 +21,14 @@ class Ball(pg.sprite.Sprite):
         self.BALL_SPEED: int = self.settings.get("BALL_SPEED")
         self.WHITE: tuple = self.settings.get("WHITE")
         self.BALL_IMG: str = self.settings.get("BALL_IMG")
-        self.original_image = pg.image.load(self.BALL_IMG)
-        self.original_image = pg.transform.scale(self.original_image, (self.BALL_RADIUS * 2, self.BALL_RADIUS * 2))
-        self.image = self.original_image.copy()
+        self.rotation: RotationCache = RotationCache.get(self.BALL_IMG, self.BALL_RADIUS, self.settings.get("ROTATION_STEP"))
+        self.image = self.rotation.frame(0)
         self.color: tuple = self.WHITE
         self.paddle: Paddle = paddle
         self.position = pg.math.Vector2(paddle.rect.centerx, paddle.rect.top - self.BALL_RADIUS)
-        self.rect = self.image.get_rect(center=self.position)
+        self.previous_position = self.position.copy()
+        self.rect = pg.Rect(0, 0, self.BALL_RADIUS * 2, self.BALL_RADIUS * 2)  # Collision box; the image is drawn centred on it
+        self.rect.center = self.position
         self.velocity = pg.math.Vector2(0, 0)
         self.attached_to_paddle: bool = True
         self.spin: int = 5  # Angular velocity, degrees per update cycle
@@ -57,29 +59,37 @@ class Ball(pg.sprite.Sprite):
         Returns:
             None
         """
+        self.previous_position.update(self.position)
         if self.attached_to_paddle:
             self.position.x = self.paddle.rect.centerx
             self.position.y = self.paddle.rect.top - self.BALL_RADIUS
+            # Drawn interpolated in step with the paddle
+            self.previous_position.update(self.paddle.previous_x + self.paddle.rect.width / 2, self.position.y)
         self.position += self.velocity
         self.rect.center = self.position
         # Update spin
         self.spin *= self.angular_friction
-        # Update angle and rotate image only if there's a significant rotation needed
+        # Update angle and pick the pre-rotated frame only if there's a significant rotation needed
         if abs(self.spin) > 0.1:
             self.angle += self.spin  # Increment angle by spin value
-            self.image = pg.transform.rotate(self.original_image, -self.angle)  # Rotate the original image
-            self.rect = self.image.get_rect(center=self.rect.center)  # Reset rect to maintain position
+            self.image = self.rotation.frame(self.angle)
         else:
             self.spin = 0  # Optionally reset spin to zero if too small
 
-    def draw(self, screen) -> None:
+    def draw(self, screen, alpha: float = 1.0) -> pg.Rect:
         """
         Draw the Ball object on the screen.
 
         Args:
             screen: The screen object.
+            alpha (float): Interpolation factor between the previous and current physics step.
+                1.0 draws the ball at its current position.
 
         Returns:
-            None
+            pg.Rect: The area of the screen that was drawn.
         """
-        screen.blit(self.image, self.rect)
+        half_size: int = self.rotation.half_size
+        if alpha >= 1.0:
+            return screen.blit(self.image, (self.rect.centerx - half_size, self.rect.centery - half_size))
+        center = self.previous_position.lerp(self.position, max(0.0, alpha))
+        return screen.blit(self.image, (center.x - half_size, center.y - half_size))
@@ -0,0 +1,373 @@
+import pygame as pg
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from settings import Settings
+from objects.paddle import Paddle
+from objects.brick import Brick
+from objects.swarm_ball import SwarmBall
+from utils.rotation_cache import RotationCache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it the sprite Ball backend is used
+    np = None
+
+if TYPE_CHECKING:
+    from levels.level import Level
+
+class BallSwarm:
+    """
+    A struct-of-arrays ball engine for levels with very many balls.
+
+    Every ball's state lives in contiguous NumPy arrays indexed by slot, and
+    movement and collisions against walls, the paddle and the brick grid are
+    computed for all balls at once. SwarmBall objects give the rest of the game
+    the familiar Ball API on top of a slot.
+
+    Ball-to-ball contacts are not simulated by the swarm.
+
+    Attributes:
+        paddle (Paddle): The paddle balls attach to and bounce off.
+        capacity (int): The number of allocated slots.
+        position (np.ndarray): Ball centres, shape (capacity, 2).
+        previous_position (np.ndarray): Ball centres before the last step, shape (capacity, 2).
+        velocity (np.ndarray): Velocities in pixels per step, shape (capacity, 2).
+        spin (np.ndarray): Angular velocity per ball in degrees per step.
+        angle (np.ndarray): Rotation angle per ball in degrees.
+        attached (np.ndarray): Whether each ball sits on the paddle.
+        alive (np.ndarray): Whether each slot holds a ball.
+        paddle_hit (np.ndarray): Whether each ball is still in contact with the paddle.
+        views (Dict[int, SwarmBall]): The view object for every live slot.
+        rotation (RotationCache): The shared pre-rotated ball frames.
+        image (pg.Surface): The unrotated ball frame.
+    """
+
+    INITIAL_CAPACITY: int = 64
+
+    def __init__(self, paddle: Paddle, seed: Optional[int] = None) -> None:
+        """
+        Initializes a BallSwarm object.
+
+        Args:
+            paddle (Paddle): The paddle balls attach to and bounce off.
+            seed (Optional[int]): Seed for the bounce jitter.
+        """
+        self.settings = Settings()
+        self.SCREEN_WIDTH: int = self.settings.get("SCREEN_WIDTH")
+        self.SCREEN_HEIGHT: int = self.settings.get("SCREEN_HEIGHT")
+        self.BALL_RADIUS: int = self.settings.get("BALL_RADIUS")
+        self.BALL_SPEED: float = self.settings.get("BALL_SPEED")
+        self.MAX_REFLECTION_ANGLE: float = self.settings.get("MAX_REFLECTION_ANGLE")
+        self.MIN_Y_VELOCITY: float = self.settings.get("MIN_Y_VELOCITY")
+        self.angular_friction: float = 0.99
+        self.paddle: Paddle = paddle
+        self.rng = np.random.default_rng(seed)
+        self.rotation: RotationCache = RotationCache.get(self.settings.get("BALL_IMG"), self.BALL_RADIUS, self.settings.get("ROTATION_STEP"))
+        self.image: pg.Surface = self.rotation.frame(0)
+        self.views: Dict[int, SwarmBall] = {}
+        self.grid: Optional['np.ndarray'] = None
+        self.grid_level: Optional['Level'] = None
+        self.grid_version: int = -1
+        self.free_slots: List[int] = []
+        self.capacity: int = 0
+        self.allocate(self.INITIAL_CAPACITY)
+
+    @staticmethod
+    def available() -> bool:
+        """
+        Checks whether the swarm backend can be used.
+
+        Returns:
+            bool: True if NumPy is installed.
+        """
+        return np is not None
+
+    def allocate(self, capacity: int) -> None:
+        """
+        Grows the state arrays to hold at least the given number of balls.
+
+        Args:
+            capacity (int): The new number of slots.
+        """
+        old_capacity: int = self.capacity
+        if capacity <= old_capacity:
+            return
+
+        def grow(array: Optional['np.ndarray'], shape: Tuple[int, ...], dtype: type) -> 'np.ndarray':
+            grown = np.zeros(shape, dtype=dtype)
+            if array is not None:
+                grown[:old_capacity] = array
+            return grown
+
+        self.position = grow(getattr(self, "position", None), (capacity, 2), np.float64)
+        self.previous_position = grow(getattr(self, "previous_position", None), (capacity, 2), np.float64)
+        self.velocity = grow(getattr(self, "velocity", None), (capacity, 2), np.float64)
+        self.spin = grow(getattr(self, "spin", None), (capacity,), np.float64)
+        self.angle = grow(getattr(self, "angle", None), (capacity,), np.float64)
+        self.attached = grow(getattr(self, "attached", None), (capacity,), np.bool_)
+        self.alive = grow(getattr(self, "alive", None), (capacity,), np.bool_)
+        self.paddle_hit = grow(getattr(self, "paddle_hit", None), (capacity,), np.bool_)
+        self.free_slots.extend(range(capacity - 1, old_capacity - 1, -1))
+        self.capacity = capacity
+
+    def spawn(self, x: float, y: float, vx: float = 0.0, vy: float = 0.0, attached: bool = False) -> SwarmBall:
+        """
+        Adds a ball to the swarm.
+
+        Args:
+            x (float): The x-coordinate of the ball centre.
+            y (float): The y-coordinate of the ball centre.
+            vx (float): The horizontal velocity.
+            vy (float): The vertical velocity.
+            attached (bool): Whether the ball starts on the paddle.
+
+        Returns:
+            SwarmBall: A view onto the new ball.
+        """
+        if not self.free_slots:
+            self.allocate(self.capacity * 2)
+        slot: int = self.free_slots.pop()
+        self.position[slot] = (x, y)
+        self.previous_position[slot] = (x, y)
+        self.velocity[slot] = (vx, vy)
+        self.spin[slot] = 5
+        self.angle[slot] = 0
+        self.attached[slot] = attached
+        self.alive[slot] = True
+        self.paddle_hit[slot] = False
+        view = SwarmBall(self, slot)
+        self.views[slot] = view
+        return view
+
+    def spawn_on_paddle(self) -> SwarmBall:
+        """
+        Adds a ball resting on the paddle, like a freshly created Ball.
+
+        Returns:
+            SwarmBall: A view onto the new ball.
+        """
+        return self.spawn(self.paddle.rect.centerx, self.paddle.rect.top - self.BALL_RADIUS, attached=True)
+
+    def release(self, slot: int) -> None:
+        """
+        Removes a ball from the swarm.
+
+        Args:
+            slot (int): The slot of the ball to remove.
+        """
+        if not self.alive[slot]:
+            return
+        self.alive[slot] = False
+        self.attached[slot] = False
+        self.views.pop(slot, None)
+        self.free_slots.append(slot)
+
+    def clear(self) -> None:
+        """
+        Removes every ball from the swarm.
+        """
+        for slot in list(self.views):
+            self.release(slot)
+
+    def integrate(self) -> None:
+        """
+        Moves every ball by one step and advances its spin.
+        """
+        alive = self.alive
+        attached = alive & self.attached
+        self.position[attached] = (self.paddle.rect.centerx, self.paddle.rect.top - self.BALL_RADIUS)
+        self.previous_position[alive] = self.position[alive]
+        self.previous_position[attached, 0] = self.paddle.previous_x + self.paddle.rect.width / 2  # Drawn in step with the paddle
+        self.position[alive] += self.velocity[alive]
+
+        self.spin[alive] *= self.angular_friction
+        spinning = alive & (np.abs(self.spin) > 0.1)
+        self.angle[spinning] += self.spin[spinning]
+        self.spin[alive & ~spinning] = 0
+
+    def bounce(self, mask: 'np.ndarray', normal_x: float, normal_y: float) -> None:
+        """
+        Reflects the selected balls off a surface, mirroring Collision.bounce.
+
+        Args:
+            mask (np.ndarray): The balls to bounce.
+            normal_x (float): The x component of the surface normal.
+            normal_y (float): The y component of the surface normal.
+        """
+        count: int = int(np.count_nonzero(mask))
+        if count == 0:
+            return
+        velocity = self.velocity[mask]
+        along_normal = velocity[:, 0] * normal_x + velocity[:, 1] * normal_y
+        velocity[:, 0] -= 2 * along_normal * normal_x
+        velocity[:, 1] -= 2 * along_normal * normal_y
+
+        # Collision.bounce passes the radian value of the variation to Vector2.rotate (degrees)
+        angle_variation = self.rng.uniform(-5, 5, count)
+        rotation = np.radians(np.radians(angle_variation))
+        cos, sin = np.cos(rotation), np.sin(rotation)
+        rotated_x = velocity[:, 0] * cos - velocity[:, 1] * sin
+        rotated_y = velocity[:, 0] * sin + velocity[:, 1] * cos
+        too_flat = np.abs(rotated_y) < self.MIN_Y_VELOCITY
+        rotated_y[too_flat] = np.where(rotated_y[too_flat] > 0, self.MIN_Y_VELOCITY, -self.MIN_Y_VELOCITY)
+        self.velocity[mask] = np.column_stack((rotated_x, rotated_y))
+        self.spin[mask] += angle_variation * 0.75
+
+    def collide_walls(self) -> List[SwarmBall]:
+        """
+        Bounces balls off the side and top walls and removes balls that reach the bottom.
+
+        Returns:
+            List[SwarmBall]: The balls that fell out of the playfield.
+        """
+        free = self.alive & ~self.attached
+        x = self.position[:, 0]
+        y = self.position[:, 1]
+        radius: int = self.BALL_RADIUS
+
+        left = free & (x - radius <= 0) & (self.velocity[:, 0] < 0)
+        right = free & (x + radius >= self.SCREEN_WIDTH) & (self.velocity[:, 0] > 0)
+        top = free & (y - radius <= 0) & (self.velocity[:, 1] < 0)
+        self.bounce(left, 1, 0)
+        self.bounce(right, -1, 0)
+        self.bounce(top, 0, 1)
+        np.clip(self.position[:, 0], radius + 1, self.SCREEN_WIDTH - radius - 1, out=self.position[:, 0], where=free)
+        self.position[free & (y - radius <= 0), 1] = radius + 1
+
+        lost: List[SwarmBall] = []
+        for slot in np.flatnonzero(free & (y + radius >= self.SCREEN_HEIGHT)):
+            lost.append(self.views[int(slot)])
+            self.release(int(slot))
+        return lost
+
+    def collide_paddle(self) -> None:
+        """
+        Reflects balls that touch the paddle at an angle set by where they hit it.
+        """
+        paddle: pg.Rect = self.paddle.rect
+        free = self.alive & ~self.attached
+        x = self.position[:, 0]
+        y = self.position[:, 1]
+        radius: int = self.BALL_RADIUS
+        touching = free & (x + radius >= paddle.left) & (x - radius <= paddle.right) \
+            & (y + radius >= paddle.top) & (y - radius <= paddle.bottom)
+        hit = touching & ~self.paddle_hit
+        self.paddle_hit[:] = touching
+
+        if not hit.any():
+            return
+        offset = (x[hit] - paddle.centerx) / (paddle.width / 2)
+        reflection_angle = np.radians(offset * self.MAX_REFLECTION_ANGLE)
+        new_vx = np.cos(reflection_angle) * self.BALL_SPEED * np.where(offset > 0, 1, -1)
+        new_vy = -np.sqrt(np.maximum(0, self.BALL_SPEED ** 2 - new_vx ** 2))
+        too_flat = np.abs(new_vy) < self.MIN_Y_VELOCITY
+        new_vy[too_flat] = -self.MIN_Y_VELOCITY
+        self.velocity[hit] = np.column_stack((new_vx, -np.abs(new_vy)))
+
+    def brick_grid(self, level: 'Level') -> 'np.ndarray':
+        """
+        Returns the level's occupancy grid as an array, rebuilt only when the level changed.
+
+        Args:
+            level (Level): The level to index.
+
+        Returns:
+            np.ndarray: The (rows, columns) grid of static brick ids, or Level.EMPTY_CELL.
+        """
+        if self.grid_level is not level or self.grid_version != level.grid_version:
+            self.grid = np.array(level.brick_grid, dtype=np.int32).reshape(level.max_bricks_y, level.max_bricks_x)
+            self.grid_level = level
+            self.grid_version = level.grid_version
+        return self.grid
+
+    def collide_bricks(self, level: 'Level') -> Dict[Brick, SwarmBall]:
+        """
+        Bounces balls off bricks and reports which bricks were hit.
+
+        Static bricks are found by probing the grid cell at the ball's leading edge on each
+        axis. Moving bricks (a handful per level) are tested against all balls at once.
+
+        Args:
+            level (Level): The level holding the bricks.
+
+        Returns:
+            Dict[Brick, SwarmBall]: Each brick hit this step and the first ball that hit it.
+        """
+        free = np.flatnonzero(self.alive & ~self.attached)
+        hits: Dict[Brick, SwarmBall] = {}
+        if free.size == 0:
+            return hits
+        grid = self.brick_grid(level)
+        copied: bool = False
+        cell_width, cell_height = level.BRICK_SIZE
+        radius: int = self.BALL_RADIUS
+        position = self.position[free]
+        velocity = self.velocity[free]
+
+        for axis in (1, 0):
+            probe = position.copy()
+            probe[:, axis] += np.sign(velocity[:, axis]) * radius
+            cols = np.floor(probe[:, 0] / cell_width).astype(np.int64)
+            rows = np.floor(probe[:, 1] / cell_height).astype(np.int64)
+            inside = (rows >= 0) & (rows < grid.shape[0]) & (cols >= 0) & (cols < grid.shape[1])
+            ids = np.full(free.size, -1, dtype=np.int64)
+            ids[inside] = grid[rows[inside], cols[inside]]
+            hit = ids >= 0
+            if not hit.any():
+                continue
+            mask = np.zeros(self.capacity, dtype=np.bool_)
+            mask[free[hit]] = True
+            normal = [0.0, 0.0]
+            normal[axis] = 1.0
+            self.bounce(mask, *normal)
+            if not copied:  # The cached grid mirrors the level, which only changes when hits are resolved
+                grid, copied = grid.copy(), True
+            for slot, brick_id in zip(free[hit].tolist(), ids[hit].tolist()):
+                hits.setdefault(level.bricks_by_id[brick_id], self.views[slot])
+            # An emptied cell stops later probes from hitting the same brick; a static brick fills exactly one cell
+            grid[rows[hit], cols[hit]] = -1
+            velocity = self.velocity[free]
+
+        for brick in level.moving_bricks:
+            if brick.is_destroyed or brick in hits:
+                continue
+            rect: pg.Rect = brick.rect
+            x, y = position[:, 0], position[:, 1]
+            touching = (x + radius >= rect.left) & (x - radius <= rect.right) \
+                & (y + radius >= rect.top) & (y - radius <= rect.bottom)
+            if not touching.any():
+                continue
+            slots = free[touching]
+            penetration_x = np.minimum(x[touching] + radius - rect.left, rect.right - (x[touching] - radius))
+            penetration_y = np.minimum(y[touching] + radius - rect.top, rect.bottom - (y[touching] - radius))
+            for axis, on_axis in ((0, penetration_x < penetration_y), (1, penetration_x >= penetration_y)):
+                mask = np.zeros(self.capacity, dtype=np.bool_)
+                mask[slots[on_axis]] = True
+                normal = [0.0, 0.0]
+                normal[axis] = 1.0
+                self.bounce(mask, *normal)
+            hits[brick] = self.views[int(slots[0])]
+
+        return hits
+
+    def draw(self, screen: pg.Surface, alpha: float = 1.0, doreturn: bool = False) -> List[pg.Rect]:
+        """
+        Draws every ball with a single batched blit call.
+
+        Args:
+            screen (pg.Surface): The surface to draw on.
+            alpha (float): Interpolation factor between the previous and current physics step.
+            doreturn (bool): Whether to collect the drawn areas (for dirty-rect rendering).
+
+        Returns:
+            List[pg.Rect]: The areas drawn, or an empty list unless doreturn is set.
+        """
+        alive = np.flatnonzero(self.alive)
+        if alive.size == 0:
+            return []
+        alpha = min(1.0, max(0.0, alpha))
+        previous = self.previous_position[alive]
+        corners = previous + (self.position[alive] - previous) * alpha - self.rotation.half_size
+        frame_indices = np.rint(self.angle[alive] / self.rotation.angle_step).astype(np.int64) % len(self.rotation.frames)
+        frames: List[pg.Surface] = self.rotation.frames
+        rects = screen.blits([(frames[index], corner) for index, corner in zip(frame_indices.tolist(), corners.tolist())], doreturn=doreturn)
+        return rects if doreturn else []
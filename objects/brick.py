@@ -1,5 +1,6 @@
 import pygame as pg
 from settings import Settings
+from utils.asset_manager import AssetManager
 
 class Brick(pg.sprite.Sprite):
     """
@@ -8,6 +9,8 @@ class Brick(pg.sprite.Sprite):
     Attributes:
         rect (pg.Rect): The rectangular area occupied by the brick.
         is_destroyed (bool): A flag to track if the brick is destroyed.
+        row_index (int): The level row the brick belongs to.
+        brick_id (int): The brick's id in its level's occupancy grid, or -1 if not registered.
 
     Methods:
         __init__(x, y): Initializes a new instance of the Brick class.
@@ -28,12 +31,13 @@ class Brick(pg.sprite.Sprite):
         self.settings = Settings()
         self.BRICK_IMG = self.settings.get("BRICK_IMG")
         self.BRICK_SIZE = self.settings.get("BRICK_SIZE")
-        self.image = pg.image.load(self.BRICK_IMG)
-        self.image = pg.transform.scale(self.image, (self.BRICK_SIZE[0], self.BRICK_SIZE[1]))
+        self.image = AssetManager().image(self.BRICK_IMG, self.BRICK_SIZE)
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
         self.is_destroyed = False
+        self.row_index: int = y // self.BRICK_SIZE[1]
+        self.brick_id: int = -1
 
     def update(self) -> None:
         """
@@ -41,14 +45,17 @@ class Brick(pg.sprite.Sprite):
         """
         pass
 
-    def draw(self, screen: pg.Surface) -> None:
+    def draw(self, screen: pg.Surface) -> pg.Rect:
         """
         Draws the brick on the screen.
 
         Args:
             screen: The surface to draw the brick on.
+
+        Returns:
+            pg.Rect: The area of the screen that was drawn.
         """
-        screen.blit(self.image, self.rect)
+        return screen.blit(self.image, self.rect)
 
     def destroy(self) -> None:
         """
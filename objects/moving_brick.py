@@ -1,7 +1,8 @@
+import random
 import pygame as pg
 from settings import Settings
 from objects.brick import Brick
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from levels.level import Level
@@ -16,16 +17,18 @@ class MovingBrick(Brick):
         level (Level): Reference to the level for collision detection.
         is_frozen (bool): Whether the brick is frozen due to row density.
         collision_cooldown (int): Frames to wait before checking collision again.
+        previous_x (int): The x-coordinate before the latest update, used for swept collisions and interpolated drawing.
 
     Methods:
         __init__(x, y, row_index, level): Initializes a new MovingBrick.
         update(): Updates the brick's position and handles collisions.
+        draw(screen, alpha): Draws the brick between its previous and current position.
         check_wall_collision(): Checks if the brick hits screen boundaries.
         check_potential_collision(): Predicts if brick will collide next frame.
         should_be_frozen(): Determines if brick should freeze based on row density.
     """
 
-    def __init__(self, x: int, y: int, row_index: int, level: 'Level') -> None:
+    def __init__(self, x: int, y: int, row_index: int, level: 'Level', direction: Optional[int] = None) -> None:
         """
         Initializes a new instance of the MovingBrick class.
 
@@ -34,6 +37,7 @@ class MovingBrick(Brick):
             y: The y-coordinate of the top-left corner of the brick.
             row_index: The row this brick belongs to.
             level: Reference to the level for collision detection.
+            direction: 1 to start moving right, -1 for left, or None to pick at random.
         """
         super().__init__(x, y)
         self.settings = Settings()
@@ -44,14 +48,17 @@ class MovingBrick(Brick):
         self.level = level
         self.is_frozen: bool = False
         self.collision_cooldown: int = 0  # Prevent rapid collision toggles
-        # Randomly start moving left or right
-        import random
-        self.velocity *= random.choice([-1, 1])
+        self.previous_x: int = x
+        # Start moving left or right; the level passes a direction from its seeded rng
+        if direction is None:
+            direction = random.choice([-1, 1])
+        self.velocity *= direction
 
     def update(self) -> None:
         """
         Updates the brick's position and handles collisions.
         """
+        self.previous_x = self.rect.x
         if self.is_destroyed:
             return
 
@@ -76,10 +83,28 @@ class MovingBrick(Brick):
             
             # Check collisions with walls
             self.check_wall_collision()
+
+            if self.rect.x != self.previous_x:
+                self.level.move_brick(self, self.previous_x)
         
         # Call parent update for any base class functionality
         super().update()
 
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> pg.Rect:
+        """
+        Draws the brick between its positions before and after the latest update.
+
+        Args:
+            screen: The surface to draw the brick on.
+            alpha: Interpolation factor between the previous and current physics step.
+
+        Returns:
+            pg.Rect: The area of the screen that was drawn.
+        """
+        if alpha >= 1.0:
+            return screen.blit(self.image, self.rect)
+        return screen.blit(self.image, (self.previous_x + (self.rect.x - self.previous_x) * max(0.0, alpha), self.rect.y))
+
     def check_wall_collision(self) -> None:
         """
         Checks if the brick hits screen boundaries and reverses direction.
@@ -100,20 +125,11 @@ class MovingBrick(Brick):
         Returns:
             bool: True if a collision is imminent, False otherwise.
         """
-        if self.row_index not in self.level.brick_rows:
-            return False
-
         # Create a test rect for the next position
-        test_rect = self.rect.copy()
-        test_rect.x += self.velocity
-        
-        for brick in self.level.brick_rows[self.row_index]:
-            if brick is not self and not brick.is_destroyed:
-                # Check if the test position overlaps with another brick
-                if test_rect.colliderect(brick.rect):
-                    return True
-        
-        return False
+        test_rect = self.rect.move(self.velocity, 0)
+
+        # Static and moving neighbours come from the row's sorted interval index
+        return self.level.overlapping_brick(test_rect, self.row_index, self) is not None
 
     def should_be_frozen(self) -> bool:
         """
@@ -123,12 +139,11 @@ class MovingBrick(Brick):
         Returns:
             bool: True if brick should be frozen, False otherwise.
         """
-        if self.row_index not in self.level.brick_rows:
+        if not 0 <= self.row_index < len(self.level.row_alive):
             return False
 
-        # Count active (non-destroyed) bricks in this row
-        active_bricks = sum(1 for brick in self.level.brick_rows[self.row_index] 
-                           if not brick.is_destroyed)
+        # Live (non-destroyed) bricks in this row, maintained by the level
+        active_bricks = self.level.row_alive[self.row_index]
         
         # Get max possible bricks in a row
         max_bricks_in_row = self.level.max_bricks_x
@@ -1,5 +1,6 @@
 import pygame as pg
 from settings import Settings
+from utils.asset_manager import AssetManager
 
 class Paddle(pg.sprite.Sprite):
     def __init__(self) -> None:
@@ -22,14 +23,15 @@ class Paddle(pg.sprite.Sprite):
         self.PADDLE_SPEED: int = self.settings.get("PADDLE_SPEED")
         self.SCREEN_WIDTH: int = self.settings.get("SCREEN_WIDTH")
         self.SCREEN_HEIGHT: int = self.settings.get("SCREEN_HEIGHT")
-        self.original_image: pg.Surface = pg.image.load(self.PADDLE_IMG)
-        self.image: pg.Surface = pg.transform.scale(self.original_image, (self.PADDLE_SIZE[0], self.PADDLE_SIZE[1]))
+        self.original_image: pg.Surface = AssetManager().image(self.PADDLE_IMG)
+        self.image: pg.Surface = AssetManager().image(self.PADDLE_IMG, self.PADDLE_SIZE)
         self.rect: pg.Rect = self.image.get_rect()
         self.rect.x: int = self.SCREEN_WIDTH // 2 - self.PADDLE_SIZE[0] // 2 # type: ignore
         self.rect.y: int = self.SCREEN_HEIGHT - 60 # type: ignore
         self.speed: int = self.PADDLE_SPEED
         self.screen_width: int = self.SCREEN_WIDTH
         self.position_accumulator: int = self.SCREEN_WIDTH // 2
+        self.previous_x: int = self.rect.x  # The x-coordinate at the start of the current step, for interpolated drawing
 
     def move(self, direction: str) -> None:
         """
@@ -58,16 +60,30 @@ class Paddle(pg.sprite.Sprite):
             self.rect.right = self.screen_width
             self.position_accumulator = self.screen_width - self.rect.width
 
-    def draw(self, screen: pg.Surface) -> None:
+    def update(self) -> None:
+        """
+        Remember the paddle's position at the start of a simulation step.
+
+        Returns:
+            None
+        """
+        self.previous_x = self.rect.x
+
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> pg.Rect:
         """
         Draw the paddle on the screen.
 
-        This method blits the paddle image onto the specified screen surface at the current position.
+        This method blits the paddle image onto the specified screen surface,
+        between its positions before and after the latest step.
 
         Args:
             screen (pygame.Surface): The surface on which to draw the paddle.
+            alpha (float): Interpolation factor between the previous and current physics step.
+                1.0 draws the paddle at its current position.
 
         Returns:
-            None
+            pg.Rect: The area of the screen that was drawn.
         """
-        screen.blit(self.image, self.rect)
+        if alpha >= 1.0:
+            return screen.blit(self.image, self.rect)
+        return screen.blit(self.image, (self.previous_x + (self.rect.x - self.previous_x) * max(0.0, alpha), self.rect.y))
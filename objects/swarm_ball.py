@@ -0,0 +1,133 @@
+import pygame as pg
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from objects.ball_swarm import BallSwarm
+
+class SwarmBall:
+    """
+    A thin view onto one slot of a BallSwarm that mirrors the Ball API.
+
+    Position and velocity are stored in the swarm's arrays. Reading them returns
+    a new Vector2, so changes must be assigned back (ball.velocity = v) rather
+    than made in place (ball.velocity.x = 1).
+
+    Attributes:
+        swarm (BallSwarm): The swarm holding this ball's state.
+        slot (int): The index of this ball in the swarm arrays.
+    """
+
+    def __init__(self, swarm: 'BallSwarm', slot: int) -> None:
+        """
+        Initialize the SwarmBall view.
+
+        Args:
+            swarm (BallSwarm): The swarm holding this ball's state.
+            slot (int): The index of this ball in the swarm arrays.
+        """
+        self.swarm = swarm
+        self.slot: int = slot
+        self.paddle = swarm.paddle
+        self.BALL_RADIUS: int = swarm.BALL_RADIUS
+        self.BALL_SPEED: float = swarm.BALL_SPEED
+
+    @property
+    def position(self) -> pg.math.Vector2:
+        """The ball centre."""
+        return pg.math.Vector2(*self.swarm.position[self.slot])
+
+    @position.setter
+    def position(self, value: pg.math.Vector2) -> None:
+        self.swarm.position[self.slot] = (value[0], value[1])
+
+    @property
+    def previous_position(self) -> pg.math.Vector2:
+        """The ball centre before the last step."""
+        return pg.math.Vector2(*self.swarm.previous_position[self.slot])
+
+    @previous_position.setter
+    def previous_position(self, value: pg.math.Vector2) -> None:
+        self.swarm.previous_position[self.slot] = (value[0], value[1])
+
+    @property
+    def velocity(self) -> pg.math.Vector2:
+        """The ball velocity in pixels per step."""
+        return pg.math.Vector2(*self.swarm.velocity[self.slot])
+
+    @velocity.setter
+    def velocity(self, value: pg.math.Vector2) -> None:
+        self.swarm.velocity[self.slot] = (value[0], value[1])
+
+    @property
+    def spin(self) -> float:
+        """Angular velocity in degrees per step."""
+        return float(self.swarm.spin[self.slot])
+
+    @spin.setter
+    def spin(self, value: float) -> None:
+        self.swarm.spin[self.slot] = value
+
+    @property
+    def angle(self) -> float:
+        """Current rotation angle in degrees."""
+        return float(self.swarm.angle[self.slot])
+
+    @angle.setter
+    def angle(self, value: float) -> None:
+        self.swarm.angle[self.slot] = value
+
+    @property
+    def attached_to_paddle(self) -> bool:
+        """Whether the ball is waiting on the paddle to be launched."""
+        return bool(self.swarm.attached[self.slot])
+
+    @attached_to_paddle.setter
+    def attached_to_paddle(self, value: bool) -> None:
+        self.swarm.attached[self.slot] = value
+
+    @property
+    def rect(self) -> pg.Rect:
+        """The ball's bounding rect (a copy)."""
+        x, y = self.swarm.position[self.slot]
+        size: int = self.BALL_RADIUS * 2
+        return pg.Rect(int(x) - self.BALL_RADIUS, int(y) - self.BALL_RADIUS, size, size)
+
+    @property
+    def image(self) -> pg.Surface:
+        """The shared pre-rotated frame for the ball's current angle."""
+        return self.swarm.rotation.frame(self.angle)
+
+    def handle_event(self, event: pg.event.Event) -> None:
+        """
+        Launch the ball on space or mouse click, like Ball.handle_event.
+
+        Args:
+            event (pg.event.Event): The event object.
+        """
+        if (event.type == pg.KEYDOWN and event.key == pg.K_SPACE or
+        event.type == pg.MOUSEBUTTONDOWN) and self.attached_to_paddle:
+            screen_width: int = self.swarm.SCREEN_WIDTH
+            paddle_center_relative = (self.paddle.rect.centerx - screen_width / 2) / (screen_width / 2)
+            initial_angle = (paddle_center_relative * 45) + 90
+            self.velocity = pg.math.Vector2(self.BALL_SPEED, 0).rotate(-initial_angle)
+            self.attached_to_paddle = False
+
+    def update(self) -> None:
+        """
+        Does nothing; the swarm integrates all of its balls at once in BallSwarm.integrate.
+        """
+        pass
+
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> pg.Rect:
+        """
+        Draw this ball on its own. Prefer BallSwarm.draw for many balls.
+
+        Args:
+            screen (pg.Surface): The surface to draw on.
+            alpha (float): Interpolation factor between the previous and current physics step.
+
+        Returns:
+            pg.Rect: The area of the screen that was drawn.
+        """
+        center = self.previous_position.lerp(self.position, min(1.0, max(0.0, alpha)))
+        return screen.blit(self.image, self.image.get_rect(center=center))
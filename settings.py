@@ -1,10 +1,18 @@
+import atexit
 import json
 import os
-from typing import Dict, List, Union
+import threading
+from typing import Dict, List, Optional, Union
+from utils.asset_manifest import AssetManifest
 
 class Settings:
     """
     A class that manages the game settings.
+
+    With SETTINGS_WRITE_BEHIND enabled, set() only updates the in-memory settings
+    and marks them dirty; a background timer writes them out SETTINGS_FLUSH_DELAY
+    seconds later, so a burst of changes costs one write. flush() writes pending
+    changes immediately and runs at exit.
     """
 
     _instance = None # Singleton instance of the Settings class
@@ -37,11 +45,16 @@ class Settings:
         "PADDLE_IMAGES": ["img/paddle.png"],
         "PLAYER_SCORE": 0,
         "FPS": 240,
+        "PHYSICS_HZ": 240,
+        "MAX_SUBSTEPS": 8,
+        "DIRTY_RECT_RENDERING": False,
         "PADDLE_SPEED": 25,
         "PADDLE_SIZE": [100, 20],
         "BALL_SPEED": 2,
         "MOVING_BRICK_SPEED": 3,
+        "MOVING_BRICK_CHANCE": 0.15,
         "DIFFICULTY": 1,
+        "DIFFICULTY_STEP": 0.2,
         "VOLUME": 0.5,
         "WHITE": [255, 255, 255],
         "GRAY": [128, 128, 128],
@@ -52,6 +65,24 @@ class Settings:
         "MAX_REFLECTION_ANGLE": 90,
         "MIN_Y_VELOCITY": -1.5,
         "BALL_RADIUS": 15,
+        "BALL_BACKEND": "sprite",
+        "ROTATION_STEP": 3,
+        "ASSET_CACHE_MB": 64,
+        "ASSET_BUNDLE": "assets.bundle",
+        "LEADERBOARD_DB": "leaderboard.db",
+        "LEADERBOARD_SIZE": 10,
+        "TEXT_CACHE_SIZE": 256,
+        "SETTINGS_WRITE_BEHIND": True,
+        "SETTINGS_FLUSH_DELAY": 0.5,
+        "THUMBNAIL_CACHE_DIR": "thumbnails",
+        "THUMBNAIL_CACHE_SIZE": 24,
+        "AUTOPILOT_SPEED": 0,
+        "RECORD_REPLAYS": False,
+        "REPLAY_DIR": "replays",
+        "REPLAY_KEYFRAME_INTERVAL": 1200,
+        "PROFILER_ENABLED": False,
+        "PROFILER_FRAMES": 600,
+        "PROFILE_DIR": "profiles",
         "BALL_IMG": "img/future_ball.png",
         "PADDLE_IMG": "img/paddle.png",
         "BRICK_IMG": "img/brick_img.png",
@@ -77,7 +108,9 @@ class Settings:
             cls._instance = super(Settings, cls).__new__(cls)
             cls._instance.filename = filename
             cls._instance.settings = cls._instance.load()
+            cls._instance.init_persistence()
             cls._instance.populate_image_lists()
+            atexit.register(cls._instance.flush)
         return cls._instance
 
     def load(self) -> Dict[str, Union[int, str, List[str], List[int]]]:
@@ -97,12 +130,56 @@ class Settings:
         except FileNotFoundError:
             return self.defaults
 
+    def init_persistence(self) -> None:
+        """
+        Set up the write-behind state from the loaded settings.
+        """
+        self.lock: threading.RLock = threading.RLock()
+        self.write_lock: threading.Lock = threading.Lock()
+        self.dirty: bool = False
+        self.flush_timer: Optional[threading.Timer] = None
+        self.write_behind: bool = bool(self.get("SETTINGS_WRITE_BEHIND"))
+        self.flush_delay: float = float(self.get("SETTINGS_FLUSH_DELAY"))
+        self.persistent: bool = True  # False keeps changes in memory only, e.g. for headless runs
+
     def save(self) -> None:
         """
         Save the settings to the settings file.
+
+        The settings are written to a temporary file which then replaces the
+        settings file, so a crash mid-write never leaves a truncated file behind.
+        """
+        with self.write_lock:
+            with self.lock:
+                data: str = json.dumps(self.settings, indent=4)
+                self.dirty = False
+            temp_filename: str = self.filename + ".tmp"
+            with open(temp_filename, "w") as file:
+                file.write(data)
+            os.replace(temp_filename, self.filename)
+
+    def mark_dirty(self) -> None:
+        """
+        Schedule a background save unless one is already pending.
         """
-        with open(self.filename, "w") as file:
-            json.dump(self.settings, file, indent=4)
+        with self.lock:
+            self.dirty = True
+            if self.flush_timer is None:
+                self.flush_timer = threading.Timer(self.flush_delay, self.flush)
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
+
+    def flush(self) -> None:
+        """
+        Write pending changes to the settings file now.
+        """
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            if not self.dirty:
+                return
+        self.save()
 
     def get(self, key: str) -> Union[int, str, List[str], List[int]]:
         """
@@ -124,30 +201,33 @@ class Settings:
             key (str): The key of the setting.
             value (Union[int, str, List[str], List[int]]): The value to set.
         """
-        self.settings[key] = value
-        self.save()
-        self.settings = self.load()
+        with self.lock:
+            self.settings[key] = value
+        if not self.persistent:
+            return
+        if self.write_behind:
+            self.mark_dirty()
+        else:
+            self.save()
 
     def populate_image_lists(self) -> Dict[str, Union[int, str, List[str], List[int]]]:
         """
         Populate the image lists with the files in the 'img' directory.
 
+        The directory contents come from the cached asset manifest, which only
+        rescans directories that changed since the last start. The settings file
+        is only rewritten when a list actually changed.
+
         Returns:
             dict: The updated settings.
         """
-        self.settings["BALL_IMAGES"] = []
-        self.settings["PADDLE_IMAGES"] = []
-        self.settings["BACKGROUND_IMAGES"] = []
-        self.settings["BRICK_IMAGES"] = []
-        for root, dirs, files in os.walk("img"):
-            for file in files:
-                if "ball" in root:
-                    self.settings["BALL_IMAGES"].append(os.path.join(root, file))
-                elif "paddle" in root:
-                    self.settings["PADDLE_IMAGES"].append(os.path.join(root, file))
-                elif "background" in root:
-                    self.settings["BACKGROUND_IMAGES"].append(os.path.join(root, file))
-                elif "brick" in root:
-                    self.settings["BRICK_IMAGES"].append(os.path.join(root, file))
-        self.save()
-        return self.settings
\ No newline at end of file
+        manifest = AssetManifest("img")
+        manifest.refresh()
+        changed: bool = not os.path.exists(self.filename)
+        for key, images in manifest.image_lists().items():
+            if self.settings.get(key) != images:
+                self.settings[key] = images
+                changed = True
+        if changed:
+            self.save()
+        return self.settings
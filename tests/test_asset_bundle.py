@@ -0,0 +1,91 @@
+import os
+import pygame as pg
+import pytest
+from settings import Settings
+from utils.asset_bundle import AssetBundle, referenced_variants
+from utils.asset_manager import AssetManager
+
+
+@pytest.fixture()
+def assets():
+    manager = AssetManager()
+    bundle = manager.bundle
+    manager.clear()
+    yield manager
+    manager.bundle = bundle
+    manager.clear()
+
+
+def save_image(tmp_path, name: str) -> str:
+    image = pg.Surface((6, 4), pg.SRCALPHA)
+    image.fill((200, 40, 10, 128))
+    image.set_at((0, 0), (1, 2, 3, 255))
+    path = str(tmp_path / name)
+    pg.image.save(image, path)
+    return path
+
+
+def test_bundled_variants_match_decoded_ones(assets, tmp_path) -> None:
+    path = save_image(tmp_path, "sprite.png")
+    variants = [(path, None, True), (path, (12, 8), True), (path, (3, 2), False)]
+    bundle_path = str(tmp_path / "assets.bundle")
+
+    assert AssetBundle.build(bundle_path, variants + variants[:1]) == 3
+
+    bundle = AssetBundle(bundle_path)
+    for key in variants:
+        assert key in bundle
+        mapped, decoded = bundle.surface(key), assets.image(*key)
+        assert mapped.get_size() == decoded.get_size()
+        assert pg.image.tobytes(mapped, "RGBA") == pg.image.tobytes(decoded, "RGBA")
+    assert bundle.surface((path, (5, 5), True)) is None
+
+
+def test_asset_manager_serves_bundled_variants_without_the_source(assets, tmp_path) -> None:
+    path = save_image(tmp_path, "sprite.png")
+    bundle_path = str(tmp_path / "assets.bundle")
+    AssetBundle.build(bundle_path, [(path, (12, 8), True)])
+    os.remove(path)
+
+    assets.bundle = AssetBundle.open(bundle_path)
+    image = assets.image(path, (12, 8))
+
+    assert image.get_size() == (12, 8)
+    assert image.get_at((0, 0)) == (1, 2, 3, 255)
+    with pytest.raises(FileNotFoundError):
+        assets.image(path, (5, 5))
+
+
+def test_changed_sources_are_decoded_instead_of_served_from_the_bundle(assets, tmp_path) -> None:
+    path = save_image(tmp_path, "sprite.png")
+    bundle_path = str(tmp_path / "assets.bundle")
+    AssetBundle.build(bundle_path, [(path, (12, 8), True)])
+    built_at = os.stat(path).st_mtime_ns
+    image = pg.Surface((6, 4), pg.SRCALPHA)
+    image.fill((9, 99, 199, 255))
+    pg.image.save(image, path)
+    os.utime(path, ns=(built_at + 10**9, built_at + 10**9))
+
+    assets.bundle = AssetBundle.open(bundle_path)
+
+    assert assets.bundle.surface((path, (12, 8), True)) is None
+    assert assets.image(path, (12, 8)).get_at((0, 0)) == (9, 99, 199, 255)
+
+
+def test_open_ignores_missing_and_foreign_files(tmp_path) -> None:
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"not a bundle at all")
+
+    assert AssetBundle.open(str(tmp_path / "missing.bundle")) is None
+    assert AssetBundle.open(str(other)) is None
+
+
+def test_referenced_variants_follow_the_settings() -> None:
+    settings = Settings()
+    selected = referenced_variants(selected_only=True)
+    everything = referenced_variants()
+
+    background = (settings.get("BACKGROUND_IMG"), (settings.get("SCREEN_WIDTH"), settings.get("SCREEN_HEIGHT")), False)
+    assert background in selected
+    assert set(selected) < set(everything)
+    assert len(everything) == len(set(everything))
@@ -0,0 +1,65 @@
+import pygame as pg
+import pytest
+from objects.brick import Brick
+from utils.asset_manager import AssetManager
+
+
+@pytest.fixture()
+def assets():
+    manager = AssetManager()
+    budget = manager.budget_bytes
+    manager.clear()
+    yield manager
+    manager.budget_bytes = budget
+    manager.clear()
+
+
+def save_image(tmp_path, name: str, size=(8, 8)) -> str:
+    path = str(tmp_path / name)
+    pg.image.save(pg.Surface(size, pg.SRCALPHA), path)
+    return path
+
+
+def test_bricks_share_one_surface(assets) -> None:
+    first, second = Brick(0, 0), Brick(50, 0)
+
+    assert first.image is second.image
+    assert assets.stats()["hits"] >= 1
+
+
+def test_variants_are_decoded_once(assets, tmp_path) -> None:
+    path = save_image(tmp_path, "sprite.png")
+
+    scaled = assets.image(path, (4, 4))
+    assert scaled.get_size() == (4, 4)
+    assert assets.image(path, (4, 4)) is scaled
+    assert assets.image(path) is not scaled
+    assert assets.stats()["entries"] == 2
+
+
+def test_scaled_requests_do_not_cache_the_original(assets, tmp_path) -> None:
+    path = save_image(tmp_path, "background.png", (32, 16))
+
+    assets.image(path, (8, 4), alpha=False)
+    assets.image(path, (16, 8), alpha=False)
+
+    assert assets.stats()["entries"] == 2
+    assert (path, None, False) not in assets.cache
+    assert assets.stats()["bytes"] == 8 * 4 * 4 + 16 * 8 * 4
+
+
+def test_least_recently_used_is_evicted_over_budget(assets, tmp_path) -> None:
+    first = save_image(tmp_path, "first.png")
+    second = save_image(tmp_path, "second.png")
+    third = save_image(tmp_path, "third.png")
+    assets.budget_bytes = AssetManager.surface_bytes(assets.image(first)) * 2
+
+    assets.image(second)
+    assets.image(first)
+    assets.image(third)
+
+    stats = assets.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= assets.budget_bytes
+    assert (second, None, True) not in assets.cache
+    assert (first, None, True) in assets.cache
@@ -0,0 +1,50 @@
+import os
+import pygame as pg
+from utils.asset_manifest import AssetManifest
+
+
+def make_tree(tmp_path) -> str:
+    root = tmp_path / "img"
+    for folder in ("balls", "bricks", "tab_img"):
+        (root / folder).mkdir(parents=True)
+    pg.image.save(pg.Surface((12, 7)), str(root / "balls" / "red.png"))
+    pg.image.save(pg.Surface((100, 20)), str(root / "bricks" / "brick.png"))
+    pg.image.save(pg.Surface((5, 5)), str(root / "tab_img" / "tab.png"))
+    return str(root)
+
+
+def test_refresh_records_files_and_groups_image_lists(tmp_path) -> None:
+    root = make_tree(tmp_path)
+    manifest = AssetManifest(root, str(tmp_path / "manifest.json"))
+
+    assert manifest.refresh()
+
+    record = manifest.directories[os.path.join(root, "balls")]["files"]["red.png"]
+    assert (record["width"], record["height"]) == (12, 7)
+    lists = manifest.image_lists()
+    assert lists["BALL_IMAGES"] == [os.path.join(root, "balls", "red.png")]
+    assert lists["BRICK_IMAGES"] == [os.path.join(root, "bricks", "brick.png")]
+    assert lists["PADDLE_IMAGES"] == []
+
+
+def test_reload_only_rescans_changed_directories(tmp_path) -> None:
+    root = make_tree(tmp_path)
+    AssetManifest(root, str(tmp_path / "manifest.json")).refresh()
+
+    manifest = AssetManifest(root, str(tmp_path / "manifest.json"))
+    assert not manifest.refresh()
+    assert manifest.rescanned == []
+
+    balls = os.path.join(root, "balls")
+    pg.image.save(pg.Surface((3, 3)), os.path.join(balls, "blue.png"))
+    os.utime(balls, (0, os.stat(balls).st_mtime + 5))
+
+    assert manifest.refresh()
+    assert manifest.rescanned == [balls]
+    assert len(manifest.image_lists()["BALL_IMAGES"]) == 2
+
+
+def test_image_size_reads_webp_headers() -> None:
+    vp8x = b"RIFF\x00\x00\x00\x00WEBPVP8X" + bytes(8) + (799).to_bytes(3, "little") + (599).to_bytes(3, "little")
+    assert AssetManifest.image_size(vp8x) == (800, 600)
+    assert AssetManifest.image_size(b"not an image") == (None, None)
@@ -0,0 +1,72 @@
+import pytest
+import pygame as pg
+from objects.paddle import Paddle
+from objects.brick import Brick
+from levels.level import Level
+
+np = pytest.importorskip("numpy")
+from objects.ball_swarm import BallSwarm
+from game.game_play import GamePlay
+from game.headless_runner import HeadlessGame
+from settings import Settings
+
+
+def test_swarm_view_matches_ball_api() -> None:
+    swarm = BallSwarm(Paddle(), seed=1)
+    ball = swarm.spawn_on_paddle()
+    ball.handle_event(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE))
+
+    swarm.integrate()
+
+    assert ball.attached_to_paddle is False
+    assert ball.velocity.y < 0
+    assert ball.position == ball.previous_position + ball.velocity
+
+
+def test_swarm_removes_balls_below_screen_and_grows() -> None:
+    swarm = BallSwarm(Paddle(), seed=1)
+    balls = [swarm.spawn(100, 100, 0, 1) for _ in range(BallSwarm.INITIAL_CAPACITY + 1)]
+    lost = swarm.spawn(100, swarm.SCREEN_HEIGHT, 0, 2)
+
+    assert swarm.capacity > BallSwarm.INITIAL_CAPACITY
+    assert swarm.collide_walls() == [lost]
+    assert len(swarm.views) == len(balls)
+
+
+def test_swarm_destroys_brick_in_path() -> None:
+    level = Level(0)
+    level.clear_bricks()
+    brick = Brick(100, 0)
+    level.add_brick(brick, 0)
+    swarm = BallSwarm(Paddle(), seed=1)
+    ball = swarm.spawn(brick.rect.centerx, brick.rect.bottom + swarm.BALL_RADIUS - 1, 0, -2)
+
+    hits = swarm.collide_bricks(level)
+
+    assert hits == {brick: ball}
+    assert ball.velocity.y > 0
+
+
+def test_swarm_brick_hits_leave_the_cached_grid_to_the_level() -> None:
+    level = Level(0)
+    level.clear_bricks()
+    brick = Brick(100, 0)
+    level.add_brick(brick, 0)
+    swarm = BallSwarm(Paddle(), seed=1)
+    first = swarm.spawn(brick.rect.centerx - 5, brick.rect.bottom + swarm.BALL_RADIUS - 1, 0, -2)
+    swarm.spawn(brick.rect.centerx + 5, brick.rect.bottom + swarm.BALL_RADIUS - 1, 0, -2)
+
+    hits = swarm.collide_bricks(level)
+
+    assert hits == {brick: first}
+    assert swarm.grid[0, brick.rect.x // level.BRICK_SIZE[0]] == brick.brick_id
+
+
+def test_swarm_backend_without_numpy_warns_and_uses_sprites(monkeypatch) -> None:
+    monkeypatch.setitem(Settings().settings, "BALL_BACKEND", "swarm")
+    monkeypatch.setattr(BallSwarm, "available", staticmethod(lambda: False))
+
+    with pytest.warns(RuntimeWarning, match="NumPy"):
+        game_play = GamePlay(HeadlessGame(), {"level": 1, "collision": 2, "swarm": 3})
+
+    assert game_play.swarm is None
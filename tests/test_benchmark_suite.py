@@ -0,0 +1,26 @@
+from benchmarks.suite import compare, run_suite
+from settings import Settings
+
+
+def test_compare_flags_cases_slower_than_the_threshold() -> None:
+    baseline = {"results": {"a": {"best_us": 100.0}, "b": {"best_us": 100.0}, "c": {"best_us": 100.0}, "gone": {"best_us": 1.0}}}
+    current = {"results": {"a": {"best_us": 120.0}, "b": {"best_us": 105.0}, "c": {"best_us": 50.0}}}
+
+    rows = {row["name"]: row for row in compare(baseline, current, threshold=0.15)}
+
+    assert rows["a"]["status"] == "regressed"
+    assert rows["b"]["status"] == "ok"
+    assert rows["c"]["status"] == "improved"
+    assert "gone" not in rows
+
+
+def test_suite_runs_selected_cases_without_changing_settings() -> None:
+    settings = Settings()
+    before = dict(settings.settings)
+
+    results = run_suite("generate_brick_map[difficulty=8]", repeats=1)
+
+    assert list(results["results"]) == ["level.generate_brick_map[difficulty=8]"]
+    assert results["results"]["level.generate_brick_map[difficulty=8]"]["best_us"] > 0
+    assert settings.settings == before
+    assert settings.persistent
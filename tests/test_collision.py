@@ -5,6 +5,7 @@ from objects.paddle import Paddle
 from objects.brick import Brick
 from levels.level import Level
 from managers.collision import Collision
+from managers.spatial_hash import SpatialHash
 
 
 class DummyScoreboard:
@@ -20,12 +21,10 @@ class DummyLives:
 def make_collision_with_custom_level(screen: pg.Surface) -> Collision:
     paddle = Paddle()
     level = Level(0)
-    level.bricks = pg.sprite.Group()
-    level.brick_rows = {0: []}
+    level.clear_bricks()
     # Place a single brick in row 0
     brick = Brick(100, 0)
-    level.bricks.add(brick)
-    level.brick_rows[0].append(brick)
+    level.add_brick(brick, 0)
 
     balls = [Ball(paddle)]
     balls[0].attached_to_paddle = False
@@ -37,19 +36,55 @@ def make_collision_with_custom_level(screen: pg.Surface) -> Collision:
     return collision
 
 
+def placed_brick(collision: Collision) -> Brick:
+    return collision.level.brick_at(100 // collision.level.BRICK_SIZE[0], 0)
+
+
 def test_brick_collision_removes_brick(screen: pg.Surface) -> None:
     collision = make_collision_with_custom_level(screen)
-    brick = list(collision.level.brick_rows[0])[0]
+    brick = placed_brick(collision)
     ball = collision.balls[0]
 
     collision.check_brick_collision(ball)
 
     assert brick.is_destroyed is True
     assert brick not in collision.level.bricks
-    assert brick not in collision.level.brick_rows[0]
+    assert placed_brick(collision) is None
+    assert collision.level.row_alive[0] == 0
     assert collision.scoreboard.score == 10
 
 
+def test_fast_ball_does_not_tunnel_through_brick(screen: pg.Surface) -> None:
+    collision = make_collision_with_custom_level(screen)
+    brick = placed_brick(collision)
+    ball = collision.balls[0]
+    # One step that starts below the brick and ends far above it
+    ball.previous_position = pg.math.Vector2(brick.rect.centerx, 200)
+    ball.position = pg.math.Vector2(brick.rect.centerx, -100)
+    ball.velocity = pg.math.Vector2(0, -300)
+
+    collision.check_brick_collision(ball)
+
+    assert brick.is_destroyed is True
+    assert ball.velocity.y > 0
+    assert ball.position.y > brick.rect.bottom
+
+
+def test_swept_collision_resolves_bricks_in_impact_order(screen: pg.Surface) -> None:
+    collision = make_collision_with_custom_level(screen)
+    level = collision.level
+    near = Brick(100, 100)
+    far = Brick(300, 100)
+    level.add_brick(near, 5)
+    level.add_brick(far, 5)
+    start = pg.math.Vector2(50, 110)
+    hit = collision.swept_collision.first_hit(start, pg.math.Vector2(450, 110), set())
+
+    assert hit is not None
+    assert hit[1] is near
+    assert hit[2] == pg.math.Vector2(-1, 0)
+
+
 def test_ball_ball_collision_preserves_speed(screen: pg.Surface) -> None:
     paddle = Paddle()
     level = Level(0)
@@ -87,3 +122,13 @@ def test_check_ball_stuck_pushes_off_top(screen: pg.Surface) -> None:
 
     assert ball.rect.top >= 0
     assert ball.velocity.y >= collision.MIN_Y_VELOCITY
+
+
+def test_spatial_hash_yields_only_nearby_pairs() -> None:
+    grid = SpatialHash(30)
+    positions = [pg.math.Vector2(10, 10), pg.math.Vector2(35, 10), pg.math.Vector2(500, 500)]
+    grid.rebuild(positions)
+
+    pairs = set(grid.candidate_pairs())
+
+    assert pairs == {(0, 1)}
@@ -0,0 +1,57 @@
+import pygame as pg
+from levels.level import Level
+from objects.brick import Brick
+from utils.dirty_rect_renderer import DirtyRectRenderer
+
+
+def make_level() -> Level:
+    level = Level(0)
+    level.clear_bricks()
+    level.add_brick(Brick(0, 0), 0)
+    return level
+
+
+def test_first_frame_is_full_then_only_drawn_areas(screen) -> None:
+    background = pg.Surface(screen.get_size())
+    background.fill((10, 20, 30))
+    renderer = DirtyRectRenderer(screen, background)
+    level = make_level()
+    sprite = pg.Surface((10, 10))
+
+    renderer.begin_frame(level)
+    renderer.mark(screen.blit(sprite, (100, 300)))
+    assert renderer.end_frame() == [screen.get_rect()]
+
+    renderer.begin_frame(level)
+    renderer.mark(screen.blit(sprite, (104, 300)))
+    dirty = renderer.end_frame()
+
+    assert dirty == [pg.Rect(100, 300, 10, 10), pg.Rect(104, 300, 10, 10)]
+    assert screen.get_at((101, 305)) == background.get_at((101, 305))
+
+
+def test_destroyed_brick_is_erased_from_the_backdrop(screen) -> None:
+    background = pg.Surface(screen.get_size())
+    background.fill((10, 20, 30))
+    renderer = DirtyRectRenderer(screen, background)
+    level = make_level()
+    brick = level.bricks_by_id[0]
+
+    renderer.begin_frame(level)
+    renderer.end_frame()
+    level.remove_brick(brick)
+    renderer.begin_frame(level)
+    dirty = renderer.end_frame()
+
+    assert dirty == [brick.rect]
+    assert renderer.backdrop.get_at(brick.rect.center) == background.get_at(brick.rect.center)
+    assert screen.get_at(brick.rect.center) == background.get_at(brick.rect.center)
+    assert level.destroyed_rects == []
+
+
+def test_destroyed_bricks_are_only_tracked_for_a_renderer() -> None:
+    level = make_level()
+
+    level.remove_brick(level.bricks_by_id[0])
+
+    assert level.destroyed_rects == []
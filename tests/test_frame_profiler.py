@@ -0,0 +1,79 @@
+import csv
+import json
+import pytest
+from utils.frame_profiler import NULL_STAGE, FrameProfiler
+
+
+@pytest.fixture()
+def profiler() -> FrameProfiler:
+    profiler = FrameProfiler()
+    profiler.clear()
+    yield profiler
+    profiler.clear()
+    profiler.enabled = False
+    profiler.overlay_visible = False
+
+
+def record_frames(profiler: FrameProfiler, count: int) -> None:
+    for _ in range(count):
+        profiler.begin_frame()
+        with profiler.stage("update"):
+            with profiler.stage("collision"):
+                pass
+            with profiler.stage("collision"):
+                pass
+        profiler.end_frame()
+
+
+def test_disabled_profiler_records_nothing(profiler) -> None:
+    profiler.enabled = False
+
+    assert profiler.stage("collision") is NULL_STAGE
+    record_frames(profiler, 3)
+
+    assert len(profiler.frames) == 0
+
+
+def test_frames_are_kept_in_a_ring_buffer_with_nested_stages(profiler) -> None:
+    profiler.enabled = True
+    capacity = profiler.frames.maxlen
+
+    record_frames(profiler, capacity + 5)
+
+    assert len(profiler.frames) == capacity
+    assert profiler.stage_names == ["collision", "update"]
+    assert len(profiler.frames[-1][2]) == 3
+    stats = profiler.stats()
+    assert set(stats) == {"frame", "update", "collision"}
+    assert stats["frame"]["p50"] <= stats["frame"]["p99"] <= stats["frame"]["worst"]
+    assert stats["collision"]["worst"] <= stats["update"]["worst"]
+
+
+def test_export_writes_a_chrome_trace_and_csv(profiler, tmp_path) -> None:
+    profiler.enabled = True
+    record_frames(profiler, 4)
+
+    trace_path, csv_path = profiler.export(str(tmp_path))
+
+    with open(trace_path) as file:
+        events = json.load(file)["traceEvents"]
+    assert len(events) == 4 * 4
+    assert {event["ph"] for event in events} == {"X"}
+    assert events[0]["name"] == "frame" and events[0]["ts"] == 0
+    with open(csv_path, newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["frame", "frame_ms", "collision", "update"]
+    assert len(rows) == 5
+
+
+def test_overlay_draws_only_while_visible(profiler, screen) -> None:
+    assert profiler.draw(screen) is None
+
+    profiler.toggle_overlay()
+    record_frames(profiler, 2)
+    area = profiler.draw(screen)
+
+    assert profiler.enabled
+    assert area is not None and area.topleft == (10, 10)
+    profiler.toggle_overlay()
+    assert not profiler.overlay_visible
@@ -0,0 +1,53 @@
+import random
+from game.headless_runner import HeadlessRunner
+from managers.input_state import InputState
+from settings import Settings
+
+
+class IdleInput:
+    """Controls that never touch anything."""
+
+    def poll(self) -> InputState:
+        return InputState()
+
+
+def test_autopilot_launches_and_scores_without_touching_settings() -> None:
+    settings = Settings()
+    difficulty = settings.get("DIFFICULTY")
+
+    report = HeadlessRunner(seed=3, max_steps=2000, difficulty=2).run()
+
+    assert report["steps"] == 2000
+    assert report["score"] > 0
+    assert set(report) == {"steps", "seconds", "steps_per_second", "levels_cleared", "level_steps", "score",
+                           "lives", "lives_lost", "balls_lost", "game_over"}
+    assert len(report["level_steps"]) == report["levels_cleared"]
+    assert report["lives_lost"] == 3 - report["lives"]
+    assert report["balls_lost"] >= report["lives_lost"]
+    assert settings.get("DIFFICULTY") == difficulty
+    assert settings.persistent
+
+
+def test_same_seed_gives_the_same_run() -> None:
+    first = HeadlessRunner(seed=5, max_steps=1500, difficulty=2).run()
+    second = HeadlessRunner(seed=5, max_steps=1500, difficulty=2).run()
+
+    assert (first["score"], first["levels_cleared"], first["lives"]) == \
+        (second["score"], second["levels_cleared"], second["lives"])
+
+
+def test_run_leaves_the_global_random_alone() -> None:
+    random.seed(99)
+    expected = random.random()
+    random.seed(99)
+
+    HeadlessRunner(seed=5, max_steps=200, difficulty=2).run()
+
+    assert random.random() == expected
+
+
+def test_idle_input_never_launches_the_ball() -> None:
+    report = HeadlessRunner(seed=1, max_steps=200, difficulty=2, input_source=IdleInput()).run()
+
+    assert report["score"] == 0
+    assert report["lives"] == 3
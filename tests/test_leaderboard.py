@@ -0,0 +1,70 @@
+import pytest
+from utils.leaderboard import Leaderboard
+from utils.score_saver import ScoreSaver
+
+
+@pytest.fixture()
+def leaderboard(tmp_path):
+    board = Leaderboard(str(tmp_path / "leaderboard.db"))
+    yield board
+    board.close()
+
+
+def test_top_and_rank_keep_every_score_with_ties_in_submission_order(leaderboard) -> None:
+    for index, score in enumerate([50, 300, 120, 300, 10]):
+        leaderboard.add(f"p{index}", score, difficulty=1, played_at=1000 + index)
+
+    assert [(name, score) for name, score, _, _ in leaderboard.top(3)] == [("p1", 300), ("p3", 300), ("p2", 120)]
+    assert len(leaderboard) == 5
+    assert leaderboard.rank(300) == 3
+    assert leaderboard.rank(301) == 1
+    assert leaderboard.rank(0) == 6
+    assert leaderboard.add("late", 120, difficulty=1) == 4
+
+
+def test_boards_filter_by_difficulty_and_date(leaderboard) -> None:
+    leaderboard.add("easy", 500, difficulty=1, played_at=100)
+    leaderboard.add("hard", 200, difficulty=1.2000000000000002, played_at=200)
+    leaderboard.add("harder", 100, difficulty=1.2, played_at=300)
+
+    assert [entry[0] for entry in leaderboard.top(10, difficulty=1.2)] == ["hard", "harder"]
+    assert leaderboard.rank(150, difficulty=1.2) == 2
+    assert [entry[0] for entry in leaderboard.top(10, since=150, until=300)] == ["hard"]
+
+
+def test_top_is_cached_until_an_insert(leaderboard) -> None:
+    leaderboard.add("a", 10)
+    first = leaderboard.top(5)
+
+    assert leaderboard.top(5) is first
+    leaderboard.add("b", 20)
+    assert leaderboard.top(5)[0][0] == "b"
+
+
+def test_legacy_csv_is_imported_into_an_empty_database(tmp_path) -> None:
+    legacy = tmp_path / "high_score.csv"
+    legacy.write_text("Sun,1880\nPOTATO,57000\nbroken\nMoon,1880\n")
+
+    board = Leaderboard(str(tmp_path / "leaderboard.db"), str(legacy))
+    assert [entry[:2] for entry in board.top(10)] == [("POTATO", 57000), ("Sun", 1880), ("Moon", 1880)]
+    board.close()
+
+    reopened = Leaderboard(str(tmp_path / "leaderboard.db"), str(legacy))
+    assert len(reopened) == 3
+    reopened.close()
+
+
+def test_score_saver_uses_the_shared_leaderboard(leaderboard, monkeypatch) -> None:
+    monkeypatch.setattr(Leaderboard, "_shared", leaderboard)
+    for score in range(1, 11):
+        leaderboard.add("old", score * 10)
+    saver = ScoreSaver(difficulty=2)
+
+    assert not saver.check_high_score(10)
+    assert saver.check_high_score(11)
+    display = saver.score_display()
+    assert saver.score_display() is display
+    saver.add_score("new", 55)
+    assert saver.score_display()[5] == "6. new: 55"
+    assert len(leaderboard) == 11
+    assert leaderboard.top(1, difficulty=2)[0][:3] == ("new", 55, 2.0)
@@ -0,0 +1,47 @@
+import heapq
+from utils.leaderboard import Leaderboard
+from utils.leaderboard_merge import merged, open_bests, ranked, read_bests, record_bests, sort_key, sorted_runs
+
+
+def write_csv(path, rows) -> str:
+    path.write_text("".join(f"{name},{score}\n" for name, score in rows))
+    return str(path)
+
+
+def test_sorted_runs_spill_to_files_and_merge_best_first(tmp_path) -> None:
+    records = [(score, None, f"p{score}", "a.csv") for score in (5, 9, 1, 7, 3, 8, 2)]
+
+    runs = sorted_runs(records, str(tmp_path), run_rows=3)
+
+    assert len(runs) == 3
+    assert len(list(tmp_path.iterdir())) == 3
+    assert [record[0] for record in heapq.merge(*runs, key=sort_key)] == [9, 8, 7, 5, 3, 2, 1]
+
+
+def test_csv_files_and_stores_merge_with_dedup_and_shared_ranks(tmp_path) -> None:
+    first = write_csv(tmp_path / "first.csv", [("Sun", 1880), ("POTATO", 57000), ("broken", "x")])
+    second = write_csv(tmp_path / "second.csv", [("sun ", 1880), ("Moon", 1880), ("Lucky", 1540)])
+    store = Leaderboard(str(tmp_path / "leaderboard.db"))
+    store.add("Moon", 1880, played_at=100.0)
+    store.add("Lucky", 2000, played_at=50.0)
+    store.close()
+
+    ranking = list(ranked(merged([first, second, str(tmp_path / "leaderboard.db")], str(tmp_path), run_rows=1)))
+
+    assert [(rank, record[2], record[0]) for rank, record in ranking] == [
+        (1, "POTATO", 57000), (2, "Lucky", 2000), (3, "Moon", 1880), (3, "Moon", 1880), (3, "Sun", 1880), (6, "Lucky", 1540),
+    ]
+    assert ranking[2][1][1] == 100.0 and ranking[3][1][1] is None
+
+
+def test_player_bests_rank_each_player_once(tmp_path) -> None:
+    first = write_csv(tmp_path / "first.csv", [("Ann", 10), ("Bob", 30), ("ann", 40), ("Cy", 30)])
+
+    connection = open_bests(str(tmp_path))
+    ranking = list(record_bests(ranked(merged([first], str(tmp_path))), connection))
+    bests = list(read_bests(connection))
+    connection.close()
+
+    assert len(ranking) == 4
+
+    assert [(rank, record[2], record[0]) for rank, record in bests] == [(1, "ann", 40), (2, "Bob", 30), (2, "Cy", 30)]
@@ -1,18 +1,67 @@
 import pygame as pg
 from levels.level import Level
+from objects.brick import Brick
 
 
-def test_level_brick_rows_match_group() -> None:
+def test_level_grid_and_row_counts_match_group() -> None:
     level = Level(0)
-    total_row_bricks = sum(len(row) for row in level.brick_rows.values())
-    assert total_row_bricks == len(level.bricks)
-    # Every brick in rows is part of the sprite group
-    assert all(brick in level.bricks for row in level.brick_rows.values() for brick in row)
+    assert sum(level.row_alive) == len(level.bricks)
+    # Every static brick in the sprite group is in its grid cell
+    static = [brick for brick in level.bricks if brick not in level.moving_bricks]
+    assert all(level.brick_at(brick.rect.x // level.BRICK_SIZE[0], brick.row_index) is brick for brick in static)
 
 
-def test_get_ball_collision_rows_includes_current_row() -> None:
+def test_remove_brick_updates_grid_and_counters() -> None:
     level = Level(0)
-    row_height = level.BRICK_SIZE[1]
-    ball_rect = pg.Rect(0, row_height * 2, level.BRICK_SIZE[0], level.BRICK_SIZE[1])
-    rows = level.get_ball_collision_rows(ball_rect, pg.math.Vector2(0, 0))
-    assert 2 in rows
+    level.clear_bricks()
+    brick = Brick(level.BRICK_SIZE[0] * 2, level.BRICK_SIZE[1] * 3)
+    level.add_brick(brick, 3)
+    assert level.brick_at(2, 3) is brick
+    assert level.row_alive[3] == 1
+    assert not level.is_level_complete()
+
+    level.remove_brick(brick)
+    level.remove_brick(brick)  # Removing twice must not double count
+
+    assert level.brick_at(2, 3) is None
+    assert level.row_alive[3] == 0
+    assert level.alive_count == 0
+    assert level.is_level_complete()
+
+
+def test_static_layer_clears_only_the_destroyed_cell(screen) -> None:
+    level = Level(0)
+    level.clear_bricks()
+    left, right = Brick(0, 0), Brick(level.BRICK_SIZE[0], 0)
+    level.add_brick(left, 0)
+    level.add_brick(right, 0)
+    level.draw(screen)
+    layer = level.static_layer
+
+    level.remove_brick(left)
+
+    assert level.static_layer is layer
+    assert layer.get_at(left.rect.center).a == 0
+    assert layer.get_at(right.rect.center - pg.math.Vector2(level.static_layer_rect.topleft)).a == right.image.get_at((50, 10)).a
+
+
+def test_row_intervals_follow_moving_bricks() -> None:
+    level = Level(0)
+    level.clear_bricks()
+    width = level.BRICK_SIZE[0]
+    static = Brick(width * 4, 0)
+    level.add_brick(static, 0)
+    moving = level.create_moving_brick(1, 0)
+    level.add_brick(moving, 0)
+
+    old_left = moving.rect.left
+    moving.rect.left = width * 3 - 2
+    level.move_brick(moving, old_left)
+
+    intervals = level.row_intervals[0]
+    assert intervals.lefts == sorted(intervals.lefts)
+    assert level.overlapping_brick(moving.rect.move(5, 0), 0, moving) is static
+    assert level.overlapping_brick(pg.Rect(0, 0, 10, 10), 0) is None
+
+    level.remove_brick(static)
+    assert len(intervals) == level.row_alive[0] == 1
@@ -0,0 +1,34 @@
+from levels.level import Level
+from levels.level_generator import LevelGenerator
+
+
+def test_same_seed_gives_the_same_map() -> None:
+    generator = LevelGenerator(8, 15)
+
+    assert generator.generate(42, 5) == generator.generate(42, 5)
+    assert generator.generate(42, 5) != generator.generate(43, 5)
+
+
+def test_brick_count_is_exact_and_moving_bricks_are_one_per_row() -> None:
+    generator = LevelGenerator(8, 15)
+    grid = generator.generate(7, 10)
+
+    assert sum(cell != 0 for row in grid for cell in row) == 8 * 15
+    assert all(row.count(2) <= 1 for row in grid)
+
+
+def test_batch_matches_single_generation() -> None:
+    generator = LevelGenerator(8, 15)
+    seeds = list(range(100))
+
+    batch = generator.generate_batch(seeds, 9.8)
+
+    assert len(batch) == len(seeds) * 8 * 15
+    assert generator.grid_from_batch(batch, 37) == generator.generate(37, 9.8)
+
+
+def test_level_seed_reproduces_bricks_and_directions() -> None:
+    first, second = Level(0, seed=1234), Level(0, seed=1234)
+
+    assert first.level_map == second.level_map
+    assert [brick.velocity for brick in first.moving_bricks] == [brick.velocity for brick in second.moving_bricks]
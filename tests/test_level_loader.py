@@ -0,0 +1,28 @@
+from levels.level import Level
+from levels.level_loader import LevelLoader
+from ui.level_banner import LevelBanner
+
+
+def test_loader_builds_the_level_and_its_layer_in_the_background() -> None:
+    loader = LevelLoader()
+    loader.request(2)
+    assert loader.pending
+
+    loader.future.result(timeout=5)
+    level = loader.take()
+
+    assert isinstance(level, Level)
+    assert level.current_level == 2
+    assert level.static_layer is not None
+    assert not loader.pending
+    assert loader.take() is None
+
+
+def test_banner_counts_down_without_blocking() -> None:
+    banner = LevelBanner()
+    banner.show(3, duration_ms=100)
+
+    banner.update(60)
+    assert banner.active
+    banner.update(60)
+    assert not banner.active
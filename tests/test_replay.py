@@ -0,0 +1,96 @@
+import json
+import pytest
+from game.game_play import GamePlay
+from game.headless_game import HeadlessGame
+from managers.autopilot_input_source import AutopilotInputSource
+from managers.game_snapshot import GameSnapshot
+from managers.input_state import InputState
+from managers.replay import Replay
+from managers.replay_player import ReplayPlayer
+from managers.replay_recorder import ReplayRecorder
+from settings import Settings
+
+STEPS = 1500
+
+
+def step(game_play: GamePlay) -> None:
+    """Runs one simulation step, skipping the banner and waiting for level builds."""
+    if game_play.level_loader.pending:
+        game_play.level_loader.future.result()
+    game_play.level_banner.hide()
+    game_play.fixed_update()
+
+
+def snapshot(game_play: GamePlay) -> dict:
+    return json.loads(json.dumps(GameSnapshot.capture(game_play)))
+
+
+@pytest.fixture()
+def simulation_settings() -> None:
+    """Keeps settings changes made by the games in memory and undoes them afterwards."""
+    settings = Settings()
+    saved, persistent = dict(settings.settings), settings.persistent
+    settings.persistent = False
+    settings.settings.update({"DIFFICULTY": 3, "BALL_BACKEND": "sprite"})
+    yield
+    settings.settings.clear()
+    settings.settings.update(saved)
+    settings.persistent = persistent
+
+
+@pytest.fixture()
+def recorded(simulation_settings) -> tuple:
+    """An autopilot game with a keyframe every 400 steps, and its final state."""
+    game_play = GamePlay(HeadlessGame(), {"level": 1, "collision": 2, "swarm": 3})
+    game_play.input_handler.source = AutopilotInputSource(game_play, seed=7)
+    recorder = ReplayRecorder(game_play, keyframe_interval=400)
+    for _ in range(STEPS):
+        step(game_play)
+    return Replay.from_bytes(recorder.replay.to_bytes()), snapshot(game_play)
+
+
+def play(replay: Replay) -> ReplayPlayer:
+    replay.apply_settings()
+    return ReplayPlayer(GamePlay(HeadlessGame(), replay.seeds), replay)
+
+
+def test_input_round_trips_through_the_file_format(simulation_settings) -> None:
+    replay = Replay.start({"level": 1, "collision": 2, "swarm": 3})
+    states = [InputState(left=True), InputState(launch=True, pointer_x=-40), InputState(pointer_x=799, pointer_down=True)]
+    for state in states:
+        replay.append_input(state)
+
+    loaded = Replay.from_bytes(replay.to_bytes())
+
+    assert [loaded.input_at(index) for index in range(len(loaded))] == states
+    assert loaded.seeds == replay.seeds
+    assert loaded.settings["DIFFICULTY"] == 3
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b"nope" + replay.to_bytes()[4:])
+
+
+def test_playback_matches_the_recording(recorded) -> None:
+    replay, final = recorded
+    player = play(replay)
+
+    player.run_to(len(replay))
+
+    assert replay.keyframe_steps == [0, 400, 800, 1200]
+    assert player.finished
+    assert player.desync_step is None
+    assert snapshot(player.game_play) == final
+    assert final["score"] > 0
+
+
+def test_seeking_restores_keyframes_forwards_and_backwards(recorded) -> None:
+    replay, final = recorded
+    player = play(replay)
+
+    player.seek(1300)
+    assert player.position == 1300
+    player.seek(500)
+    assert snapshot(player.game_play) != final
+    player.run_to(len(replay))
+
+    assert player.desync_step is None
+    assert snapshot(player.game_play) == final
@@ -0,0 +1,25 @@
+import pygame as pg
+from objects.ball import Ball
+from objects.paddle import Paddle
+from utils.rotation_cache import RotationCache
+
+
+def test_balls_share_one_rotation_cache() -> None:
+    paddle = Paddle()
+    first, second = Ball(paddle), Ball(paddle)
+    assert first.rotation is second.rotation
+
+
+def test_frames_are_uniform_and_wrap_around() -> None:
+    cache = RotationCache(pg.Surface((30, 30), pg.SRCALPHA), 10)
+
+    assert len(cache.frames) == 36
+    assert {frame.get_size() for frame in cache.frames} == {(cache.frame_size, cache.frame_size)}
+    assert cache.frame(360) is cache.frame(0)
+    assert cache.frame(-10) is cache.frames[35]
+
+
+def test_ball_update_reuses_cached_frames() -> None:
+    ball = Ball(Paddle())
+    ball.update()
+    assert ball.image in ball.rotation.frames
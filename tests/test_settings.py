@@ -0,0 +1,55 @@
+import json
+from settings import Settings
+
+
+def make_settings(tmp_path, write_behind: bool = True, flush_delay: float = 60.0) -> Settings:
+    settings = object.__new__(Settings)
+    settings.filename = str(tmp_path / "settings.json")
+    settings.settings = dict(Settings.defaults)
+    settings.settings["SETTINGS_WRITE_BEHIND"] = write_behind
+    settings.settings["SETTINGS_FLUSH_DELAY"] = flush_delay
+    settings.init_persistence()
+    return settings
+
+
+def read_file(settings: Settings) -> dict:
+    with open(settings.filename) as file:
+        return json.load(file)
+
+
+def test_set_applies_in_memory_and_defers_the_write(tmp_path) -> None:
+    settings = make_settings(tmp_path)
+
+    settings.set("DIFFICULTY", 3)
+    settings.set("DIFFICULTY", 4)
+
+    assert settings.get("DIFFICULTY") == 4
+    assert settings.dirty
+    assert not (tmp_path / "settings.json").exists()
+
+    settings.flush()
+    assert not settings.dirty
+    assert read_file(settings)["DIFFICULTY"] == 4
+    assert not (tmp_path / "settings.json.tmp").exists()
+
+
+def test_background_timer_flushes_coalesced_changes(tmp_path) -> None:
+    settings = make_settings(tmp_path, flush_delay=0.01)
+
+    settings.set("DIFFICULTY", 2)
+    settings.set("VOLUME", 0.1)
+    timer = settings.flush_timer
+    timer.join(1.0)
+
+    data = read_file(settings)
+    assert (data["DIFFICULTY"], data["VOLUME"]) == (2, 0.1)
+    assert not settings.dirty
+
+
+def test_synchronous_mode_saves_on_set(tmp_path) -> None:
+    settings = make_settings(tmp_path, write_behind=False)
+
+    settings.set("DIFFICULTY", 5)
+
+    assert read_file(settings)["DIFFICULTY"] == 5
+    assert settings.flush_timer is None
@@ -0,0 +1,61 @@
+import pygame as pg
+from objects.ball import Ball
+from objects.paddle import Paddle
+from levels.level import Level
+from utils.simulation_clock import SimulationClock
+
+
+def test_clock_steps_match_elapsed_time() -> None:
+    clock = SimulationClock(240, 8)
+    # Four 60 Hz frames should simulate 16 steps at 240 Hz regardless of frame split
+    steps = sum(clock.advance(1000 / 60) for _ in range(4))
+    assert steps == 16
+    assert 0.0 <= clock.alpha < 1.0
+
+
+def test_clock_caps_substeps_after_hitch() -> None:
+    clock = SimulationClock(240, 8)
+    assert clock.advance(2000) == 8
+    # Excess time is dropped rather than replayed on later frames
+    assert clock.advance(0) == 0
+
+
+def test_ball_draw_interpolates_between_steps(screen: pg.Surface) -> None:
+    ball = Ball(Paddle())
+    ball.attached_to_paddle = False
+    ball.velocity = pg.math.Vector2(4, 0)
+    ball.update()
+    midpoint = ball.previous_position.lerp(ball.position, 0.5)
+
+    drawn = ball.draw(screen, 0.5)
+
+    assert abs(drawn.centerx - midpoint.x) <= 1
+    assert abs(drawn.centery - midpoint.y) <= 1
+    assert abs(drawn.centerx - ball.position.x) > 1
+
+
+def test_paddle_and_attached_ball_are_drawn_in_step(screen: pg.Surface) -> None:
+    paddle = Paddle()
+    ball = Ball(paddle)
+    paddle.update()
+    paddle.move("right")
+    ball.update()
+
+    drawn_paddle = paddle.draw(screen, 0.5)
+    drawn_ball = ball.draw(screen, 0.5)
+
+    assert drawn_paddle.x == paddle.previous_x + (paddle.rect.x - paddle.previous_x) // 2
+    assert abs(drawn_ball.centerx - drawn_paddle.centerx) <= 1
+
+
+def test_moving_brick_draw_interpolates_between_steps(screen: pg.Surface) -> None:
+    level = Level(0)
+    level.clear_bricks()
+    brick = level.create_moving_brick(2, 0)
+    level.add_brick(brick, 0)
+    brick.update()
+
+    drawn = level.draw_moving_bricks(screen, 0.5)[0]
+
+    assert brick.rect.x != brick.previous_x
+    assert abs(drawn.x - (brick.previous_x + brick.rect.x) / 2) <= 1
@@ -0,0 +1,47 @@
+from game.simulation_lab import DEFAULT_AUTOPILOT_SPEED, aggregate, make_tasks, parameter_grid, parse_axis, run_lab
+
+
+def test_grid_arguments_expand_to_every_combination() -> None:
+    axes = dict([parse_axis("BALL_SPEED=2,3"), parse_axis("PADDLE_SIZE=80x20,100x20"), parse_axis("MOVING_BRICK_CHANCE=0.25")])
+
+    grid = parameter_grid(axes)
+
+    assert len(grid) == 4
+    assert grid[0] == {"BALL_SPEED": 2, "PADDLE_SIZE": [80, 20], "MOVING_BRICK_CHANCE": 0.25}
+    assert parameter_grid({}) == [{}]
+    assert [task["seed"] for task in make_tasks(grid[:2], 3, 100, None, base_seed=10)] == [10, 11, 12, 10, 11, 12]
+
+
+def test_reports_are_aggregated_per_combination() -> None:
+    def report(speed, levels, level_steps, balls_lost, lives_lost, score, game_over):
+        return {"overrides": {"BALL_SPEED": speed}, "levels_cleared": levels, "level_steps": level_steps,
+                "balls_lost": balls_lost, "lives_lost": lives_lost, "score": score, "game_over": game_over}
+
+    rows = aggregate([report(2, 1, [480], 2, 0, 100, False), report(2, 0, [], 3, 3, 40, True),
+                      report(3, 2, [240, 240], 1, 1, 300, False)], step_rate=240)
+
+    assert rows[0]["overrides"] == {"BALL_SPEED": 2}
+    assert rows[0]["games"] == 2
+    assert rows[0]["clear_seconds"] == 2.0
+    assert rows[0]["balls_lost"] == 2.5
+    assert rows[0]["lives_lost"] == 1.5
+    assert rows[0]["game_over_rate"] == 0.5
+    assert rows[1]["clear_seconds"] == 1.0
+
+
+def test_trials_run_in_worker_processes_and_return_plain_reports() -> None:
+    tasks = make_tasks([{"BALL_SPEED": 3, "DIFFICULTY": 2}], games=2, max_steps=300, max_levels=None)
+
+    reports = run_lab(tasks, workers=1)
+
+    assert [report["seed"] for report in reports] == [0, 1]
+    assert all(report["steps"] == 300 and report["overrides"] == {"BALL_SPEED": 3, "DIFFICULTY": 2} for report in reports)
+    assert all(isinstance(report["score"], int) for report in reports)
+
+
+def test_lab_games_use_a_reaction_limited_autopilot_unless_the_grid_sets_one() -> None:
+    tasks = make_tasks([{}, {"AUTOPILOT_SPEED": 0}], games=1, max_steps=100, max_levels=None)
+
+    assert all(task["autopilot_speed"] == DEFAULT_AUTOPILOT_SPEED for task in tasks)
+    assert [task["overrides"] for task in tasks] == [{}, {"AUTOPILOT_SPEED": 0}]
+    assert run_lab(tasks[1:], workers=1)[0]["balls_lost"] == 0
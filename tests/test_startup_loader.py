@@ -0,0 +1,24 @@
+from settings import Settings
+from utils.asset_manager import AssetManager
+from utils.rotation_cache import RotationCache
+from utils.startup_loader import StartupLoader
+from utils.typography import Typography
+
+
+def test_startup_loader_warms_the_shared_caches() -> None:
+    settings = Settings()
+    loader = StartupLoader(workers=2)
+    assert loader.progress == 0.0 and not loader.finished
+
+    loader.start()
+    loader.wait()
+
+    assert loader.finished and loader.progress == 1.0
+    assert all(future.exception() is None for future in loader.futures)
+    assets = AssetManager()
+    for path, variants in loader.image_variants().items():
+        for size, alpha in variants:
+            assert assets.lookup((path, size, alpha)) is not None
+    assert (None, 30) in Typography().fonts
+    key = (settings.get("BALL_IMG"), settings.get("BALL_RADIUS"), float(settings.get("ROTATION_STEP")))
+    assert key in RotationCache._caches
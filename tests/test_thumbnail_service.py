@@ -0,0 +1,48 @@
+import os
+import pygame as pg
+from utils.thumbnail_service import ThumbnailService
+
+
+def save_image(tmp_path, name: str, size=(400, 200)) -> str:
+    path = str(tmp_path / name)
+    pg.image.save(pg.Surface(size), path)
+    return path
+
+
+def test_request_is_deferred_to_the_worker_and_cached_on_disk(tmp_path) -> None:
+    service = ThumbnailService(str(tmp_path / "cache"), 4)
+    path = save_image(tmp_path, "background.png")
+
+    first = service.request(path, (100, 100))
+    service.jobs.join()
+    thumbnail = service.request(path, (100, 100))
+
+    assert first is None
+    assert thumbnail.get_size() == (100, 50)
+    assert os.path.exists(service.cache_path(path, (100, 100)))
+
+    fresh = ThumbnailService(str(tmp_path / "cache"), 4)
+    assert fresh.build(path, (100, 100)).get_size() == (100, 50)
+
+
+def test_prefetch_fills_a_bounded_lru(tmp_path) -> None:
+    service = ThumbnailService(str(tmp_path / "cache"), 2)
+    paths = [save_image(tmp_path, f"{index}.png") for index in range(3)]
+
+    service.prefetch(paths, (40, 40))
+    service.jobs.join()
+    service.collect()
+
+    assert len(service.thumbnails) == 2
+    assert (paths[0], (40, 40)) not in service.thumbnails
+
+
+def test_unreadable_images_are_not_retried(tmp_path) -> None:
+    service = ThumbnailService(str(tmp_path / "cache"), 2)
+    missing = str(tmp_path / "missing.png")
+
+    service.request(missing, (40, 40))
+    service.jobs.join()
+
+    assert service.request(missing, (40, 40)) is None
+    assert service.jobs.unfinished_tasks == 0
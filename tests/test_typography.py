@@ -0,0 +1,49 @@
+from ui.button import Button
+from ui.scoreboard import Scoreboard
+from utils.typography import Typography
+
+
+def test_fonts_and_text_are_shared() -> None:
+    typography = Typography()
+
+    assert typography.font(None, 24) is typography.font(None, 24)
+    first = typography.render("Level 1", 24, [255, 255, 255])
+    assert typography.render("Level 1", 24, (255, 255, 255)) is first
+
+
+def test_text_cache_evicts_least_recently_used() -> None:
+    typography = Typography()
+    capacity = typography.capacity
+    typography.texts.clear()
+    typography.capacity = 2
+    try:
+        first = typography.render("a", 20, (0, 0, 0))
+        typography.render("b", 20, (0, 0, 0))
+        typography.render("a", 20, (0, 0, 0))
+        typography.render("c", 20, (0, 0, 0))
+
+        assert typography.render("a", 20, (0, 0, 0)) is first
+        assert (None, 20, "b", (0, 0, 0), None) not in typography.texts
+    finally:
+        typography.capacity = capacity
+
+
+def test_scoreboard_draws_score_from_the_digit_atlas(screen) -> None:
+    scoreboard = Scoreboard()
+    scoreboard.score = 1250
+    atlas = Typography().digits(scoreboard.font_size, scoreboard.color)
+
+    area = scoreboard.draw(screen)
+
+    label_width = Typography().render("Score: ", scoreboard.font_size, scoreboard.color).get_width()
+    assert area.width == label_width + atlas.width(1250)
+    assert area.topleft == (scoreboard.x, scoreboard.y)
+
+
+def test_button_label_uses_its_font_key(screen) -> None:
+    button = Button(screen, 0, 0, 200, 100, "Save")
+    button.font_key = (None, 20)
+
+    button.draw()
+
+    assert (None, 20, "Save", (0, 0, 0), None) in Typography().texts
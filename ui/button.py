@@ -1,4 +1,5 @@
 import pygame as pg
+from utils.typography import FontKey, Typography
 
 class Button:
     def __init__(self, screen: pg.Surface, x: int, y: int, width: int = None, 
@@ -47,7 +48,7 @@ class Button:
         self.text_color: tuple = text_color
         self.action: callable = action
         self.hitbox: pg.Rect = self.rect
-        self.font: pg.font.Font = pg.font.SysFont("Arial", 50)
+        self.font_key: FontKey = ("Arial", 50)  # (name, size) of the label font
         self.default_image: pg.Surface = image
         self.hover_image: pg.Surface = hover_image
         self.selected_image: pg.Surface = selected_image
@@ -67,7 +68,8 @@ class Button:
         if self.text:
             text_str = str(self.text)
             text_color = self.text_color if isinstance(self.text_color, tuple) and len(self.text_color) in [3, 4] else (0, 0, 0)
-            text_surface = self.font.render(text_str, True, text_color)
+            name, size = self.font_key
+            text_surface = Typography().render(text_str, size, text_color, name)
             text_rect = text_surface.get_rect(center=self.rect.center)
             self.screen.blit(text_surface, text_rect)
 
@@ -1,5 +1,7 @@
 import pygame as pg
 from pygame.surface import Surface
+from typing import Optional
+from utils.typography import Typography
 
 class LevelBanner:
     def __init__(self, font_size: int = 50, color: tuple = (255, 255, 255)) -> None:
@@ -10,25 +12,61 @@ class LevelBanner:
             font_size (int): The font size for the level text. Default is 50.
             color (tuple): The color of the level text in RGB format. Default is (255, 255, 255).
         """
-        self.font = pg.font.SysFont("Arial", font_size)
+        self.font_size = font_size
+        self.font = Typography().font("Arial", font_size)
         self.color = color
+        self.level_number: int = 0
+        self.remaining_ms: float = 0.0
 
-    def display(self, screen: Surface, level_number: int, screen_width: int, screen_height: int) -> None:
+    def show(self, level_number: int, duration_ms: int = 2000) -> None:
         """
-        Display the level banner on the screen.
+        Start showing the level banner as an overlay.
 
         Args:
-            screen (pygame.Surface): The surface to display the level banner on.
             level_number (int): The level number to be displayed.
+            duration_ms (int): How long the banner stays up in milliseconds. Default is 2000.
+        """
+        self.level_number = level_number
+        self.remaining_ms = duration_ms
+
+    def hide(self) -> None:
+        """
+        Stop showing the level banner immediately.
+        """
+        self.remaining_ms = 0.0
+
+    @property
+    def active(self) -> bool:
+        """Whether the banner is currently showing."""
+        return self.remaining_ms > 0
+
+    def update(self, elapsed_ms: float) -> None:
+        """
+        Count down the time the banner has left.
+
+        Args:
+            elapsed_ms (float): The time that passed since the last update in milliseconds.
+        """
+        self.remaining_ms = max(0.0, self.remaining_ms - elapsed_ms)
+
+    def draw(self, screen: Surface, screen_width: int, screen_height: int) -> Optional[pg.Rect]:
+        """
+        Draw the level banner on the screen while it is active.
+
+        Args:
+            screen (pygame.Surface): The surface to draw the level banner on.
             screen_width (int): The width of the screen.
             screen_height (int): The height of the screen.
+
+        Returns:
+            Optional[pg.Rect]: The area drawn, or None if the banner is not showing.
         """
+        if not self.active:
+            return None
         bg_color = (255 - self.color[0], 255 - self.color[1], 255 - self.color[2])
-        level_text = self.font.render(f"Level {level_number}", True, self.color, bg_color)
+        level_text = Typography().render(f"Level {self.level_number}", self.font_size, self.color, "Arial", bg_color)
         text_rect = level_text.get_rect(center=(screen_width // 2, screen_height // 2))
-        screen.blit(level_text, text_rect)
-        pg.display.flip()
-        pg.time.wait(2000)
+        return screen.blit(level_text, text_rect)
 
     def display_ball_lost_message(self, screen: Surface, screen_width: int, screen_height: int) -> None:
         """
@@ -40,7 +78,7 @@ class LevelBanner:
             screen_height (int): The height of the screen.
         """
         bg_color = (255 - self.color[0], 255 - self.color[1], 255 - self.color[2])
-        message_text = self.font.render("YOU LOST A BALL!", True, (255, 0, 0), bg_color)
+        message_text = Typography().render("YOU LOST A BALL!", self.font_size, (255, 0, 0), "Arial", bg_color)
         text_rect = message_text.get_rect(center=(screen_width // 2, screen_height // 2))
         screen.blit(message_text, text_rect)
         pg.display.flip()
@@ -1,5 +1,6 @@
 import pygame as pg
 from settings import Settings
+from utils.asset_manager import AssetManager
 
 class PlayerLives:
     def __init__(self):
@@ -19,8 +20,7 @@ class PlayerLives:
         self.x: int = 10
         self.y: int = self.SCREEN_HEIGHT - 40
 
-        self.ball_image: pg.Surface = pg.image.load(self.BALL_IMG).convert_alpha()
-        self.ball_image = pg.transform.scale(self.ball_image, (20, 20))
+        self.ball_image: pg.Surface = AssetManager().image(self.BALL_IMG, (20, 20))
 
     def decrease_lives(self) -> None:
         """
@@ -35,18 +35,22 @@ class PlayerLives:
         """
         pass
 
-    def draw(self, screen: pg.Surface) -> None:
+    def draw(self, screen: pg.Surface) -> pg.Rect:
         """
         Draws the player lives display on the screen.
 
         Parameters:
         - screen (Surface): The surface to draw on.
+
+        Returns:
+        - Rect: The area of the screen that was drawn.
         """
         rect_width: int = self.lives * 25 + 10
-        pg.draw.ellipse(screen, (0, 0, 0), (self.x, self.y, rect_width, 30), 0)
+        area: pg.Rect = pg.draw.ellipse(screen, (0, 0, 0), (self.x, self.y, rect_width, 30), 0)
         pg.draw.ellipse(screen, (255, 255, 255), (self.x, self.y, rect_width, 30), 2)
         
         for i in range(self.lives):
             ball_x: int = self.x + 10 + i * 25
             ball_y: int = self.y + 5
             screen.blit(self.ball_image, (ball_x, ball_y))
+        return area
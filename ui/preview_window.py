@@ -1,5 +1,7 @@
 import pygame
 from typing import List, Tuple
+from utils.thumbnail_service import ThumbnailService
+from utils.typography import Typography
 
 class PreviewWindow:
     def __init__(self, screen: pygame.Surface, image_list: List[str], image_description: str, x: int, y: int, display_width: int, display_height: int) -> None:
@@ -24,7 +26,8 @@ class PreviewWindow:
         self.display_height = display_height
         self.button_width = 50
         self.button_height = 50
-        self.images = {}
+        self.thumbnails = ThumbnailService.shared()
+        self.thumbnail_size = (self.display_width - 2 * self.button_width, self.display_height)
         self.current_image = None
         self.index = 0
         self.unsaved_changes = False
@@ -33,16 +36,16 @@ class PreviewWindow:
 
     def load_current_image(self) -> None:
         """
-        Loads the current image from the image list and scales it to fit the display size.
+        Requests the thumbnail of the current image and prefetches its neighbours.
+
+        The thumbnail is decoded on the thumbnail service's worker thread, so
+        current_image stays None (and a placeholder is drawn) until it is ready.
         """
         img_path = self.image_list[self.index]
-        if img_path not in self.images:
-            image = pygame.image.load(img_path).convert_alpha()
-            img_width, img_height = image.get_size()
-            scale_factor = min((self.display_width - 2 * self.button_width) / img_width, self.display_height / img_height)
-            new_size = (int(img_width * scale_factor), int(img_height * scale_factor))
-            self.images[img_path] = pygame.transform.scale(image, new_size)
-        self.current_image = self.images[img_path]
+        self.current_image = self.thumbnails.request(img_path, self.thumbnail_size)
+        count = len(self.image_list)
+        neighbours = [self.image_list[(self.index + offset) % count] for offset in (1, -1, 2, -2)]
+        self.thumbnails.prefetch(neighbours, self.thumbnail_size)
 
     def create_buttons(self) -> None:
         """
@@ -58,9 +61,8 @@ class PreviewWindow:
         """
         pygame.draw.rect(self.window, (100, 100, 100), self.left_button)
         pygame.draw.rect(self.window, (100, 100, 100), self.right_button)
-        font = pygame.font.Font(None, 40)
-        left_arrow = font.render("<", True, (255, 255, 255))
-        right_arrow = font.render(">", True, (255, 255, 255))
+        left_arrow = Typography().render("<", 40, (255, 255, 255))
+        right_arrow = Typography().render(">", 40, (255, 255, 255))
         left_arrow_pos = left_arrow.get_rect(center=self.left_button.center)
         right_arrow_pos = right_arrow.get_rect(center=self.right_button.center)
         self.window.blit(left_arrow, left_arrow_pos)
@@ -68,15 +70,19 @@ class PreviewWindow:
 
     def draw_image(self) -> None:
         """
-        Draws the current image on the preview window.
+        Draws the current image on the preview window, or a placeholder while it loads.
         """
-        if self.current_image:
-            self.window.fill((0, 0, 0), (self.x, self.y, self.display_width, self.display_height))
+        if self.current_image is None:
+            self.current_image = self.thumbnails.request(self.image_list[self.index], self.thumbnail_size)
+        self.window.fill((0, 0, 0), (self.x, self.y, self.display_width, self.display_height))
+        if self.current_image is None:
+            self.draw_text("Loading...", (self.x + self.display_width // 2, self.y + self.display_height // 2))
+        else:
             image_width, image_height = self.current_image.get_size()
             image_x = self.x + (self.display_width - image_width) // 2
             image_y = self.y + (self.display_height - image_height) // 2
             self.window.blit(self.current_image, (image_x, image_y))
-            self.draw_text(self.image_description, (self.x + self.display_width // 2, self.y + self.display_height + 20))
+        self.draw_text(self.image_description, (self.x + self.display_width // 2, self.y + self.display_height + 20))
 
     def draw_text(self, text: str, position: Tuple[int, int], font_size: int = 20, text_color: Tuple[int, int, int] = (255, 255, 255), background_color: Tuple[int, int, int] = None) -> None:
         """
@@ -89,8 +95,7 @@ class PreviewWindow:
             text_color (Tuple[int, int, int], optional): The color of the text. Defaults to (255, 255, 255).
             background_color (Tuple[int, int, int], optional): The background color of the text. Defaults to None.
         """
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render(text, True, text_color, background_color)
+        text_surface = Typography().render(text, font_size, text_color, background=background_color)
         text_rect = text_surface.get_rect(center=position)
         self.window.blit(text_surface, text_rect)
 
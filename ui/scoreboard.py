@@ -1,5 +1,6 @@
 import pygame as pg
 from settings import Settings
+from utils.typography import Typography
 
 class Scoreboard:
     def __init__(self, font_size: int = 30, color: tuple = (255, 255, 255)):
@@ -14,7 +15,8 @@ class Scoreboard:
         self.SCREEN_WIDTH: int = self.settings.get("SCREEN_WIDTH")
         self.SCREEN_HEIGHT: int = self.settings.get("SCREEN_HEIGHT")
         self.score: int = 0
-        self.font: pg.font.Font = pg.font.SysFont(None, font_size)
+        self.font_size: int = font_size
+        self.font: pg.font.Font = Typography().font(None, font_size)
         self.color: tuple = color
         self.x: int = self.SCREEN_WIDTH - 120
         self.y: int = self.SCREEN_HEIGHT - 25
@@ -37,12 +39,20 @@ class Scoreboard:
         """
         self.score -= points
 
-    def draw(self, screen: pg.Surface) -> None:
+    def draw(self, screen: pg.Surface) -> pg.Rect:
         """
         Draw the score on the screen.
 
+        The label is a cached text surface and the number is drawn from a digit
+        atlas, so a changing score never re-renders text.
+
         Args:
             screen (pygame.Surface): The surface to draw the score on.
+
+        Returns:
+            pg.Rect: The area of the screen that was drawn.
         """
-        score_text = self.font.render(f'Score: {self.score}', True, self.color)
-        screen.blit(score_text, (self.x, self.y))
+        typography = Typography()
+        label_rect = screen.blit(typography.render('Score: ', self.font_size, self.color), (self.x, self.y))
+        number_rect = typography.digits(self.font_size, self.color).draw(screen, self.score, (label_rect.right, self.y))
+        return label_rect.union(number_rect)
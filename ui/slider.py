@@ -3,6 +3,7 @@ from pygame.surface import Surface
 from pygame.font import Font
 from pygame.rect import Rect
 from typing import Tuple
+from utils.typography import Typography
 
 class Slider:
     def __init__(self, screen: Surface, x: int, y: int, width: int, height: int, min_value: float, max_value: float, current_value: float, description: str = "") -> None:
@@ -30,7 +31,7 @@ class Slider:
         self.current_value = current_value
         self.description = description
         self.unsaved_changes = False
-        self.font = pygame.font.Font(None, 20)
+        self.font = Typography().font(None, 20)
         self.bg_color = (255, 255, 255)
         self.track_color = (180, 180, 180)
         self.handle_color = (255, 255, 255)
@@ -96,13 +97,14 @@ class Slider:
         pygame.draw.rect(self.screen, self.track_color, self.track_rect)
         pygame.draw.rect(self.screen, self.handle_color, self.handle_rect)
         pygame.draw.rect(self.screen, self.border_color, self.handle_rect, 1)
-        val_text = self.font.render(str(int(self.current_value)), True, self.border_color)
+        typography = Typography()
+        val_text = typography.render(str(int(self.current_value)), 20, self.border_color)
         val_text_rect = val_text.get_rect(center=self.handle_rect.center)
         self.screen.blit(val_text, val_text_rect)
 
-        desc_text = self.font.render(self.description, True, self.border_color)
-        min_val_text = self.font.render(str(self.min_value), True, self.border_color)
-        max_val_text = self.font.render(str(self.max_value), True, self.border_color)
+        desc_text = typography.render(self.description, 20, self.border_color)
+        min_val_text = typography.render(str(self.min_value), 20, self.border_color)
+        max_val_text = typography.render(str(self.max_value), 20, self.border_color)
 
         base_y = self.y + self.height // 2
         self.screen.blit(min_val_text, (self.x, base_y))
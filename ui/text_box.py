@@ -1,5 +1,6 @@
 import pygame
 from typing import Callable
+from utils.typography import Typography
 
 class TextBox:
     def __init__(self, x: int, y: int, width: int, height: int, callback_function: Callable, prompt: str = ''):
@@ -20,7 +21,7 @@ class TextBox:
         self.background_color = (0, 0, 0)
         self.text_color = (255, 255, 255)
         self.text = ""
-        self.font = pygame.font.Font(None, 32)
+        self.font = Typography().font(None, 32)
         self.active = False
         self.callback_function = callback_function
         self.prompt = prompt
@@ -62,12 +63,12 @@ class TextBox:
         Args:
             screen (pygame.Surface): The surface to draw on.
         """
-        prompt_surface = self.font.render(self.prompt, True, self.text_color)
+        prompt_surface = Typography().render(self.prompt, 32, self.text_color)
         screen.blit(prompt_surface, (self.rect.x, self.rect.y - 30))
         
         screen.fill(self.background_color, self.rect)
 
-        txt_surface = self.font.render(self.text, True, self.text_color)
+        txt_surface = Typography().render(self.text, 32, self.text_color)
         screen.blit(txt_surface, (self.rect.x+5, self.rect.y+5))
 
         border_color = self.color_active if self.active else self.color_inactive
@@ -0,0 +1,318 @@
+"""
+Prebuilt, memory-mappable image bundle.
+
+Build from the project root, after choosing the settings to ship:
+    python -m utils.asset_bundle --output assets.bundle
+    python -m utils.asset_bundle --output assets.bundle --all
+
+Each image variant the game asks AssetManager for (path, size, alpha) is
+decoded, scaled and converted once here and stored as raw 32-bit pixels. At
+runtime AssetManager maps the file and wraps each variant's bytes in a
+surface, so no PNG or WebP is decoded and only the pages of the variants
+actually drawn are read from disk. Variants missing from the bundle, e.g.
+after changing SCREEN_WIDTH, are still decoded from img/ as before, and so
+are variants whose source image has changed since the bundle was built.
+
+By default only the selected ball, paddle, brick and background are bundled,
+with the buttons and tabs: the bundle ships alongside img/, and raw pixels of
+every choice would store each image a second time at several times its
+compressed size. --all bundles every choice offered in the settings menu.
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import pygame as pg
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+AssetKey = Tuple[str, Optional[Tuple[int, int]], bool]
+Entry = Tuple[int, int, int]  # Offset, width, height
+Source = Tuple[int, int]  # Size in bytes, modification time in nanoseconds
+
+class AssetBundle:
+    """
+    A read-only view of a bundle file.
+
+    File layout (little-endian):
+        header  magic, version, index offset and length (HEADER)
+        pixels  one BGRA block per variant, each starting on an ALIGN boundary
+        index   UTF-8 JSON list of [path, size or null, alpha, offset, width, height,
+                source file size, source file mtime in ns]
+
+    The file is mapped copy-on-write, so surfaces built on it share the page
+    cache and a caller drawing onto one (against AssetManager's rules) only
+    changes its private copy.
+
+    A variant is stale when its source image's size or mtime differs from the
+    recorded one. Comparing the stat is one system call per image instead of
+    reading and hashing it, at the price of treating a touched but unchanged
+    file as stale, which only costs a decode. A missing source is not stale,
+    and neither is anything in a frozen build: PyInstaller rewrites mtimes when
+    it extracts img/, and the images there were packed with the bundle.
+
+    Attributes:
+        path (str): The bundle file.
+        entries (Dict[AssetKey, Entry]): Where each variant's pixels are.
+        sources (Dict[str, Source]): The stat of each source image when the bundle was built.
+        fresh (Dict[str, bool]): Whether each source image checked so far is unchanged.
+    """
+
+    MAGIC: bytes = b"BBAB"
+    VERSION: int = 2
+    HEADER = struct.Struct("<4sHQI")
+    ALIGN: int = 64
+    PIXEL_FORMAT: str = "BGRA"  # Byte order of a 32-bit ARGB surface on little-endian machines
+
+    def __init__(self, path: str) -> None:
+        """
+        Maps a bundle file and reads its index.
+
+        Args:
+            path (str): The bundle file.
+
+        Raises:
+            ValueError: If the file is not a bundle of a supported version.
+        """
+        self.path: str = path
+        with open(path, "rb") as file:
+            self.map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_offset, index_length = self.HEADER.unpack_from(self.map, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.map.close()
+            raise ValueError("Not a Brick Breaker asset bundle, or from an unsupported version")
+        index: List[List[Any]] = json.loads(self.map[index_offset:index_offset + index_length])
+        self.entries: Dict[AssetKey, Entry] = {}
+        self.sources: Dict[str, Source] = {}
+        for path, size, alpha, offset, width, height, source_size, source_mtime in index:
+            key: AssetKey = self.key(path, size, alpha)
+            self.entries[key] = (offset, width, height)
+            self.sources[key[0]] = (source_size, source_mtime)
+        self.fresh: Dict[str, bool] = {}
+        self.view: memoryview = memoryview(self.map)
+        self.alpha_masks: Optional[Tuple[int, ...]] = None
+
+    @classmethod
+    def open(cls, path: Optional[str]) -> Optional["AssetBundle"]:
+        """
+        Maps a bundle if the file exists.
+
+        Args:
+            path (Optional[str]): The bundle file, or None or "" for none.
+
+        Returns:
+            Optional[AssetBundle]: The bundle, or None if there is no usable file.
+        """
+        if not path or not os.path.isfile(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    @staticmethod
+    def key(path: str, size: Optional[Iterable[int]], alpha: bool) -> AssetKey:
+        """
+        Builds the lookup key of a variant, with the path normalized for the platform.
+
+        Args:
+            path (str): The image path as written in settings.
+            size (Optional[Iterable[int]]): The (width, height) it is scaled to, or None for the original size.
+            alpha (bool): Whether it keeps per-pixel alpha.
+
+        Returns:
+            AssetKey: The key.
+        """
+        scaled: Optional[Tuple[int, int]] = tuple(int(value) for value in size) if size is not None else None
+        return os.path.normpath(path.replace("\\", os.sep)), scaled, bool(alpha)
+
+    def __contains__(self, key: AssetKey) -> bool:
+        """
+        Returns whether the bundle holds a variant.
+
+        Args:
+            key (AssetKey): The variant, as passed to AssetManager.image.
+
+        Returns:
+            bool: True if it is bundled.
+        """
+        return self.key(*key) in self.entries
+
+    @staticmethod
+    def stat(path: str) -> Source:
+        """
+        Reads the size and modification time recorded for a source image.
+
+        Args:
+            path (str): The image file.
+
+        Returns:
+            Source: Its size in bytes and mtime in nanoseconds.
+        """
+        status: os.stat_result = os.stat(path)
+        return status.st_size, status.st_mtime_ns
+
+    def is_fresh(self, path: str) -> bool:
+        """
+        Returns whether a source image is unchanged since the bundle was built, checking each image once.
+
+        Args:
+            path (str): The image path as passed to AssetManager.image.
+
+        Returns:
+            bool: False if the file's size or mtime differs from the recorded one.
+        """
+        source: str = self.key(path, None, True)[0]
+        if source not in self.fresh:
+            try:
+                self.fresh[source] = getattr(sys, "frozen", False) or self.stat(path) == self.sources[source]
+            except OSError:
+                self.fresh[source] = True  # Not shipped: the bundled copy is all there is
+        return self.fresh[source]
+
+    def surface(self, key: AssetKey) -> Optional[pg.Surface]:
+        """
+        Creates a surface on a variant's mapped pixels.
+
+        Alpha variants are used in place when the display's alpha format
+        matches the stored one; opaque variants, and any variant on a display
+        with another format, are converted, which copies but never decodes.
+
+        Args:
+            key (AssetKey): The variant, as passed to AssetManager.image.
+
+        Returns:
+            Optional[pg.Surface]: The surface, or None if the variant is not bundled or its source has changed.
+        """
+        entry: Optional[Entry] = self.entries.get(self.key(*key))
+        if entry is None or not self.is_fresh(key[0]):
+            return None
+        offset, width, height = entry
+        surface: pg.Surface = pg.image.frombuffer(self.view[offset:offset + width * height * 4], (width, height), self.PIXEL_FORMAT)
+        if pg.display.get_surface() is None:
+            return surface
+        if not key[2]:
+            return surface.convert()
+        if self.alpha_masks is None:
+            self.alpha_masks = tuple(pg.Surface((1, 1), pg.SRCALPHA).convert_alpha().get_masks())
+        return surface if tuple(surface.get_masks()) == self.alpha_masks else surface.convert_alpha()
+
+    @classmethod
+    def build(cls, path: str, variants: Iterable[AssetKey]) -> int:
+        """
+        Decodes, scales and converts image variants and writes them to a bundle file.
+
+        The variants are produced the way AssetManager produces them and are
+        streamed to disk one at a time. The file is written next to its
+        destination and moved into place, so the game never maps a
+        half-written bundle.
+
+        Args:
+            path (str): The bundle file to write.
+            variants (Iterable[AssetKey]): The (path, size, alpha) variants to include.
+
+        Returns:
+            int: The number of variants written.
+        """
+        from utils.asset_manager import AssetManager
+        index: List[List[Any]] = []
+        source: Optional[Tuple[str, bool]] = None
+        original: Optional[pg.Surface] = None
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary: str = path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(b"\0" * cls.aligned(cls.HEADER.size))
+            for image_path, size, alpha in dict.fromkeys(variants):
+                if source != (image_path, alpha):  # Variants of one image are listed together; keep one original decoded
+                    source, original = (image_path, alpha), AssetManager.convert(pg.image.load(image_path), alpha)
+                surface: pg.Surface = original if size is None else pg.transform.scale(original, size)
+                index.append([image_path, list(size) if size is not None else None, alpha, file.tell(), *surface.get_size(),
+                              *cls.stat(image_path)])
+                file.write(pg.image.tobytes(surface, cls.PIXEL_FORMAT))
+                file.write(b"\0" * (cls.aligned(file.tell()) - file.tell()))
+            index_offset: int = file.tell()
+            index_blob: bytes = json.dumps(index).encode("utf-8")
+            file.write(index_blob)
+            file.seek(0)
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, index_offset, len(index_blob)))
+        os.replace(temporary, path)
+        return len(index)
+
+    @classmethod
+    def aligned(cls, offset: int) -> int:
+        """
+        Rounds an offset up to the next ALIGN boundary.
+
+        Args:
+            offset (int): The byte offset.
+
+        Returns:
+            int: The aligned offset.
+        """
+        return -(-offset // cls.ALIGN) * cls.ALIGN
+
+    def close(self) -> None:
+        """
+        Releases the view and the mapping. Surfaces made from the bundle must be dropped first.
+        """
+        self.view.release()
+        self.map.close()
+
+
+def referenced_variants(selected_only: bool = False) -> List[AssetKey]:
+    """
+    Lists the image variants the game can request with the current settings.
+
+    Args:
+        selected_only (bool): Only the selected ball, paddle, brick and background,
+            rather than every choice offered in the settings menu.
+
+    Returns:
+        List[AssetKey]: The variants, without duplicates.
+    """
+    from settings import Settings
+    get = Settings().get
+
+    def choices(selected: str, options: str) -> List[str]:
+        return [get(selected)] if selected_only else [get(selected)] + list(get(options))
+
+    screen_size: Tuple[int, int] = (get("SCREEN_WIDTH"), get("SCREEN_HEIGHT"))
+    ball_size: Tuple[int, int] = (get("BALL_RADIUS") * 2, get("BALL_RADIUS") * 2)
+    variants: List[AssetKey] = []
+    variants += [(path, screen_size, False) for path in choices("BACKGROUND_IMG", "BACKGROUND_IMAGES")]
+    for path in choices("BALL_IMG", "BALL_IMAGES"):
+        variants += [(path, ball_size, True), (path, (20, 20), True)]  # Sprite and player lives
+    for path in choices("PADDLE_IMG", "PADDLE_IMAGES"):
+        variants += [(path, None, True), (path, tuple(get("PADDLE_SIZE")), True)]
+    variants += [(path, tuple(get("BRICK_SIZE")), True) for path in choices("BRICK_IMG", "BRICK_IMAGES")]
+    variants += [(get(key), (200, 100), True) for key in ("PLAY_BUTTON_IMG", "SETTINGS_BUTTON_IMG", "HIGH_SCORES_BUTTON_IMG")]
+    variants += [(get(key), (50, 50), True) for key in ("SOUND_ENABLED_IMAGE", "SOUND_DISABLED_IMAGE")]
+    variants += [(path, None, True) for key in ("TAB_IMAGES", "TAB_HOVER_IMAGES", "TAB_SELECTED_IMAGES") for path in get(key)]
+    return list(dict.fromkeys(variants))
+
+
+def main() -> None:
+    """
+    Parses the command line and builds the bundle.
+    """
+    parser = argparse.ArgumentParser(description="Prebuild the images referenced by settings.json into a mappable bundle.")
+    parser.add_argument("--output", default=None, help="the bundle file (default: the ASSET_BUNDLE setting)")
+    parser.add_argument("--all", action="store_true", help="every choice offered in the settings menu, not only the selected ones")
+    args = parser.parse_args()
+
+    from settings import Settings
+    pg.init()
+    pg.display.set_mode((1, 1))
+    output: str = args.output or Settings().get("ASSET_BUNDLE")
+    count: int = AssetBundle.build(output, referenced_variants(selected_only=not args.all))
+    print(f"{count} variants, {os.path.getsize(output) / (1024 * 1024):.1f} MB written to {output}")
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+import pygame as pg
+from settings import Settings
+from utils.asset_bundle import AssetBundle
+
+AssetKey = Tuple[str, Optional[Tuple[int, int]], bool]
+
+class AssetManager:
+    """
+    A process-wide cache of decoded and scaled images.
+
+    Every (path, size, alpha) variant is decoded and scaled once, converted to the
+    display format when a display exists, and handed out as a shared surface.
+    The cache holds at most ASSET_CACHE_MB megabytes of pixel data and evicts
+    the least recently used surfaces beyond that. A scaled request decodes the
+    original image without caching it, unless the original size is requested
+    itself, so unused full-size images do not take up the budget.
+
+    When the ASSET_BUNDLE file exists, variants it holds are created on its
+    memory-mapped pixels instead of being decoded and scaled.
+
+    Surfaces returned by the manager are shared: callers must copy them before
+    drawing onto them.
+
+    Attributes:
+        budget_bytes (int): The maximum number of bytes of pixel data kept in the cache.
+        bytes_used (int): The number of bytes of pixel data currently cached.
+        hits (int): The number of requests served from the cache.
+        misses (int): The number of requests that had to decode or scale an image.
+        evictions (int): The number of surfaces dropped to stay within the budget.
+        bundle (Optional[AssetBundle]): The prebuilt bundle, or None if there is none.
+    """
+
+    _instance = None # Singleton instance of the AssetManager class
+
+    def __new__(cls) -> "AssetManager":
+        """
+        Create or return the shared AssetManager instance.
+
+        Returns:
+            AssetManager: The AssetManager instance.
+        """
+        if cls._instance is None:
+            cls._instance = super(AssetManager, cls).__new__(cls)
+            cls._instance.settings = Settings()
+            cls._instance.budget_bytes = int(cls._instance.settings.get("ASSET_CACHE_MB") * 1024 * 1024)
+            cls._instance.cache = OrderedDict()
+            cls._instance.lock = threading.RLock()
+            cls._instance.bytes_used = 0
+            cls._instance.hits = 0
+            cls._instance.misses = 0
+            cls._instance.evictions = 0
+            cls._instance.bundle = AssetBundle.open(cls._instance.settings.get("ASSET_BUNDLE"))
+        return cls._instance
+
+    def image(self, path: str, size: Optional[Sequence[int]] = None, alpha: bool = True) -> pg.Surface:
+        """
+        Get an image, decoding and scaling it only the first time it is requested.
+
+        Args:
+            path (str): The path of the image file.
+            size (Optional[Sequence[int]]): The (width, height) to scale to, or None for the original size.
+            alpha (bool): Whether to keep per-pixel alpha (convert_alpha) or not (convert).
+
+        Returns:
+            pg.Surface: The shared surface.
+        """
+        key: AssetKey = (path, (int(size[0]), int(size[1])) if size is not None else None, alpha)
+        cached: Optional[pg.Surface] = self.lookup(key)
+        if cached is not None:
+            return cached
+
+        bundled: Optional[pg.Surface] = self.bundle.surface(key) if self.bundle is not None else None
+        if bundled is not None:
+            return self.store(key, bundled)
+        with self.lock:
+            original: Optional[pg.Surface] = self.cache.get((path, None, alpha))
+        if original is None:
+            original = self.convert(pg.image.load(path), alpha)
+        if key[1] is None:
+            return self.store(key, original)
+        return self.store(key, pg.transform.scale(original, key[1]))  # The original is only cached when asked for
+
+    def lookup(self, key: AssetKey) -> Optional[pg.Surface]:
+        """
+        Get a cached surface and mark it as recently used.
+
+        Args:
+            key (AssetKey): The (path, size, alpha) key.
+
+        Returns:
+            Optional[pg.Surface]: The cached surface, or None on a miss.
+        """
+        with self.lock:
+            surface: Optional[pg.Surface] = self.cache.get(key)
+            if surface is None:
+                self.misses += 1
+                return None
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return surface
+
+    def store(self, key: AssetKey, surface: pg.Surface) -> pg.Surface:
+        """
+        Add a surface to the cache and evict old entries beyond the budget.
+
+        Args:
+            key (AssetKey): The (path, size, alpha) key.
+            surface (pg.Surface): The surface to cache.
+
+        Returns:
+            pg.Surface: The cached surface (an existing one if another caller stored it first).
+        """
+        with self.lock:
+            if key in self.cache:
+                return self.cache[key]
+            self.cache[key] = surface
+            self.bytes_used += self.surface_bytes(surface)
+            while self.bytes_used > self.budget_bytes and len(self.cache) > 1:
+                evicted_key, evicted = self.cache.popitem(last=False)
+                self.bytes_used -= self.surface_bytes(evicted)
+                self.evictions += 1
+            return surface
+
+    @staticmethod
+    def convert(surface: pg.Surface, alpha: bool) -> pg.Surface:
+        """
+        Convert a surface to the display format if a display has been set up.
+
+        Args:
+            surface (pg.Surface): The decoded surface.
+            alpha (bool): Whether to keep per-pixel alpha.
+
+        Returns:
+            pg.Surface: The converted surface, or the original one without a display.
+        """
+        if pg.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    @staticmethod
+    def surface_bytes(surface: pg.Surface) -> int:
+        """
+        Estimate the pixel memory held by a surface.
+
+        Args:
+            surface (pg.Surface): The surface to measure.
+
+        Returns:
+            int: The size of the pixel buffer in bytes.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, int]: Hits, misses, evictions, cached entries and bytes used.
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.cache),
+                "bytes": self.bytes_used,
+            }
+
+    def clear(self) -> None:
+        """
+        Drop every cached surface and reset the statistics.
+        """
+        with self.lock:
+            self.cache.clear()
+            self.bytes_used = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
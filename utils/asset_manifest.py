@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+class AssetManifest:
+    """
+    A persisted index of the image files under the asset directory.
+
+    Each directory is recorded with its modification time, its subdirectories and
+    the size, mtime, dimensions and hash of each file in it. Adding, removing or
+    renaming a file changes its directory's mtime, so refresh() only lists and
+    hashes directories whose mtime moved and reuses the stored records for the
+    rest.
+
+    Attributes:
+        root (str): The asset directory to index.
+        filename (str): The path of the manifest file.
+        directories (Dict[str, dict]): The manifest entry for every indexed directory.
+        rescanned (List[str]): The directories listed again by the last refresh().
+    """
+
+    VERSION: int = 1
+    CATEGORIES: Tuple[Tuple[str, str], ...] = (
+        ("ball", "BALL_IMAGES"),
+        ("paddle", "PADDLE_IMAGES"),
+        ("background", "BACKGROUND_IMAGES"),
+        ("brick", "BRICK_IMAGES"),
+    )
+
+    def __init__(self, root: str = "img", filename: str = "asset_manifest.json") -> None:
+        """
+        Initializes an AssetManifest and loads the stored manifest if there is one.
+
+        Args:
+            root (str): The asset directory to index.
+            filename (str): The path of the manifest file.
+        """
+        self.root: str = root
+        self.filename: str = filename
+        self.directories: Dict[str, dict] = self.load()
+        self.rescanned: List[str] = []
+
+    def load(self) -> Dict[str, dict]:
+        """
+        Load the stored manifest.
+
+        Returns:
+            Dict[str, dict]: The stored directory entries, or an empty dict if the file is missing or stale.
+        """
+        try:
+            with open(self.filename, "r") as file:
+                data = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if data.get("version") != self.VERSION or data.get("root") != self.root:
+            return {}
+        return data.get("directories", {})
+
+    def save(self) -> None:
+        """
+        Write the manifest atomically.
+        """
+        temp_filename: str = self.filename + ".tmp"
+        with open(temp_filename, "w") as file:
+            json.dump({"version": self.VERSION, "root": self.root, "directories": self.directories}, file)
+        os.replace(temp_filename, self.filename)
+
+    def refresh(self) -> bool:
+        """
+        Bring the manifest up to date, rescanning only directories that changed.
+
+        Returns:
+            bool: Whether anything changed (the manifest is saved if so).
+        """
+        previous: Dict[str, dict] = self.directories
+        self.directories = {}
+        self.rescanned = []
+        if os.path.isdir(self.root):
+            self.scan_directory(self.root, previous)
+        changed: bool = self.directories != previous
+        if changed:
+            self.save()
+        return changed
+
+    def scan_directory(self, path: str, previous: Dict[str, dict]) -> None:
+        """
+        Index a directory and its subdirectories.
+
+        Args:
+            path (str): The directory to index.
+            previous (Dict[str, dict]): The entries from the last refresh.
+        """
+        mtime: float = os.stat(path).st_mtime
+        entry: Optional[dict] = previous.get(path)
+        if entry is None or entry["mtime"] != mtime:
+            old_files: Dict[str, dict] = entry["files"] if entry is not None else {}
+            entry = {"mtime": mtime, "dirs": [], "files": {}}
+            with os.scandir(path) as scanned:
+                for item in sorted(scanned, key=lambda item: item.name):
+                    if item.is_dir():
+                        entry["dirs"].append(item.name)
+                    elif item.is_file():
+                        entry["files"][item.name] = self.describe_file(item.path, item.stat(), old_files.get(item.name))
+            self.rescanned.append(path)
+        self.directories[path] = entry
+        for name in entry["dirs"]:
+            self.scan_directory(os.path.join(path, name), previous)
+
+    def describe_file(self, path: str, stat: os.stat_result, old: Optional[dict]) -> dict:
+        """
+        Build the manifest record for a file, reusing the old one if the file is unchanged.
+
+        Args:
+            path (str): The file path.
+            stat (os.stat_result): The file's stat result.
+            old (Optional[dict]): The record from the last refresh, if any.
+
+        Returns:
+            dict: The size, mtime, width, height and hash of the file.
+        """
+        if old is not None and old["size"] == stat.st_size and old["mtime"] == stat.st_mtime:
+            return old
+        with open(path, "rb") as file:
+            data: bytes = file.read()
+        width, height = self.image_size(data)
+        return {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "width": width,
+            "height": height,
+            "hash": hashlib.blake2b(data, digest_size=16).hexdigest(),
+        }
+
+    @staticmethod
+    def image_size(data: bytes) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Read the dimensions of a PNG, GIF or WebP image from its header.
+
+        Args:
+            data (bytes): The file contents.
+
+        Returns:
+            Tuple[Optional[int], Optional[int]]: The (width, height), or (None, None) for other formats.
+        """
+        if data[:8] == b"\x89PNG\r\n\x1a\n" and len(data) >= 24:
+            return struct.unpack(">II", data[16:24])
+        if data[:6] in (b"GIF87a", b"GIF89a") and len(data) >= 10:
+            return struct.unpack("<HH", data[6:10])
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP" and len(data) >= 30:
+            chunk: bytes = data[12:16]
+            if chunk == b"VP8 ":
+                width, height = struct.unpack("<HH", data[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b"VP8L":
+                bits: int = int.from_bytes(data[21:25], "little")
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b"VP8X":
+                return int.from_bytes(data[24:27], "little") + 1, int.from_bytes(data[27:30], "little") + 1
+        return None, None
+
+    def image_lists(self) -> Dict[str, List[str]]:
+        """
+        Group the indexed files into the settings image lists by directory name.
+
+        Returns:
+            Dict[str, List[str]]: BALL_IMAGES, PADDLE_IMAGES, BACKGROUND_IMAGES and BRICK_IMAGES.
+        """
+        lists: Dict[str, List[str]] = {key: [] for _, key in self.CATEGORIES}
+        for path, entry in self.directories.items():
+            for word, key in self.CATEGORIES:
+                if word in path:
+                    lists[key].extend(os.path.join(path, name) for name in entry["files"])
+                    break
+        return lists
@@ -1,5 +1,6 @@
 from typing import List
 from settings import Settings
+from utils.asset_manager import AssetManager
 import pygame as pg
 
 class BackgroundMusic:
@@ -16,10 +17,8 @@ class BackgroundMusic:
         self.SOUND_DISABLED_IMAGE: str = self.settings.get("SOUND_DISABLED_IMAGE")
         self.VOLUME: float = self.settings.get("VOLUME")
         self.enabled: bool = True
-        self.enabled_image: pg.Surface = pg.image.load(self.SOUND_ENABLED_IMAGE)
-        self.enabled_image = pg.transform.scale(self.enabled_image, (50, 50))
-        self.disabled_image: pg.Surface = pg.image.load(self.SOUND_DISABLED_IMAGE)
-        self.disabled_image = pg.transform.scale(self.disabled_image, (50, 50))
+        self.enabled_image: pg.Surface = AssetManager().image(self.SOUND_ENABLED_IMAGE, (50, 50))
+        self.disabled_image: pg.Surface = AssetManager().image(self.SOUND_DISABLED_IMAGE, (50, 50))
         self.current_image: pg.Surface = self.enabled_image
         self.playlist: List[str] = self.settings.get("MUSIC_PLAYLIST")
         self.current_track_index: int = 0
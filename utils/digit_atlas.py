@@ -0,0 +1,62 @@
+from typing import Dict, Tuple
+import pygame as pg
+
+class DigitAtlas:
+    """
+    Pre-rendered digit glyphs for numbers that change every few frames.
+
+    Each of "0123456789-" is rendered once; drawing a number is then one blit
+    per digit instead of a font render and a new surface per change.
+
+    Attributes:
+        glyphs (Dict[str, pg.Surface]): The rendered glyph for each character.
+        advances (Dict[str, int]): The horizontal advance of each character.
+        height (int): The height of every glyph.
+    """
+
+    CHARACTERS: str = "0123456789-"
+
+    def __init__(self, font: pg.font.Font, color: Tuple[int, int, int]) -> None:
+        """
+        Initializes a DigitAtlas by rendering every glyph.
+
+        Args:
+            font (pg.font.Font): The font to render with.
+            color (Tuple[int, int, int]): The glyph color.
+        """
+        self.glyphs: Dict[str, pg.Surface] = {}
+        self.advances: Dict[str, int] = {}
+        for character in self.CHARACTERS:
+            self.glyphs[character] = font.render(character, True, color)
+            self.advances[character] = font.size(character)[0]
+        self.height: int = font.get_height()
+
+    def width(self, value: int) -> int:
+        """
+        Returns the width a number takes up when drawn.
+
+        Args:
+            value (int): The number.
+
+        Returns:
+            int: The width in pixels.
+        """
+        return sum(self.advances[character] for character in str(value))
+
+    def draw(self, screen: pg.Surface, value: int, position: Tuple[int, int]) -> pg.Rect:
+        """
+        Draws a number with its top-left corner at a position.
+
+        Args:
+            screen (pg.Surface): The surface to draw on.
+            value (int): The number to draw.
+            position (Tuple[int, int]): The top-left corner.
+
+        Returns:
+            pg.Rect: The area of the screen that was drawn.
+        """
+        x, y = position
+        for character in str(value):
+            screen.blit(self.glyphs[character], (x, y))
+            x += self.advances[character]
+        return pg.Rect(position[0], y, x - position[0], self.height)
@@ -0,0 +1,143 @@
+from typing import List, Optional
+import pygame as pg
+from levels.level import Level
+
+class DirtyRectRenderer:
+    """
+    Redraws and presents only the parts of the screen that changed.
+
+    The background and the static bricks are composited once into a backdrop.
+    Each frame the areas drawn in the previous frame are restored from the
+    backdrop, the moving entities are drawn again, and only the restored and
+    newly drawn areas are pushed with pg.display.update(rects). Destroyed
+    static bricks are erased from the backdrop and pushed once.
+
+    This relies on the display keeping its contents between frames, which holds
+    for the plain software window the game opens.
+
+    Attributes:
+        screen (pg.Surface): The display surface.
+        background (pg.Surface): The full-screen background image.
+        backdrop (pg.Surface): The background with the static bricks drawn on it.
+        level (Optional[Level]): The level the backdrop was built for.
+        previous_rects (List[pg.Rect]): The areas drawn over the backdrop last frame.
+        drawn_rects (List[pg.Rect]): The areas drawn over the backdrop this frame.
+        restored_rects (List[pg.Rect]): The areas restored from the backdrop this frame.
+        dirty_rects (List[pg.Rect]): The areas to push to the display for this frame.
+        full_redraw (bool): Whether the next frame must redraw and push the whole screen.
+    """
+
+    # Push the whole screen once the dirty areas cover this share of it
+    FULL_UPDATE_RATIO: float = 0.5
+
+    def __init__(self, screen: pg.Surface, background: pg.Surface) -> None:
+        """
+        Initializes a DirtyRectRenderer.
+
+        Args:
+            screen (pg.Surface): The display surface.
+            background (pg.Surface): The full-screen background image.
+        """
+        self.screen: pg.Surface = screen
+        self.background: pg.Surface = background
+        self.backdrop: pg.Surface = background.copy()
+        self.level: Optional[Level] = None
+        self.previous_rects: List[pg.Rect] = []
+        self.drawn_rects: List[pg.Rect] = []
+        self.restored_rects: List[pg.Rect] = []
+        self.dirty_rects: List[pg.Rect] = []
+        self.full_redraw: bool = True
+
+    def invalidate(self) -> None:
+        """
+        Forces the next frame to redraw and push the whole screen.
+        """
+        self.full_redraw = True
+
+    def sync_level(self, level: Level) -> None:
+        """
+        Rebuilds the backdrop for a new level, or erases bricks destroyed since the last frame.
+
+        Args:
+            level (Level): The level being drawn.
+        """
+        if level is not self.level:
+            self.level = level
+            self.backdrop = self.background.copy()
+            level.draw_static_bricks(self.backdrop)
+            level.destroyed_rects.clear()
+            level.track_destroyed = True
+            self.full_redraw = True
+            return
+        for rect in level.destroyed_rects:
+            self.backdrop.blit(self.background, rect, rect)
+            self.restored_rects.append(rect)
+        level.destroyed_rects.clear()
+
+    def begin_frame(self, level: Level) -> None:
+        """
+        Restores the areas drawn last frame from the backdrop.
+
+        Args:
+            level (Level): The level being drawn.
+        """
+        self.restored_rects = []
+        self.drawn_rects = []
+        self.sync_level(level)
+        if self.full_redraw:
+            self.screen.blit(self.backdrop, (0, 0))
+            return
+        self.restored_rects.extend(self.previous_rects)
+        for rect in self.restored_rects:
+            self.screen.blit(self.backdrop, rect, rect)
+
+    def mark(self, rect: Optional[pg.Rect]) -> None:
+        """
+        Records an area drawn over the backdrop this frame.
+
+        Args:
+            rect (Optional[pg.Rect]): The area, as returned by Surface.blit.
+        """
+        if rect is not None:
+            self.drawn_rects.append(rect)
+
+    def end_frame(self) -> List[pg.Rect]:
+        """
+        Works out which areas to push to the display for this frame.
+
+        Returns:
+            List[pg.Rect]: The dirty areas.
+        """
+        screen_rect: pg.Rect = self.screen.get_rect()
+        if not self.full_redraw:
+            self.dirty_rects = [rect.clip(screen_rect) for rect in self.restored_rects + self.drawn_rects]
+            self.dirty_rects = [rect for rect in self.dirty_rects if rect.width and rect.height]
+            dirty_area: int = sum(rect.width * rect.height for rect in self.dirty_rects)
+            if dirty_area > screen_rect.width * screen_rect.height * self.FULL_UPDATE_RATIO:
+                self.full_redraw = True
+        if self.full_redraw:
+            self.dirty_rects = [screen_rect]
+        self.previous_rects = self.drawn_rects
+        self.full_redraw = False
+        return self.dirty_rects
+
+    def mark_late(self, rect: Optional[pg.Rect]) -> None:
+        """
+        Records an area drawn after end_frame, such as a debug overlay, so it is
+        pushed this frame and restored from the backdrop next frame.
+
+        Args:
+            rect (Optional[pg.Rect]): The area, as returned by Surface.blit.
+        """
+        if rect is None:
+            return
+        self.previous_rects.append(rect)
+        clipped: pg.Rect = rect.clip(self.screen.get_rect())
+        if clipped.width and clipped.height and self.dirty_rects != [self.screen.get_rect()]:
+            self.dirty_rects.append(clipped)
+
+    def present(self) -> None:
+        """
+        Pushes this frame's dirty areas to the display.
+        """
+        pg.display.update(self.dirty_rects)
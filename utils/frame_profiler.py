@@ -0,0 +1,258 @@
+import contextlib
+import csv
+import json
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import pygame as pg
+from settings import Settings
+from utils.typography import Typography
+
+Event = Tuple[str, int, int]  # Stage name, start and duration in nanoseconds
+FrameRecord = Tuple[int, int, List[Event]]  # Frame start, frame duration, stage events
+
+NULL_STAGE = contextlib.nullcontext()  # Returned by stage() while profiling is off
+
+class FrameProfiler:
+    """
+    A process-wide recorder of how long each part of a frame takes.
+
+    Code wraps a stage in `with FrameProfiler().stage("collision"):`; the main
+    loop brackets each frame with begin_frame and end_frame. The last
+    PROFILER_FRAMES frames are kept in a ring buffer and can be shown as an
+    on-screen graph (F3 in game) or exported as a Chrome trace or CSV. While
+    disabled, stage() hands back a shared no-op context, so instrumented code
+    costs one attribute check per stage.
+
+    Stages may nest; a stage entered several times in a frame (e.g. once per
+    physics step) is summed for that frame.
+
+    Attributes:
+        enabled (bool): Whether frames are being recorded.
+        overlay_visible (bool): Whether draw() shows the overlay.
+        frames (Deque[FrameRecord]): The most recent frames, oldest first.
+        stage_names (List[str]): Every stage seen, in first-seen order.
+        budget_ms (float): The frame time budget drawn on the graph, from FPS.
+    """
+
+    _instance = None # Singleton instance of the FrameProfiler class
+
+    GRAPH_FRAMES: int = 120  # Frames shown in the overlay graph
+    REFRESH_FRAMES: int = 30  # Frames between overlay text updates
+
+    def __new__(cls) -> "FrameProfiler":
+        """
+        Create or return the shared FrameProfiler instance.
+
+        Returns:
+            FrameProfiler: The FrameProfiler instance.
+        """
+        if cls._instance is None:
+            cls._instance = super(FrameProfiler, cls).__new__(cls)
+            settings: Settings = Settings()
+            cls._instance.enabled = bool(settings.get("PROFILER_ENABLED"))
+            cls._instance.overlay_visible = False
+            cls._instance.frames = deque(maxlen=max(1, settings.get("PROFILER_FRAMES")))
+            cls._instance.stage_names = []
+            cls._instance.budget_ms = 1000.0 / max(1, settings.get("FPS"))
+            cls._instance.events = []
+            cls._instance.names = []
+            cls._instance.starts = []
+            cls._instance.frame_start = None
+            cls._instance.overlay_lines = []
+            cls._instance.overlay_age = 0
+        return cls._instance
+
+    def stage(self, name: str) -> Any:
+        """
+        Returns a context that times a stage of the current frame.
+
+        Args:
+            name (str): The stage name, e.g. "collision".
+
+        Returns:
+            Any: A context manager; a shared no-op one while disabled.
+        """
+        if not self.enabled:
+            return NULL_STAGE
+        self.names.append(name)
+        return self
+
+    def __enter__(self) -> "FrameProfiler":
+        """
+        Starts timing the stage named by the last stage() call.
+
+        Returns:
+            FrameProfiler: The profiler.
+        """
+        self.starts.append(time.perf_counter_ns())
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        """
+        Stops timing the innermost stage.
+
+        Returns:
+            bool: False, so exceptions propagate.
+        """
+        end: int = time.perf_counter_ns()
+        start: int = self.starts.pop()
+        name: str = self.names.pop()
+        if name not in self.stage_names:
+            self.stage_names.append(name)
+        self.events.append((name, start, end - start))
+        return False
+
+    def begin_frame(self) -> None:
+        """
+        Marks the start of a frame.
+        """
+        if self.enabled:
+            self.frame_start = time.perf_counter_ns()
+            self.events = []
+
+    def end_frame(self) -> None:
+        """
+        Marks the end of a frame and stores it in the ring buffer.
+        """
+        if not self.enabled or self.frame_start is None:
+            return
+        self.frames.append((self.frame_start, time.perf_counter_ns() - self.frame_start, self.events))
+        self.events = []
+        self.frame_start = None
+
+    def toggle_overlay(self) -> None:
+        """
+        Shows or hides the overlay. Recording runs while it shows, or always with PROFILER_ENABLED.
+        """
+        self.overlay_visible = not self.overlay_visible
+        self.enabled = self.overlay_visible or bool(Settings().get("PROFILER_ENABLED"))
+        self.overlay_age = self.REFRESH_FRAMES  # Refresh the text on the next draw
+
+    def stage_totals(self, frame: FrameRecord) -> Dict[str, float]:
+        """
+        Sums a frame's time per stage.
+
+        Args:
+            frame (FrameRecord): The frame.
+
+        Returns:
+            Dict[str, float]: Milliseconds per stage.
+        """
+        totals: Dict[str, float] = {}
+        for name, _, duration in frame[2]:
+            totals[name] = totals.get(name, 0.0) + duration / 1e6
+        return totals
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarizes the buffered frames.
+
+        Returns:
+            Dict[str, Dict[str, float]]: For "frame" and each stage, p50, p99 and worst in milliseconds.
+        """
+        series: Dict[str, List[float]] = {"frame": [frame[1] / 1e6 for frame in self.frames]}
+        for name in self.stage_names:
+            series[name] = []
+        for frame in self.frames:
+            totals: Dict[str, float] = self.stage_totals(frame)
+            for name in self.stage_names:
+                series[name].append(totals.get(name, 0.0))
+        summary: Dict[str, Dict[str, float]] = {}
+        for name, values in series.items():
+            if not values:
+                continue
+            ordered: List[float] = sorted(values)
+            summary[name] = {
+                "p50": ordered[int(0.50 * (len(ordered) - 1))],
+                "p99": ordered[int(0.99 * (len(ordered) - 1))],
+                "worst": ordered[-1],
+            }
+        return summary
+
+    def draw(self, screen: pg.Surface) -> Optional[pg.Rect]:
+        """
+        Draws the overlay: a frame time graph against the budget, and p50/p99/worst per stage.
+
+        Args:
+            screen (pg.Surface): The surface to draw on.
+
+        Returns:
+            Optional[pg.Rect]: The area drawn, or None while the overlay is hidden.
+        """
+        if not self.overlay_visible:
+            return None
+        self.overlay_age += 1
+        if self.overlay_age >= self.REFRESH_FRAMES:
+            self.overlay_age = 0
+            font: pg.font.Font = Typography().font(None, 18)
+            lines: List[str] = [f"{'':<14}{'p50':>7}{'p99':>7}{'worst':>7}  ms"]
+            for name, summary in self.stats().items():
+                lines.append(f"{name:<14}{summary['p50']:>7.2f}{summary['p99']:>7.2f}{summary['worst']:>7.2f}")
+            self.overlay_lines = [font.render(line, True, (255, 255, 255)) for line in lines]
+
+        graph_height: int = 50
+        width: int = self.GRAPH_FRAMES * 2 + 20
+        height: int = graph_height + 20 + 16 * len(self.overlay_lines)
+        panel = pg.Surface((width, height), pg.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        recent: List[FrameRecord] = list(self.frames)[-self.GRAPH_FRAMES:]
+        scale_ms: float = max([self.budget_ms * 2] + [frame[1] / 1e6 for frame in recent])
+        for index, frame in enumerate(recent):
+            frame_ms: float = frame[1] / 1e6
+            bar: int = max(1, int(frame_ms / scale_ms * graph_height))
+            color: Tuple[int, int, int] = (90, 220, 90) if frame_ms <= self.budget_ms else (230, 70, 70)
+            pg.draw.rect(panel, color, (10 + index * 2, 10 + graph_height - bar, 2, bar))
+        budget_y: int = 10 + graph_height - int(self.budget_ms / scale_ms * graph_height)
+        pg.draw.line(panel, (240, 240, 90), (10, budget_y), (width - 10, budget_y))
+        for index, line in enumerate(self.overlay_lines):
+            panel.blit(line, (10, graph_height + 16 + index * 16))
+        return screen.blit(panel, (10, 10))
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Converts the buffered frames to the Chrome trace event format (chrome://tracing, Perfetto).
+
+        Returns:
+            Dict[str, Any]: The trace, with one complete event per frame and per stage.
+        """
+        origin: int = self.frames[0][0] if self.frames else 0
+        events: List[Dict[str, Any]] = []
+        for index, (start, duration, stages) in enumerate(self.frames):
+            events.append({"name": "frame", "ph": "X", "pid": 1, "tid": 1, "ts": (start - origin) / 1000,
+                           "dur": duration / 1000, "args": {"frame": index}})
+            for name, stage_start, stage_duration in stages:
+                events.append({"name": name, "ph": "X", "pid": 1, "tid": 1, "ts": (stage_start - origin) / 1000,
+                               "dur": stage_duration / 1000})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, directory: str) -> Tuple[str, str]:
+        """
+        Writes the buffered frames as a Chrome trace and as a CSV of milliseconds per frame and stage.
+
+        Args:
+            directory (str): The directory to write to; created if needed.
+
+        Returns:
+            Tuple[str, str]: The paths of the trace JSON and the CSV.
+        """
+        os.makedirs(directory, exist_ok=True)
+        stem: str = os.path.join(directory, time.strftime("frames-%Y%m%d-%H%M%S"))
+        with open(stem + ".json", "w") as file:
+            json.dump(self.chrome_trace(), file)
+        with open(stem + ".csv", "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame", "frame_ms"] + self.stage_names)
+            for index, frame in enumerate(self.frames):
+                totals: Dict[str, float] = self.stage_totals(frame)
+                writer.writerow([index, f"{frame[1] / 1e6:.4f}"] + [f"{totals.get(name, 0.0):.4f}" for name in self.stage_names])
+        return stem + ".json", stem + ".csv"
+
+    def clear(self) -> None:
+        """
+        Drops every buffered frame.
+        """
+        self.frames.clear()
+        self.stage_names = []
+        self.events = []
@@ -0,0 +1,263 @@
+"""
+Full-history leaderboard stored in SQLite.
+
+Query it from the project root:
+    python -m utils.leaderboard --top 20
+    python -m utils.leaderboard --difficulty 3 --since 2026-01-01 --until 2026-02-01
+"""
+import argparse
+import csv
+import os
+import sqlite3
+import time
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+from settings import Settings
+
+Entry = Tuple[str, int, Optional[float], Optional[float]]  # Name, score, starting difficulty, time played (Unix seconds)
+BoardKey = Tuple[int, Optional[float], Optional[float], Optional[float]]  # Top-N query: n, difficulty, since, until
+
+class Leaderboard:
+    """
+    Every submitted score, with indexed top-N queries per difficulty and date range.
+
+    Scores are never dropped. Equal scores rank in the order they were
+    submitted. Top-N results are cached until the next insert, so screens can
+    ask for them every frame. For rank lookups each board (all scores, or one
+    difficulty) keeps a sorted array of its scores, loaded from the score
+    index on first use and updated on insert, so a rank is one binary search.
+
+    Attributes:
+        path (str): The SQLite database file.
+        connection (sqlite3.Connection): The open database.
+        boards (Dict[Optional[float], array]): Sorted scores per difficulty; None holds every score.
+        cache (Dict[BoardKey, List[Entry]]): Top-N results since the last insert.
+        version (int): Bumped on every insert, for callers caching views of the board.
+    """
+
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            difficulty REAL,
+            played_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id);
+        CREATE INDEX IF NOT EXISTS scores_by_difficulty ON scores (difficulty, score DESC, id);
+        CREATE INDEX IF NOT EXISTS scores_by_time ON scores (played_at);
+    """
+
+    _shared: Optional["Leaderboard"] = None
+
+    def __init__(self, path: str, legacy_csv: Optional[str] = None) -> None:
+        """
+        Opens or creates a leaderboard database.
+
+        Args:
+            path (str): The SQLite database file.
+            legacy_csv (Optional[str]): A high_score.csv to import when the database is empty.
+        """
+        self.path: str = path
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection: sqlite3.Connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")  # Inserts append to the log instead of rewriting pages
+        self.connection.executescript(self.SCHEMA)
+        self.boards: Dict[Optional[float], array] = {}
+        self.cache: Dict[BoardKey, List[Entry]] = {}
+        self.version: int = 0
+        if legacy_csv is not None and len(self) == 0:
+            self.import_csv(legacy_csv)
+
+    @classmethod
+    def shared(cls) -> "Leaderboard":
+        """
+        Returns the leaderboard at LEADERBOARD_DB, opening it on first use.
+
+        Returns:
+            Leaderboard: The shared leaderboard.
+        """
+        if cls._shared is None:
+            cls._shared = cls(Settings().get("LEADERBOARD_DB"), "high_score.csv")
+        return cls._shared
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored scores.
+
+        Returns:
+            int: The score count.
+        """
+        return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    @staticmethod
+    def board(difficulty: Optional[float]) -> Optional[float]:
+        """
+        Normalizes a difficulty to its board key, so 1.2 and 1.2000000000000002 share a board.
+
+        Args:
+            difficulty (Optional[float]): The starting difficulty, or None.
+
+        Returns:
+            Optional[float]: The board key.
+        """
+        return round(float(difficulty), 2) if difficulty is not None else None
+
+    def import_csv(self, path: str) -> int:
+        """
+        Imports the name,score rows of a high_score.csv file.
+
+        Args:
+            path (str): The CSV file; a missing file imports nothing.
+
+        Returns:
+            int: The number of rows imported.
+        """
+        if not os.path.isfile(path):
+            return 0
+        rows: List[Tuple[str, int]] = []
+        with open(path, "r", newline="") as file:
+            for row in csv.reader(file):
+                try:
+                    rows.append((row[0], int(row[1])))
+                except (IndexError, ValueError):
+                    continue
+        rows.sort(key=lambda row: row[1], reverse=True)  # Keeps the file's order among equal scores
+        with self.connection:
+            self.connection.executemany("INSERT INTO scores (name, score) VALUES (?, ?)", rows)
+        self.boards.clear()
+        self.cache.clear()
+        self.version += 1
+        return len(rows)
+
+    def scores(self, difficulty: Optional[float]) -> array:
+        """
+        Returns a board's sorted scores, loading them from the index on first use.
+
+        Args:
+            difficulty (Optional[float]): The board's difficulty, or None for every score.
+
+        Returns:
+            array: The scores in ascending order.
+        """
+        key: Optional[float] = self.board(difficulty)
+        if key not in self.boards:
+            if key is None:
+                cursor = self.connection.execute("SELECT score FROM scores ORDER BY score")
+            else:
+                cursor = self.connection.execute("SELECT score FROM scores WHERE difficulty = ? ORDER BY score", (key,))
+            self.boards[key] = array("q", (row[0] for row in cursor))
+        return self.boards[key]
+
+    def rank(self, score: int, difficulty: Optional[float] = None) -> int:
+        """
+        Returns the place a new score would take, after existing equal scores.
+
+        Args:
+            score (int): The score.
+            difficulty (Optional[float]): Rank within this difficulty's board, or None for the overall board.
+
+        Returns:
+            int: The 1-based rank.
+        """
+        scores: array = self.scores(difficulty)
+        return len(scores) - bisect_left(scores, score) + 1
+
+    def add(self, name: str, score: int, difficulty: Optional[float] = None, played_at: Optional[float] = None) -> int:
+        """
+        Stores a score.
+
+        Args:
+            name (str): The player's name.
+            score (int): The score.
+            difficulty (Optional[float]): The difficulty the game started at.
+            played_at (Optional[float]): When the game was played (Unix seconds), or None for now.
+
+        Returns:
+            int: The score's overall rank.
+        """
+        key: Optional[float] = self.board(difficulty)
+        rank: int = self.rank(score)
+        with self.connection:
+            self.connection.execute("INSERT INTO scores (name, score, difficulty, played_at) VALUES (?, ?, ?, ?)",
+                                    (name, int(score), key, played_at if played_at is not None else time.time()))
+        for board in {None, key}:
+            if board in self.boards:
+                insort(self.boards[board], int(score))
+        self.cache.clear()
+        self.version += 1
+        return rank
+
+    def top(self, n: int = 10, difficulty: Optional[float] = None, since: Optional[float] = None,
+            until: Optional[float] = None) -> List[Entry]:
+        """
+        Returns the best scores, optionally of one difficulty and date range.
+
+        Args:
+            n (int): The number of scores.
+            difficulty (Optional[float]): Only scores of games started at this difficulty.
+            since (Optional[float]): Only scores played at or after this time (Unix seconds).
+            until (Optional[float]): Only scores played before this time (Unix seconds).
+
+        Returns:
+            List[Entry]: The scores, best first; equal scores in submission order.
+        """
+        key: BoardKey = (n, self.board(difficulty), since, until)
+        if key not in self.cache:
+            conditions: List[str] = []
+            parameters: List[float] = []
+            for condition, value in (("difficulty = ?", key[1]), ("played_at >= ?", since), ("played_at < ?", until)):
+                if value is not None:
+                    conditions.append(condition)
+                    parameters.append(value)
+            where: str = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            self.cache[key] = self.connection.execute(
+                f"SELECT name, score, difficulty, played_at FROM scores {where} ORDER BY score DESC, id LIMIT ?",
+                (*parameters, n)).fetchall()
+        return self.cache[key]
+
+    def close(self) -> None:
+        """
+        Closes the database.
+        """
+        self.connection.close()
+
+
+def parse_date(text: str) -> float:
+    """
+    Parses a YYYY-MM-DD date, in local time.
+
+    Args:
+        text (str): The date.
+
+    Returns:
+        float: Its start in Unix seconds.
+    """
+    return time.mktime(time.strptime(text, "%Y-%m-%d"))
+
+
+def main() -> None:
+    """
+    Parses the command line and prints a top-N table.
+    """
+    parser = argparse.ArgumentParser(description="Show the best scores from the leaderboard database.")
+    parser.add_argument("--db", default=None, help="the database (default: the LEADERBOARD_DB setting)")
+    parser.add_argument("--top", type=int, default=10, help="how many scores to show")
+    parser.add_argument("--difficulty", type=float, default=None, help="only games started at this difficulty")
+    parser.add_argument("--since", type=parse_date, default=None, metavar="YYYY-MM-DD", help="only games played on or after this day")
+    parser.add_argument("--until", type=parse_date, default=None, metavar="YYYY-MM-DD", help="only games played before this day")
+    args = parser.parse_args()
+
+    leaderboard = Leaderboard(args.db or Settings().get("LEADERBOARD_DB"))
+    for place, (name, score, difficulty, played_at) in enumerate(leaderboard.top(args.top, args.difficulty, args.since, args.until), 1):
+        level: str = f"{difficulty:g}" if difficulty is not None else "-"
+        played: str = time.strftime("%Y-%m-%d %H:%M", time.localtime(played_at)) if played_at is not None else "-"
+        print(f"{place:>4}. {name:<20} {score:>10} {level:>6} {played:>17}")
+    leaderboard.close()
+
+
+if __name__ == "__main__":
+    main()
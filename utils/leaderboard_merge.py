@@ -0,0 +1,355 @@
+"""
+Streaming merge of leaderboards from several machines.
+
+Run from the project root with any mix of high_score.csv files and
+leaderboard.db stores:
+    python -m utils.leaderboard_merge cabinet1/high_score.csv cabinet2/leaderboard.db --top 20
+    python -m utils.leaderboard_merge *.db --ranking ranking.csv --bests bests.csv
+
+Every source is read as a stream sorted best-first: stores through an
+ORDER BY query, CSV files through sorted runs of at most RUN_ROWS rows
+spilled to temporary files. heapq.merge then k-way merges the streams, so
+memory stays bounded by the run size and the number of sources however large
+the inputs are. Per-player bests are collected in a temporary SQLite table
+rather than in memory, filled in the same pass that writes the ranking.
+
+Ranking rules:
+- Entries with the same player, score and play time are one entry seen twice
+  (e.g. a cabinet's CSV and the store it was imported into); only the first is kept.
+- Players are matched ignoring case and surrounding spaces.
+- Equal scores share a rank (1, 2, 2, 4); within a tie, earlier games are listed first.
+"""
+import argparse
+import contextlib
+import csv
+import heapq
+import os
+import sqlite3
+import tempfile
+import time
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+Record = Tuple[int, Optional[float], str, str]  # Score, time played (Unix seconds), name, source path
+Ranked = Tuple[int, Record]  # Rank, record
+
+RUN_ROWS: int = 100000  # CSV rows sorted in memory at a time
+BATCH_ROWS: int = 10000  # Player-best rows inserted per statement batch
+SQLITE_MAGIC: bytes = b"SQLite format 3\0"
+
+
+def sort_key(record: Record) -> Tuple[int, bool, float, str]:
+    """
+    Orders records best first; ties by play time (unknown last), then name.
+
+    Args:
+        record (Record): The record.
+
+    Returns:
+        Tuple[int, bool, float, str]: The key.
+    """
+    score, played_at, name, _ = record
+    return -score, played_at is None, played_at or 0.0, name
+
+
+def player(name: str) -> str:
+    """
+    Returns the key a player's entries are matched on.
+
+    Args:
+        name (str): The name as entered.
+
+    Returns:
+        str: The name without surrounding spaces, case-folded.
+    """
+    return name.strip().casefold()
+
+
+def is_store(path: str) -> bool:
+    """
+    Returns whether a file is a SQLite leaderboard store rather than a CSV file.
+
+    Args:
+        path (str): The file.
+
+    Returns:
+        bool: True for a SQLite database.
+    """
+    with open(path, "rb") as file:
+        return file.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+
+
+def read_store(path: str) -> Iterator[Record]:
+    """
+    Streams a leaderboard.db best first.
+
+    Args:
+        path (str): The database file.
+
+    Yields:
+        Record: Each stored score.
+    """
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cursor = connection.execute(
+            "SELECT score, played_at, name FROM scores ORDER BY score DESC, played_at IS NULL, played_at, name")
+        for score, played_at, name in cursor:
+            yield int(score), played_at, name, path
+    finally:
+        connection.close()
+
+
+def read_csv_rows(path: str) -> Iterator[Record]:
+    """
+    Streams the name,score rows of a high_score.csv file in file order, skipping malformed rows.
+
+    Args:
+        path (str): The CSV file.
+
+    Yields:
+        Record: Each row, with no play time.
+    """
+    with open(path, "r", newline="") as file:
+        for row in csv.reader(file):
+            try:
+                yield int(row[1]), None, row[0], path
+            except (IndexError, ValueError):
+                continue
+
+
+def read_run(path: str) -> Iterator[Record]:
+    """
+    Streams a sorted run written by sorted_runs.
+
+    Args:
+        path (str): The run file.
+
+    Yields:
+        Record: Each record.
+    """
+    with open(path, "r", newline="") as file:
+        for score, played_at, name, source in csv.reader(file):
+            yield int(score), float(played_at) if played_at else None, name, source
+
+
+def sorted_runs(records: Iterable[Record], workdir: str, run_rows: int = RUN_ROWS) -> List[Iterator[Record]]:
+    """
+    Splits records into sorted runs, spilling every run but a lone one to a file.
+
+    Args:
+        records (Iterable[Record]): The records, in any order.
+        workdir (str): The directory for run files.
+        run_rows (int): The most records held in memory at once.
+
+    Returns:
+        List[Iterator[Record]]: One best-first stream per run.
+    """
+    runs: List[Iterator[Record]] = []
+    records = iter(records)
+    chunk: List[Record] = sorted(islice(records, run_rows), key=sort_key)
+    while chunk:
+        following: List[Record] = sorted(islice(records, run_rows), key=sort_key)
+        if not runs and not following:
+            return [iter(chunk)]  # Fits in one run: no file needed
+        handle, path = tempfile.mkstemp(suffix=".csv", dir=workdir)
+        with os.fdopen(handle, "w", newline="") as file:
+            csv.writer(file).writerows((score, "" if played_at is None else repr(played_at), name, source)
+                                       for score, played_at, name, source in chunk)
+        runs.append(read_run(path))
+        chunk = following
+    return runs
+
+
+def merged(paths: Iterable[str], workdir: str, run_rows: int = RUN_ROWS) -> Iterator[Record]:
+    """
+    K-way merges every source into one best-first stream.
+
+    Args:
+        paths (Iterable[str]): CSV files and leaderboard stores.
+        workdir (str): The directory for CSV run files.
+        run_rows (int): The most CSV records sorted in memory at once.
+
+    Returns:
+        Iterator[Record]: All records, best first.
+    """
+    streams: List[Iterator[Record]] = []
+    for path in paths:
+        if is_store(path):
+            streams.append(read_store(path))
+        else:
+            streams.extend(sorted_runs(read_csv_rows(path), workdir, run_rows))
+    return heapq.merge(*streams, key=sort_key)
+
+
+def ranked(records: Iterable[Record]) -> Iterator[Ranked]:
+    """
+    Drops duplicate entries and numbers the rest with shared ranks for ties.
+
+    Only the current group of equal scores is remembered, so memory is bounded
+    by the largest tie.
+
+    Args:
+        records (Iterable[Record]): Records, best first.
+
+    Yields:
+        Ranked: Each distinct entry and its rank.
+    """
+    position: int = 0
+    rank: int = 0
+    tie_score: Optional[int] = None
+    seen: Set[Tuple[str, Optional[float]]] = set()
+    for record in records:
+        score, played_at, name, _ = record
+        if score != tie_score:
+            tie_score, rank = score, position + 1
+            seen.clear()
+        entry: Tuple[str, Optional[float]] = (player(name), played_at)
+        if entry in seen:
+            continue
+        seen.add(entry)
+        position += 1
+        yield rank, record
+
+
+def open_bests(workdir: str) -> sqlite3.Connection:
+    """
+    Creates the temporary on-disk table that collects each player's best entry.
+
+    Args:
+        workdir (str): The directory for the table's database file.
+
+    Returns:
+        sqlite3.Connection: The open database.
+    """
+    handle, path = tempfile.mkstemp(suffix=".db", dir=workdir)
+    os.close(handle)
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE bests (player TEXT PRIMARY KEY, score INTEGER, played_at REAL, name TEXT, source TEXT)")
+    return connection
+
+
+def record_bests(ranking: Iterable[Ranked], connection: sqlite3.Connection) -> Iterator[Ranked]:
+    """
+    Passes a ranking through unchanged while storing each player's first entry in the bests table.
+
+    Since the ranking is best first, a player's first entry is their best.
+    Entries are inserted in batches of BATCH_ROWS; the last batch is written
+    once the ranking is exhausted.
+
+    Args:
+        ranking (Iterable[Ranked]): The global ranking.
+        connection (sqlite3.Connection): The database from open_bests.
+
+    Yields:
+        Ranked: Every entry of the ranking.
+    """
+    batch: List[Tuple[str, int, Optional[float], str, str]] = []
+    for entry in ranking:
+        score, played_at, name, source = entry[1]
+        batch.append((player(name), score, played_at, name, source))
+        if len(batch) >= BATCH_ROWS:
+            with connection:
+                connection.executemany("INSERT OR IGNORE INTO bests VALUES (?, ?, ?, ?, ?)", batch)
+            batch = []
+        yield entry
+    with connection:
+        connection.executemany("INSERT OR IGNORE INTO bests VALUES (?, ?, ?, ?, ?)", batch)
+
+
+def read_bests(connection: sqlite3.Connection) -> Iterator[Ranked]:
+    """
+    Streams the collected player bests, ranked among players.
+
+    Args:
+        connection (sqlite3.Connection): The database filled by record_bests.
+
+    Yields:
+        Ranked: Each player's best record and its rank among players, best first.
+    """
+    position: int = 0
+    rank: int = 0
+    tie_score: Optional[int] = None
+    for score, played_at, name, source in connection.execute("SELECT score, played_at, name, source FROM bests ORDER BY rowid"):
+        position += 1
+        if score != tie_score:
+            tie_score, rank = score, position
+        yield rank, (score, played_at, name, source)
+
+
+def format_time(played_at: Optional[float]) -> str:
+    """
+    Formats a play time for output.
+
+    Args:
+        played_at (Optional[float]): Unix seconds, or None.
+
+    Returns:
+        str: The local date and time, or "" if unknown.
+    """
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(played_at)) if played_at is not None else ""
+
+
+def write_ranking(ranking: Iterable[Ranked], path: Optional[str], top: int) -> List[Ranked]:
+    """
+    Consumes a whole ranking, writing it to a CSV file if asked and keeping its first rows.
+
+    Args:
+        ranking (Iterable[Ranked]): The ranking.
+        path (Optional[str]): The CSV file, or None to write nothing.
+        top (int): How many rows to keep.
+
+    Returns:
+        List[Ranked]: The first `top` rows.
+    """
+    kept: List[Ranked] = []
+    with contextlib.ExitStack() as stack:
+        writer = csv.writer(stack.enter_context(open(path, "w", newline=""))) if path is not None else None
+        if writer is not None:
+            writer.writerow(["rank", "name", "score", "played_at", "source"])
+        for rank, record in ranking:
+            score, played_at, name, source = record
+            if writer is not None:
+                writer.writerow([rank, name, score, format_time(played_at), source])
+            if len(kept) < top:
+                kept.append((rank, record))
+    return kept
+
+
+def print_table(title: str, rows: List[Ranked]) -> None:
+    """
+    Prints ranked rows.
+
+    Args:
+        title (str): The table heading.
+        rows (List[Ranked]): The rows.
+    """
+    print(title)
+    for rank, (score, played_at, name, source) in rows:
+        print(f"{rank:>6}. {name:<20} {score:>10} {format_time(played_at):>17}  {source}")
+
+
+def main() -> None:
+    """
+    Parses the command line, merges the sources and prints or saves the results.
+    """
+    parser = argparse.ArgumentParser(description="Merge leaderboards from several machines into a global ranking.")
+    parser.add_argument("sources", nargs="+", help="high_score.csv files and leaderboard.db stores")
+    parser.add_argument("--top", type=int, default=10, help="rows to print for each table")
+    parser.add_argument("--ranking", metavar="PATH", help="write the full global ranking as CSV")
+    parser.add_argument("--bests", metavar="PATH", help="write every player's best as CSV")
+    parser.add_argument("--run-rows", type=int, default=RUN_ROWS, help="CSV rows sorted in memory at a time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="leaderboard-merge-") as workdir:
+        connection: sqlite3.Connection = open_bests(workdir)
+        try:
+            ranking = record_bests(ranked(merged(args.sources, workdir, args.run_rows)), connection)
+            print_table(f"Top {args.top}", write_ranking(ranking, args.ranking, args.top))
+            print()
+            print_table(f"Top {args.top} players", write_ranking(read_bests(connection), args.bests, args.top))
+        finally:
+            connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import math
+import pygame as pg
+from typing import Dict, List, Tuple
+from utils.asset_manager import AssetManager
+
+class RotationCache:
+    """
+    A sprite sheet of pre-rotated frames shared by every sprite using the same image.
+
+    Frames are rendered once at a fixed angle step into one sheet with equal-sized
+    cells, so drawing a rotated sprite is a frame lookup plus a blit instead of a
+    pg.transform.rotate call (and a new surface) per sprite per step.
+
+    Attributes:
+        angle_step (float): The rotation between neighbouring frames in degrees.
+        frame_size (int): The edge length of every frame cell.
+        half_size (int): Half of frame_size, the offset from a sprite centre to the frame corner.
+        sheet (pg.Surface): The surface holding all frames side by side.
+        frames (List[pg.Surface]): Subsurfaces of the sheet, frame i rotated by i * angle_step.
+    """
+
+    _caches: Dict[Tuple[str, int, float], "RotationCache"] = {}  # Shared by all instances
+
+    def __init__(self, image: pg.Surface, angle_step: float) -> None:
+        """
+        Initializes a RotationCache by rendering every frame of the given image.
+
+        Args:
+            image (pg.Surface): The unrotated image.
+            angle_step (float): The rotation between neighbouring frames in degrees.
+        """
+        self.angle_step: float = max(0.5, float(angle_step))
+        frame_count: int = math.ceil(360 / self.angle_step)
+        width, height = image.get_size()
+        self.frame_size: int = math.ceil(math.hypot(width, height))
+        self.half_size: int = self.frame_size // 2
+        self.sheet: pg.Surface = pg.Surface((self.frame_size * frame_count, self.frame_size), pg.SRCALPHA)
+        self.frames: List[pg.Surface] = []
+        for index in range(frame_count):
+            rotated: pg.Surface = pg.transform.rotate(image, -index * self.angle_step)
+            cell = pg.Rect(index * self.frame_size, 0, self.frame_size, self.frame_size)
+            self.sheet.blit(rotated, rotated.get_rect(center=cell.center))
+            self.frames.append(self.sheet.subsurface(cell))
+
+    @classmethod
+    def get(cls, image_path: str, radius: int, angle_step: float) -> "RotationCache":
+        """
+        Returns the shared cache for an image at a given radius, building it on first use.
+
+        Args:
+            image_path (str): The path of the image.
+            radius (int): The sprite radius; the image is scaled to radius * 2 square.
+            angle_step (float): The rotation between neighbouring frames in degrees.
+
+        Returns:
+            RotationCache: The shared cache.
+        """
+        key: Tuple[str, int, float] = (image_path, radius, float(angle_step))
+        if key not in cls._caches:
+            image: pg.Surface = AssetManager().image(image_path, (radius * 2, radius * 2))
+            cls._caches[key] = cls(image, angle_step)
+        return cls._caches[key]
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drops every shared cache, e.g. after the ball image setting changed.
+        """
+        cls._caches.clear()
+
+    def frame_index(self, angle: float) -> int:
+        """
+        Returns the index of the frame closest to an angle.
+
+        Args:
+            angle (float): The clockwise rotation in degrees.
+
+        Returns:
+            int: The index into frames.
+        """
+        return int(round(angle / self.angle_step)) % len(self.frames)
+
+    def frame(self, angle: float) -> pg.Surface:
+        """
+        Returns the pre-rotated frame closest to an angle.
+
+        Args:
+            angle (float): The clockwise rotation in degrees.
+
+        Returns:
+            pg.Surface: The frame. Shared; do not draw onto it.
+        """
+        return self.frames[self.frame_index(angle)]
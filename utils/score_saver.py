@@ -1,42 +1,38 @@
-import csv
-import os
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from settings import Settings
+from utils.leaderboard import Leaderboard
 
 class ScoreSaver:
-    def __init__(self) -> None:
+    """
+    The game-over screen's view of the leaderboard: its best LEADERBOARD_SIZE scores.
+
+    Scores are stored in the shared Leaderboard, which keeps every score;
+    high_score.csv is only read once, to seed an empty leaderboard.
+    """
+
+    def __init__(self, difficulty: Optional[float] = None) -> None:
         """
         Initializes the ScoreSaver object.
 
-        If the high score file does not exist, it creates an empty file.
-        Loads the high scores from the file.
+        Args:
+        - difficulty (float): The difficulty the game started at, stored with added scores.
         """
-        self.filename: str = "high_score.csv"
-        if not os.path.isfile(self.filename):
-            self.file = open(self.filename, 'w')
-            self.file.close()
-        self.scores: List[Tuple[str, int]] = self.load_scores()
-        self.scores: List[Tuple[str, int]] = self.sort_scores()
+        self.size: int = Settings().get("LEADERBOARD_SIZE")
+        self.difficulty: Optional[float] = difficulty
+        self.leaderboard: Leaderboard = Leaderboard.shared()
+        self.display: List[str] = []
+        self.display_version: int = -1
 
-    def load_scores(self) -> List[Tuple[str, int]]: 
+    @property
+    def scores(self) -> List[Tuple[str, int]]:
         """
-        Loads the high scores from the file.
+        The high scores, best first.
 
         Returns:
-        - scores (list): A list of tuples representing the high scores, where each tuple contains the name and score.
+        - scores (list): A list of tuples containing the name and score.
         """
-        scores: List[Tuple[str, int]] = []
-        with open(self.filename, 'r') as file:
-            reader = csv.reader(file)
-            for row in reader:
-                if row:
-                    try:
-                        name: str = row[0]
-                        score: int = int(row[1])
-                        scores.append((name, score))
-                    except ValueError:
-                        continue                
-        return scores
-    
+        return [(name, score) for name, score, _, _ in self.leaderboard.top(self.size)]
+
     def check_high_score(self, score: int) -> bool:
         """
         Checks if a given score is a high score.
@@ -47,54 +43,28 @@ class ScoreSaver:
         Returns:
         - True if the score is a high score, False otherwise.
         """
-        self.sort_scores()
-        if len(self.scores) < 10:
-            return True
-        return score > int(self.scores[-1][1])
-        
-    def sort_scores(self) -> List[Tuple[str, int]]:
-        """
-        Sorts the high scores in descending order.
-
-        Returns:
-        - sorted_scores (list): A list of tuples representing the sorted high scores.
-        """
-        self.scores = sorted(self.scores, key=lambda x: x[1], reverse=True)
-        return self.scores
+        return self.leaderboard.rank(score) <= self.size
 
     def add_score(self, name: str, score: int) -> None:
         """
-        Adds a new score to the high scores.
-
-        If the number of scores exceeds 10, removes the lowest score.
+        Adds a new score to the leaderboard. Scores below the top ones are kept too.
 
         Args:
         - name (str): The name associated with the score.
         - score (int): The score to be added.
         """
-        self.scores.append((name, score))
-        self.sort_scores()
-        # Keep only top 10 scores
-        self.scores = self.scores[:10]
-        self.save_scores()
-
-    def save_scores(self) -> None:
-        """
-        Saves the high scores to the file.
-        """
-        with open(self.filename, 'w', newline='') as file:
-            writer = csv.writer(file)
-            for score in self.scores:
-                writer.writerow(score)
+        self.leaderboard.add(name, score, self.difficulty)
 
     def score_display(self) -> List[str]:
         """
         Generates a formatted display of the high scores.
 
+        The lines are cached until the next score is added.
+
         Returns:
         - display (list): A list of strings representing the formatted high scores.
         """
-        display: List[str] = []
-        for i, score in enumerate(self.sort_scores()):
-            display.append(f"{i + 1}. {score[0]}: {score[1]}")
-        return display
\ No newline at end of file
+        if self.display_version != self.leaderboard.version:
+            self.display = [f"{i + 1}. {name}: {score}" for i, (name, score) in enumerate(self.scores)]
+            self.display_version = self.leaderboard.version
+        return self.display
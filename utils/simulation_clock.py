@@ -0,0 +1,61 @@
+class SimulationClock:
+    """
+    A fixed-timestep clock that decouples the physics rate from the render rate.
+
+    Elapsed frame time is added to an accumulator and consumed in fixed-size
+    simulation steps. Whatever is left over is exposed as an interpolation
+    factor so renderers can draw objects between their last two positions.
+
+    Attributes:
+        step_rate (int): The number of simulation steps per second.
+        step_ms (float): The duration of a single simulation step in milliseconds.
+        max_substeps (int): The maximum number of steps run for one rendered frame.
+        accumulator (float): Unsimulated time carried over between frames, in milliseconds.
+        alpha (float): How far the render time lies between the last two steps (0.0 - 1.0).
+        total_steps (int): The number of steps simulated since the clock was created.
+    """
+
+    def __init__(self, step_rate: int, max_substeps: int) -> None:
+        """
+        Initializes a SimulationClock object.
+
+        Args:
+            step_rate (int): The number of simulation steps per second.
+            max_substeps (int): The maximum number of steps run for one rendered frame.
+        """
+        self.step_rate: int = max(1, int(step_rate))
+        self.step_ms: float = 1000.0 / self.step_rate
+        self.max_substeps: int = max(1, int(max_substeps))
+        self.accumulator: float = 0.0
+        self.alpha: float = 0.0
+        self.total_steps: int = 0
+
+    def advance(self, elapsed_ms: float) -> int:
+        """
+        Adds the elapsed frame time and returns how many steps should be simulated.
+
+        If a frame took longer than max_substeps steps, the excess time is dropped
+        so a hitch slows the game down briefly instead of snowballing.
+
+        Args:
+            elapsed_ms (float): The time since the previous frame in milliseconds.
+
+        Returns:
+            int: The number of fixed steps to simulate this frame.
+        """
+        self.accumulator += max(0.0, elapsed_ms)
+        steps: int = int(self.accumulator // self.step_ms)
+        if steps > self.max_substeps:
+            steps = self.max_substeps
+            self.accumulator = self.step_ms * steps
+        self.accumulator -= steps * self.step_ms
+        self.alpha = self.accumulator / self.step_ms
+        self.total_steps += steps
+        return steps
+
+    def reset(self) -> None:
+        """
+        Discards any accumulated time, e.g. after a blocking pause.
+        """
+        self.accumulator = 0.0
+        self.alpha = 0.0
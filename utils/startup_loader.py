@@ -0,0 +1,119 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from settings import Settings
+from utils.asset_manager import AssetManager
+from utils.rotation_cache import RotationCache
+from utils.typography import Typography
+
+ImageVariant = Tuple[Optional[Tuple[int, int]], bool]  # Size (None for the original) and alpha
+
+class StartupLoader:
+    """
+    Warms the shared caches on a thread pool while the logo splash plays.
+
+    Every image the main menu and the first level ask for is decoded, scaled
+    and converted through AssetManager, the fonts they use are created through
+    Typography and the ball's rotation sheet is rendered through RotationCache,
+    so building the Game afterwards only hits caches. Each job covers one image
+    file with all its variants, so no file is decoded twice.
+
+    A job that fails is ignored: the game then loads that asset itself and
+    raises the error as it always did.
+
+    Attributes:
+        workers (int): The number of worker threads.
+        futures (List[Future]): One per job, once started.
+    """
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        """
+        Initializes a StartupLoader.
+
+        Args:
+            workers (Optional[int]): The number of worker threads, or None for up to 4 (one per core).
+        """
+        self.settings: Settings = Settings()
+        self.workers: int = workers or min(4, os.cpu_count() or 1)
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.futures: List[Future] = []
+
+    def image_variants(self) -> Dict[str, List[ImageVariant]]:
+        """
+        Lists the images used by the main menu and the first level.
+
+        Returns:
+            Dict[str, List[ImageVariant]]: The variants to load for each image path.
+        """
+        get = self.settings.get
+        screen_size: Tuple[int, int] = (get("SCREEN_WIDTH"), get("SCREEN_HEIGHT"))
+        ball_size: Tuple[int, int] = (get("BALL_RADIUS") * 2, get("BALL_RADIUS") * 2)
+        variants: Dict[str, List[ImageVariant]] = {}
+        wanted: List[Tuple[str, Optional[Tuple[int, int]], bool]] = [
+            (get("BACKGROUND_IMG"), screen_size, False),  # Main menu and gameplay background
+            (get("PLAY_BUTTON_IMG"), (200, 100), True),
+            (get("SETTINGS_BUTTON_IMG"), (200, 100), True),
+            (get("HIGH_SCORES_BUTTON_IMG"), (200, 100), True),
+            (get("SOUND_ENABLED_IMAGE"), (50, 50), True),
+            (get("SOUND_DISABLED_IMAGE"), (50, 50), True),
+            (get("PADDLE_IMG"), None, True),
+            (get("PADDLE_IMG"), tuple(get("PADDLE_SIZE")), True),
+            (get("BRICK_IMG"), tuple(get("BRICK_SIZE")), True),
+            (get("BALL_IMG"), ball_size, True),
+            (get("BALL_IMG"), (20, 20), True),  # Player lives
+        ]
+        for path, size, alpha in wanted:
+            variants.setdefault(path, []).append((size, alpha))
+        return variants
+
+    def jobs(self) -> List[Callable[[], None]]:
+        """
+        Builds the work to run on the pool.
+
+        Returns:
+            List[Callable[[], None]]: One job per image file, one for the fonts.
+        """
+        assets: AssetManager = AssetManager()
+        ball_image: str = self.settings.get("BALL_IMG")
+
+        def load_image(path: str, variants: List[ImageVariant]) -> Callable[[], None]:
+            def job() -> None:
+                for size, alpha in variants:
+                    assets.image(path, size, alpha)
+                if path == ball_image:
+                    RotationCache.get(path, self.settings.get("BALL_RADIUS"), self.settings.get("ROTATION_STEP"))
+            return job
+
+        def load_fonts() -> None:
+            typography: Typography = Typography()
+            for name, size in [("Arial", 50), (None, 30), (None, 20), (None, 32), (None, 18)]:
+                typography.font(name, size)
+
+        return [load_fonts] + [load_image(path, variants) for path, variants in self.image_variants().items()]
+
+    def start(self) -> None:
+        """
+        Submits every job to a new thread pool.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="startup")
+        self.futures = [self.executor.submit(job) for job in self.jobs()]
+        self.executor.shutdown(wait=False)  # Workers exit once the queue is drained
+
+    @property
+    def progress(self) -> float:
+        """The fraction of jobs finished, from 0.0 to 1.0."""
+        if not self.futures:
+            return 0.0
+        return sum(1 for future in self.futures if future.done()) / len(self.futures)
+
+    @property
+    def finished(self) -> bool:
+        """Whether every job has finished, successfully or not."""
+        return bool(self.futures) and all(future.done() for future in self.futures)
+
+    def wait(self) -> None:
+        """
+        Blocks until every job has finished.
+        """
+        for future in self.futures:
+            future.exception()  # Waits without raising
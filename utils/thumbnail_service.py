@@ -0,0 +1,200 @@
+import hashlib
+import itertools
+import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+import pygame as pg
+from settings import Settings
+
+ThumbnailKey = Tuple[str, Tuple[int, int]]
+
+class ThumbnailService:
+    """
+    Decodes preview-size thumbnails on a worker thread.
+
+    A thumbnail is the source image scaled to fit a bounding box. The first time
+    an image is previewed it is decoded at full size, scaled and written to the
+    disk cache; later runs load the small cached file instead. Finished
+    thumbnails are kept in a bounded in-memory LRU.
+
+    request() never blocks: it returns None and queues the thumbnail if it is not
+    ready yet, and callers keep drawing a placeholder until it is. Requested
+    thumbnails are decoded before prefetched ones.
+
+    Attributes:
+        cache_dir (str): The directory holding cached thumbnail files.
+        capacity (int): The number of thumbnails kept in memory.
+        thumbnails (OrderedDict): Ready thumbnails, least recently used first.
+        failed (Set[ThumbnailKey]): Thumbnails whose source could not be read; they are not retried.
+        jobs (queue.PriorityQueue): Pending (priority, sequence, key) decode jobs.
+    """
+
+    REQUEST_PRIORITY: int = 0
+    PREFETCH_PRIORITY: int = 1
+
+    _shared: Optional["ThumbnailService"] = None
+
+    def __init__(self, cache_dir: str, capacity: int) -> None:
+        """
+        Initializes a ThumbnailService and starts its worker thread.
+
+        Args:
+            cache_dir (str): The directory holding cached thumbnail files.
+            capacity (int): The number of thumbnails kept in memory.
+        """
+        self.cache_dir: str = cache_dir
+        self.capacity: int = max(1, capacity)
+        self.thumbnails: "OrderedDict[ThumbnailKey, pg.Surface]" = OrderedDict()
+        self.finished: Dict[ThumbnailKey, Optional[pg.Surface]] = {}
+        self.pending: Dict[ThumbnailKey, int] = {}
+        self.failed: Set[ThumbnailKey] = set()
+        self.lock: threading.Lock = threading.Lock()
+        self.jobs: queue.PriorityQueue = queue.PriorityQueue()
+        self.sequence = itertools.count()
+        self.worker: threading.Thread = threading.Thread(target=self.run, name="thumbnails", daemon=True)
+        self.worker.start()
+
+    @classmethod
+    def shared(cls) -> "ThumbnailService":
+        """
+        Returns the service shared by every preview window, creating it on first use.
+
+        Returns:
+            ThumbnailService: The shared service.
+        """
+        if cls._shared is None:
+            settings = Settings()
+            cls._shared = cls(settings.get("THUMBNAIL_CACHE_DIR"), settings.get("THUMBNAIL_CACHE_SIZE"))
+        return cls._shared
+
+    def request(self, path: str, max_size: Tuple[int, int]) -> Optional[pg.Surface]:
+        """
+        Returns a thumbnail if it is ready, otherwise queues it.
+
+        Args:
+            path (str): The source image path.
+            max_size (Tuple[int, int]): The bounding box the thumbnail must fit in.
+
+        Returns:
+            Optional[pg.Surface]: The thumbnail, or None while it is being decoded.
+        """
+        key: ThumbnailKey = (path, (int(max_size[0]), int(max_size[1])))
+        self.collect()
+        thumbnail: Optional[pg.Surface] = self.thumbnails.get(key)
+        if thumbnail is not None:
+            self.thumbnails.move_to_end(key)
+            return thumbnail
+        self.enqueue(key, self.REQUEST_PRIORITY)
+        return None
+
+    def prefetch(self, paths: Iterable[str], max_size: Tuple[int, int]) -> None:
+        """
+        Queues thumbnails that are likely to be requested next.
+
+        Args:
+            paths (Iterable[str]): The source image paths.
+            max_size (Tuple[int, int]): The bounding box the thumbnails must fit in.
+        """
+        size: Tuple[int, int] = (int(max_size[0]), int(max_size[1]))
+        for path in paths:
+            key: ThumbnailKey = (path, size)
+            if key not in self.thumbnails:
+                self.enqueue(key, self.PREFETCH_PRIORITY)
+
+    def enqueue(self, key: ThumbnailKey, priority: int) -> None:
+        """
+        Queues a decode job unless the thumbnail is finished or already queued at the same priority.
+
+        Args:
+            key (ThumbnailKey): The (path, max_size) key.
+            priority (int): REQUEST_PRIORITY or PREFETCH_PRIORITY.
+        """
+        with self.lock:
+            if key in self.finished or key in self.failed:
+                return
+            if self.pending.get(key, priority + 1) <= priority:
+                return
+            self.pending[key] = priority
+        self.jobs.put((priority, next(self.sequence), key))
+
+    def collect(self) -> None:
+        """
+        Moves finished thumbnails into the LRU, converting them for the display.
+        """
+        with self.lock:
+            if not self.finished:
+                return
+            finished, self.finished = self.finished, {}
+        for key, thumbnail in finished.items():
+            if thumbnail is None:
+                self.failed.add(key)
+                continue
+            if pg.display.get_surface() is not None:
+                thumbnail = thumbnail.convert_alpha()
+            self.thumbnails[key] = thumbnail
+            self.thumbnails.move_to_end(key)
+        while len(self.thumbnails) > self.capacity:
+            self.thumbnails.popitem(last=False)
+
+    def run(self) -> None:
+        """
+        Worker loop: decodes queued thumbnails one at a time.
+        """
+        while True:
+            _, _, key = self.jobs.get()
+            try:
+                with self.lock:
+                    queued: bool = self.pending.pop(key, None) is not None
+                if queued:
+                    thumbnail: Optional[pg.Surface] = self.build(*key)
+                    with self.lock:
+                        self.finished[key] = thumbnail
+            finally:
+                self.jobs.task_done()
+
+    def cache_path(self, path: str, max_size: Tuple[int, int]) -> str:
+        """
+        Returns the disk cache file for a thumbnail. The name changes when the source file does.
+
+        Args:
+            path (str): The source image path.
+            max_size (Tuple[int, int]): The bounding box the thumbnail fits in.
+
+        Returns:
+            str: The cached thumbnail path.
+        """
+        stat = os.stat(path)
+        source: str = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime}|{max_size[0]}x{max_size[1]}"
+        return os.path.join(self.cache_dir, hashlib.blake2b(source.encode(), digest_size=16).hexdigest() + ".png")
+
+    def build(self, path: str, max_size: Tuple[int, int]) -> Optional[pg.Surface]:
+        """
+        Loads a thumbnail from the disk cache, or decodes, scales and caches it.
+
+        Args:
+            path (str): The source image path.
+            max_size (Tuple[int, int]): The bounding box the thumbnail must fit in.
+
+        Returns:
+            Optional[pg.Surface]: The thumbnail, or None if the source could not be read.
+        """
+        try:
+            cached: str = self.cache_path(path, max_size)
+            if os.path.exists(cached):
+                return pg.image.load(cached)
+            image: pg.Surface = pg.image.load(path)
+        except (OSError, pg.error):
+            return None
+        width, height = image.get_size()
+        scale_factor: float = min(max_size[0] / width, max_size[1] / height)
+        thumbnail: pg.Surface = pg.transform.scale(image, (max(1, int(width * scale_factor)), max(1, int(height * scale_factor))))
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path: str = cached + ".tmp.png"
+            pg.image.save(thumbnail, temp_path)
+            os.replace(temp_path, cached)
+        except (OSError, pg.error):
+            pass
+        return thumbnail
@@ -0,0 +1,120 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+import pygame as pg
+from settings import Settings
+from utils.digit_atlas import DigitAtlas
+
+FontKey = Tuple[Optional[str], int]
+TextKey = Tuple[Optional[str], int, str, Tuple[int, ...], Optional[Tuple[int, ...]]]
+
+class Typography:
+    """
+    Shared fonts and rendered text.
+
+    Fonts are created once per (name, size): a name looks the font up with
+    pg.font.SysFont, None uses pygame's default font. Rendered text surfaces are
+    memoized in an LRU of TEXT_CACHE_SIZE entries, so static labels are rendered
+    once. Numbers that change often (the score) are drawn from a DigitAtlas.
+
+    Surfaces returned by render() are shared: callers must not draw onto them.
+
+    Attributes:
+        fonts (Dict[FontKey, pg.font.Font]): The font registry.
+        texts (OrderedDict): Rendered text surfaces, least recently used first.
+        atlases (Dict[tuple, DigitAtlas]): Digit atlases per font and color.
+        capacity (int): The number of text surfaces kept.
+        lock (threading.Lock): Guards font creation, which may run on startup worker threads.
+    """
+
+    _instance = None # Singleton instance of the Typography class
+
+    def __new__(cls) -> "Typography":
+        """
+        Create or return the shared Typography instance.
+
+        Returns:
+            Typography: The Typography instance.
+        """
+        if cls._instance is None:
+            cls._instance = super(Typography, cls).__new__(cls)
+            cls._instance.fonts = {}
+            cls._instance.texts = OrderedDict()
+            cls._instance.atlases = {}
+            cls._instance.capacity = Settings().get("TEXT_CACHE_SIZE")
+            cls._instance.lock = threading.Lock()
+        return cls._instance
+
+    def font(self, name: Optional[str], size: int) -> pg.font.Font:
+        """
+        Get a font, creating it on first use.
+
+        Args:
+            name (Optional[str]): A system font name, or None for pygame's default font.
+            size (int): The font size.
+
+        Returns:
+            pg.font.Font: The shared font.
+        """
+        key: FontKey = (name, size)
+        font: Optional[pg.font.Font] = self.fonts.get(key)
+        if font is None:
+            with self.lock:
+                font = self.fonts.get(key)
+                if font is None:
+                    font = pg.font.SysFont(name, size) if name is not None else pg.font.Font(None, size)
+                    self.fonts[key] = font
+        return font
+
+    def render(self, text: str, size: int, color: Sequence[int], name: Optional[str] = None,
+               background: Optional[Sequence[int]] = None) -> pg.Surface:
+        """
+        Get antialiased text, rendering it only if it is not cached.
+
+        Args:
+            text (str): The text to render.
+            size (int): The font size.
+            color (Sequence[int]): The text color.
+            name (Optional[str]): A system font name, or None for pygame's default font.
+            background (Optional[Sequence[int]]): The background color, or None for transparent.
+
+        Returns:
+            pg.Surface: The shared text surface.
+        """
+        key: TextKey = (name, size, text, tuple(color), tuple(background) if background is not None else None)
+        surface: Optional[pg.Surface] = self.texts.get(key)
+        if surface is not None:
+            self.texts.move_to_end(key)
+            return surface
+        surface = self.font(name, size).render(text, True, key[3], key[4])
+        self.texts[key] = surface
+        if len(self.texts) > self.capacity:
+            self.texts.popitem(last=False)
+        return surface
+
+    def digits(self, size: int, color: Sequence[int], name: Optional[str] = None) -> DigitAtlas:
+        """
+        Get the digit atlas for a font and color, rendering it on first use.
+
+        Args:
+            size (int): The font size.
+            color (Sequence[int]): The digit color.
+            name (Optional[str]): A system font name, or None for pygame's default font.
+
+        Returns:
+            DigitAtlas: The shared atlas.
+        """
+        key = (name, size, tuple(color))
+        atlas: Optional[DigitAtlas] = self.atlases.get(key)
+        if atlas is None:
+            atlas = DigitAtlas(self.font(name, size), key[2])
+            self.atlases[key] = atlas
+        return atlas
+
+    def clear(self) -> None:
+        """
+        Drop every cached font, text surface and atlas.
+        """
+        self.fonts.clear()
+        self.texts.clear()
+        self.atlases.clear()